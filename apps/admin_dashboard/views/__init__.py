@@ -1,11 +1,14 @@
 from .dashboard import DashboardView
-from .search import ClientSearchView, LocationSearchView, ClinicianSearchView
+from .search import ClientSearchView, ClientDirectoryView, LocationSearchView, ClinicianSearchView, OpenSlotSearchView
 from .notes import GetEventDetailsDataView, SaveEventNoteView, GetNoteTemplateDataView, GetEventNotesDataView, SavePsychotherapyNoteView
 from .appointment import (
     GetClientCliniciansView,
     GetClinicianServicesView,
     GetEventDataView,
+    GetEventsDataView,
     GetAppointmentStatesView,
+    BootstrapView,
+    GetJobStatusView,
     GetClinicianLocationsView,
     GetEventsView
 )
@@ -13,13 +16,18 @@ from .appointment import (
 __all__ = [
     'DashboardView',
     'ClientSearchView',
+    'ClientDirectoryView',
     'LocationSearchView',
     'ClinicianSearchView',
+    'OpenSlotSearchView',
     'NoteFormView',
     'GetClientCliniciansView',
     'GetClinicianServicesView',
     'GetEventDataView',
+    'GetEventsDataView',
     'GetAppointmentStatesView',
+    'BootstrapView',
+    'GetJobStatusView',
     'GetEventDetailsDataView',
     'SaveEventNoteView',
     'GetNoteTemplateDataView',
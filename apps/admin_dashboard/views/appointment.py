@@ -1,7 +1,12 @@
+import hashlib
 from django.views import View
-from django.http import JsonResponse
+from django.contrib.auth.mixins import LoginRequiredMixin
+from django.core.serializers.json import DjangoJSONEncoder
+from django.http import HttpResponse, JsonResponse, StreamingHttpResponse
+from django.utils.cache import get_conditional_response
 from apps.shared.services.scheduler_service import SchedulerDataService
-from django.core.exceptions import ObjectDoesNotExist
+from apps.shared.services.job_service import JobService
+from django.core.exceptions import ObjectDoesNotExist, ValidationError
 import json
 
 class GetClientCliniciansView(View):
@@ -74,11 +79,47 @@ class GetEventDataView(View):
         
         return JsonResponse(event_data, safe=False)
             
+class GetEventsDataView(View):
+    def post(self, request):
+        data = json.loads(request.body)
+        events_data = SchedulerDataService.get_events_data(data.get('event_ids', []))
+
+        user_type = request.user.user_type if request.user.is_authenticated else ''
+        for event_data in events_data.values():
+            event_data['userType'] = user_type
+
+        return JsonResponse(events_data)
+            
 class GetAppointmentStatesView(View):
     def get(self, request):
         appointment_states = SchedulerDataService.get_appointment_states()
         return JsonResponse(appointment_states, safe=False)
     
+class BootstrapView(LoginRequiredMixin, View):
+    raise_exception = True
+
+    def get(self, request):
+        """
+        Reference data of the scheduler in one payload
+
+        The ETag is a hash of the content, so browsers revalidate and get a 304 until the data changes.
+        """
+        if request.user.user_type not in ('ADMIN', 'CLINICIAN'):
+            return JsonResponse({'error': 'Not allowed'}, status=403)
+        content = json.dumps(SchedulerDataService.get_bootstrap_data(request.user), cls=DjangoJSONEncoder).encode()
+        etag = f'"{hashlib.sha256(content).hexdigest()[:32]}"'
+        response = HttpResponse(content, content_type='application/json')
+        response['ETag'] = etag
+        response['Cache-Control'] = 'private, no-cache'
+        return get_conditional_response(request, etag=etag, response=response)
+
+class GetJobStatusView(View):
+    def get(self, request, job_id):
+        try:
+            return JsonResponse(JobService.get_status(job_id))
+        except ObjectDoesNotExist:
+            return JsonResponse({'error': 'Job not found'}, status=404)
+
 class GetClinicianLocationsView(View):
     def get(self, request, clinician_id):
         locations = SchedulerDataService.get_clinician_locations(clinician_id)
@@ -92,7 +133,24 @@ class GetEventsView(View):
         clinician_ids = data.get('clinician_ids', [])
         location_ids = data.get('location_ids', [])
 
-        events = SchedulerDataService.get_events(
+        if data.get('since'):
+            # Delta sync after an edit; 410 tells the client to fetch the full window instead
+            try:
+                changes = SchedulerDataService.get_event_changes(
+                    request.user.user_type,
+                    getattr(request.user, 'id', None),
+                    data.get('since'),
+                    start_date,
+                    end_date,
+                    clinician_ids,
+                    location_ids
+                )
+            except ValidationError as e:
+                return JsonResponse({'error': e.messages[0]}, status=410)
+            return JsonResponse(changes)
+
+        sync_token = SchedulerDataService.get_sync_token()
+        events = SchedulerDataService.stream_events(
             request.user.user_type, 
             getattr(request.user, 'id', None), 
             start_date, 
@@ -100,4 +158,6 @@ class GetEventsView(View):
             clinician_ids, 
             location_ids
         )
-        return JsonResponse(events, safe=False)
+        response = StreamingHttpResponse(events, content_type='application/json')
+        response['X-Sync-Token'] = sync_token
+        return response
@@ -1,9 +1,11 @@
 import json
-from django.http import JsonResponse
+from django.http import JsonResponse, StreamingHttpResponse
 from django.shortcuts import redirect
 from django.views.generic import TemplateView
 from django.contrib.auth.mixins import LoginRequiredMixin, UserPassesTestMixin
+from django.forms import ValidationError
 from django.utils.decorators import method_decorator
+from apps.shared.services.availability_service import SchedulingConflictError
 from apps.shared.services.scheduler_service import SchedulerDataService
 from django.views.decorators.csrf import csrf_exempt
 
@@ -23,9 +25,12 @@ class DashboardView(LoginRequiredMixin, UserPassesTestMixin, TemplateView):
         context = super().get_context_data(**kwargs)
         clinicians = SchedulerDataService.get_resources(self.request.user.user_type, self.request.user)
         locations = SchedulerDataService.get_locations()
+        # The rest of the directory is loaded as the client list is scrolled or searched
+        clients = SchedulerDataService.get_client_page()
         context.update({
             'clinicians': json.dumps(list(clinicians)),
-            'clients': json.dumps(list(SchedulerDataService.get_clients())),
+            'clients': json.dumps(clients['clients']),
+            'clients_next': json.dumps(clients['next']),
             'locations': json.dumps(list(locations)),
             'team_members': json.dumps(list(SchedulerDataService.get_team_members())),
             'clinician_header': {
@@ -81,8 +86,8 @@ class DashboardView(LoginRequiredMixin, UserPassesTestMixin, TemplateView):
             end_date = request.GET.get('end_date')
             clinician_ids = request.GET.get('clinician_ids')
             location_ids = request.GET.get('location_ids')
-            return JsonResponse(
-                SchedulerDataService.get_events(
+            return StreamingHttpResponse(
+                SchedulerDataService.stream_events(
                     request.user.user_type,
                     getattr(request.user, 'id', None),
                     start_date,
@@ -90,7 +95,7 @@ class DashboardView(LoginRequiredMixin, UserPassesTestMixin, TemplateView):
                     clinician_ids,
                     location_ids
                 ), 
-                safe=False
+                content_type='application/json'
             )
         return super().get(request, *args, **kwargs)
 
@@ -103,17 +108,23 @@ class DashboardView(LoginRequiredMixin, UserPassesTestMixin, TemplateView):
         action = data.get('action')
         response_data = {}
 
-        if action == 'create':
-            event_data = SchedulerDataService.create_event(data)
-            response_data = {'status': 'success', 'event': event_data}
-        elif action == 'change':
-            event_id = data.get('eventData').get('eventId')
-            event_data = SchedulerDataService.update_event(event_id, data)
-            response_data = {'status': 'success', 'event': event_data}
-        elif action == 'remove':
-            event_id = data.get('eventData').get('Id')
-            edit_type = data.get('eventData').get('editType')
-            SchedulerDataService.delete_event(event_id, edit_type)
-            response_data = {'status': 'success', 'message': 'Event deleted'}
+        try:
+            if action == 'create':
+                event_data = SchedulerDataService.create_event(data)
+                response_data = {'status': 'success', 'event': event_data}
+            elif action == 'change':
+                event_id = data.get('eventData').get('eventId')
+                event_data = SchedulerDataService.update_event(event_id, data)
+                response_data = {'status': 'success', 'event': event_data}
+            elif action == 'remove':
+                event_id = data.get('eventData').get('Id')
+                edit_type = data.get('eventData').get('editType')
+                SchedulerDataService.delete_event(event_id, edit_type)
+                response_data = {'status': 'success', 'message': 'Event deleted'}
+        except SchedulingConflictError as e:
+            # The client asks whether to save anyway and resends with AllowConflicts
+            return JsonResponse({'status': 'conflict', 'conflicts': e.conflicts}, status=409)
+        except ValidationError as e:
+            return JsonResponse({'status': 'error', 'message': ' '.join(e.messages)}, status=400)
 
         return JsonResponse(response_data)
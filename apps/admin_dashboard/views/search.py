@@ -1,7 +1,11 @@
 
 
+from django.conf import settings
+from django.contrib.auth.mixins import LoginRequiredMixin
+from django.forms import ValidationError
 from django.http import JsonResponse
 from django.views import View
+from apps.shared.services.availability_service import AvailabilityService
 from apps.shared.services.scheduler_service import SchedulerDataService
 
 
@@ -13,6 +17,34 @@ class ClientSearchView(View):
             return JsonResponse(clients, safe=False)
         return JsonResponse([], safe=False)
 
+class ClientDirectoryView(LoginRequiredMixin, View):
+    raise_exception = True
+
+    def get(self, request):
+        """A page of the clients the user can book, optionally narrowed by a query; see get_client_page"""
+        # Admins see every client and clinicians their care team; nobody else sees any
+        if request.user.user_type == 'ADMIN':
+            login_id = None
+        elif request.user.user_type == 'CLINICIAN':
+            login_id = request.user.id
+        else:
+            return JsonResponse({'error': 'Not allowed'}, status=403)
+        try:
+            page = SchedulerDataService.get_client_page(
+                login_id,
+                request.GET.get('q'),
+                request.GET.get('after'),
+                int(request.GET.get('limit', SchedulerDataService.CLIENT_PAGE_SIZE))
+            )
+        except ValueError:
+            return JsonResponse({'error': 'Invalid limit'}, status=400)
+        except ValidationError as e:
+            return JsonResponse({'error': e.messages[0]}, status=400)
+        response = JsonResponse(page)
+        # Pages are per user; new clients show up once the browser's copy expires
+        response['Cache-Control'] = f"private, max-age={getattr(settings, 'SCHEDULER_CLIENT_DIRECTORY_MAX_AGE', 60)}"
+        return response
+
 class LocationSearchView(View):
     def get(self, request):
         query = request.GET.get('q', '')
@@ -23,8 +55,32 @@ class LocationSearchView(View):
 
 class ClinicianSearchView(View):
     def get(self, request):
+        """Clinicians matching a name, only those the patient can be booked with when patient_id is given"""
         query = request.GET.get('q', '')
-        clinicians = SchedulerDataService.search_clinicians(query)
+        try:
+            patient_id = int(request.GET['patient_id']) if request.GET.get('patient_id') else None
+        except ValueError:
+            return JsonResponse({'error': 'Invalid patient'}, status=400)
+        clinicians = SchedulerDataService.search_clinicians(patient_id, query)
         return JsonResponse(clinicians, safe=False)
-  
 
+class OpenSlotSearchView(View):
+    def get(self, request):
+        """Open slots of the clinicians matching the filters, for a duration or a practice service"""
+        try:
+            ids = {
+                key: [int(value) for value in request.GET.getlist(key)]
+                for key in ('clinician_ids', 'location_ids', 'speciality_ids', 'modality_ids')
+            }
+            slots = AvailabilityService.find_open_slots(
+                request.GET.get('start_date'),
+                request.GET.get('end_date'),
+                AvailabilityService.get_duration(request.GET.get('duration'), request.GET.get('service_id')),
+                limit=min(int(request.GET.get('limit', 200)), 1000),
+                **ids
+            )
+        except ValueError:
+            return JsonResponse({'error': 'Invalid filter values'}, status=400)
+        except ValidationError as e:
+            return JsonResponse({'error': e.messages[0]}, status=400)
+        return JsonResponse(slots, safe=False)
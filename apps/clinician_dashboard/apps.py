@@ -0,0 +1,9 @@
+# apps/clinician_dashboard/apps.py
+from django.apps import AppConfig
+
+class ClinicianDashboardConfig(AppConfig):
+    default_auto_field = 'django.db.models.BigAutoField'
+    name = 'apps.clinician_dashboard'
+
+    def ready(self):
+        from . import checks, signals  # noqa: F401
@@ -0,0 +1,29 @@
+from django.core import checks
+
+
+@checks.register(checks.Tags.models)
+def check_event_dependents(app_configs, **kwargs):
+    """
+    Every relation to Event must be in SchedulerDataService.EVENT_DEPENDENTS
+
+    Events are deleted without Django's collector, so a relation missing from the list would
+    leave dangling rows, or fail on the foreign key constraint.
+    """
+    from apps.clinician_dashboard.models import Event
+    from apps.shared.services.scheduler_service import SchedulerDataService
+
+    dependents = {(model, field) for model, field in SchedulerDataService.EVENT_DEPENDENTS}
+    errors = []
+    for relation in Event._meta.related_objects:
+        # Occurrences are deleted in the same statement as their series parent
+        if relation.related_model is Event:
+            continue
+        if (relation.related_model, relation.field.name) not in dependents:
+            errors.append(checks.Error(
+                f"{relation.related_model.__name__}.{relation.field.name} refers to Event but is not "
+                "in SchedulerDataService.EVENT_DEPENDENTS",
+                hint="Add it so deleting events deletes its rows too.",
+                obj=relation.related_model,
+                id='clinician_dashboard.E001',
+            ))
+    return errors
@@ -0,0 +1,14 @@
+from django.core.management.base import BaseCommand
+
+from apps.shared.services.scheduler_service import SchedulerDataService
+
+
+class Command(BaseCommand):
+    help = 'Store upcoming occurrences of recurring series as they come inside the materialization window; run nightly'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=100, help='Series read per batch')
+
+    def handle(self, *args, **options):
+        created = SchedulerDataService.extend_recurring_series(options['batch_size'])
+        self.stdout.write(self.style.SUCCESS(f"Created {created} occurrences"))
@@ -0,0 +1,14 @@
+from django.core.management.base import BaseCommand
+
+from apps.shared.services.patient_search_service import PatientSearchService
+
+
+class Command(BaseCommand):
+    help = 'Rebuild the client search tokens of every patient; run after bulk imports, which skip signals'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=PatientSearchService.BATCH_SIZE, help='Patients per transaction')
+
+    def handle(self, *args, **options):
+        count = PatientSearchService.rebuild(options['batch_size'])
+        self.stdout.write(self.style.SUCCESS(f"Indexed {count} patients"))
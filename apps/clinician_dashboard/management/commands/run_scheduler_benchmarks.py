@@ -0,0 +1,41 @@
+import json
+
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.shared.services.benchmark_service import BenchmarkService
+
+
+class Command(BaseCommand):
+    help = 'Time scheduler operations on a seeded practice and write a JSON report'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--prefix', default='seed', help='Prefix the practice was seeded with')
+        parser.add_argument('--repeat', type=int, default=5)
+        parser.add_argument('--only', nargs='*', help='Benchmarks to run, all by default')
+        parser.add_argument('--output', default='scheduler-benchmark.json', help='Path of the JSON report')
+        parser.add_argument('--baseline', help='Earlier report to compare against')
+
+    def handle(self, *args, **options):
+        try:
+            report = BenchmarkService.run(options['prefix'], options['repeat'], options['only'])
+        except ValueError as e:
+            raise CommandError(str(e))
+
+        with open(options['output'], 'w') as f:
+            json.dump(report, f, indent=2)
+
+        for name, result in report['results'].items():
+            self.stdout.write(
+                f"{name:<28} median {result['wall_ms']['median']:>9.2f} ms  "
+                f"{result['queries']:>6} queries  peak {result['peak_kb']:>9.1f} KB"
+            )
+
+        if options['baseline']:
+            with open(options['baseline']) as f:
+                baseline = json.load(f)
+            self.stdout.write(f"\nCompared to {options['baseline']}:")
+            for name, metric, before, after in BenchmarkService.compare(report, baseline):
+                change = f"{(after - before) / before * 100:+.1f}%" if before else 'n/a'
+                self.stdout.write(f"{name:<28} {metric:<8} {before:>10} -> {after:<10} {change}")
+
+        self.stdout.write(self.style.SUCCESS(f"Report written to {options['output']}"))
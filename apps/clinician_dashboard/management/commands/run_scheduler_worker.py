@@ -0,0 +1,54 @@
+import logging
+import signal
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import close_old_connections
+
+from apps.shared.services.job_service import JobService
+
+logger = logging.getLogger(__name__)
+
+
+class Command(BaseCommand):
+    help = 'Run queued scheduler jobs, such as creating the occurrences of new recurring series'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--once', action='store_true', help='Run the jobs that are due and exit')
+        parser.add_argument('--sleep', type=float, default=1.0, help='Seconds to wait when the queue is empty')
+        parser.add_argument('--max-backoff', type=float, default=60.0,
+                            help='Most seconds to wait after repeated failures, such as a lost database')
+
+    def handle(self, *args, **options):
+        self.stopping = False
+        signal.signal(signal.SIGTERM, self._stop)
+        signal.signal(signal.SIGINT, self._stop)
+
+        worker_id = JobService.get_worker_id()
+        self.stdout.write(f"Scheduler worker {worker_id} started")
+        failures = 0
+        while not self.stopping:
+            try:
+                close_old_connections()
+                count = JobService.run_pending(worker_id, limit=100)
+            except Exception:
+                if options['once']:
+                    raise
+                # Back off instead of exiting, so a database outage does not stop the queue for good
+                failures += 1
+                delay = min(options['sleep'] * 2 ** failures, options['max_backoff'])
+                logger.exception(f"Scheduler worker {worker_id} failed to run jobs, retrying in {delay:.0f}s")
+                time.sleep(delay)
+                continue
+            failures = 0
+            if count:
+                self.stdout.write(f"Ran {count} job(s)")
+            elif options['once']:
+                break
+            else:
+                time.sleep(options['sleep'])
+        self.stdout.write(f"Scheduler worker {worker_id} stopped")
+
+    def _stop(self, signum, frame):
+        # Finish the current job before exiting
+        self.stopping = True
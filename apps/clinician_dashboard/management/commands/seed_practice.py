@@ -0,0 +1,221 @@
+import random
+from datetime import date, datetime, time, timedelta
+from zoneinfo import ZoneInfo
+
+from dateutil import rrule
+from django.contrib.auth.hashers import make_password
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+
+from apps.accounts.models import Login
+from apps.clinician_dashboard.models import (
+    AppointmentState, CareTeam, Clinician, ClinicianLocation, ClinicianService, Event, EventNote,
+    EventService, EventType, Location, NoteTemplate, Patient, PatientDefaultService, PhsycotherapyNote,
+    PracticeService
+)
+from apps.shared.services.patient_search_service import PatientSearchService
+
+
+class Command(BaseCommand):
+    help = 'Seed a synthetic practice with years of recurring appointments for benchmarking'
+
+    TIMEZONE = ZoneInfo("America/New_York")
+
+    FIRST_NAMES = ['Ava', 'Ben', 'Cara', 'Dan', 'Eli', 'Fay', 'Gus', 'Hana', 'Ivan', 'Jade', 'Kai', 'Lena',
+                   'Milo', 'Nora', 'Omar', 'Pia', 'Quinn', 'Rosa', 'Sam', 'Tara', 'Uma', 'Vic', 'Wes', 'Zoe']
+    LAST_NAMES = ['Adams', 'Brooks', 'Chen', 'Diaz', 'Evans', 'Foster', 'Garcia', 'Hughes', 'Ito', 'Jones',
+                  'Kim', 'Lopez', 'Moore', 'Nguyen', 'Owens', 'Patel', 'Reyes', 'Smith', 'Turner', 'Walsh']
+    STATES = ['Show', 'No Show', 'Late Cancel', 'Canceled', 'Clinician Canceled']
+    WEEKDAYS = ['MO', 'TU', 'WE', 'TH', 'FR']
+
+    def add_arguments(self, parser):
+        parser.add_argument('--prefix', default='seed', help='Prefix of seeded emails and codes, so several practices can coexist')
+        parser.add_argument('--clinicians', type=int, default=20)
+        parser.add_argument('--patients', type=int, default=400)
+        parser.add_argument('--locations', type=int, default=4)
+        parser.add_argument('--services', type=int, default=8)
+        parser.add_argument('--years', type=float, default=2, help='Years of appointments, ending a quarter from today')
+        parser.add_argument('--notes', type=float, default=0.3, help='Share of past appointments with a progress note')
+        parser.add_argument('--random-seed', type=int, default=0)
+
+    def handle(self, *args, **options):
+        prefix = options['prefix']
+        if Login.objects.filter(email__startswith=f"{prefix}-").exists():
+            raise CommandError(f"A practice with prefix '{prefix}' already exists, use another --prefix")
+
+        self.random = random.Random(options['random_seed'])
+        with transaction.atomic():
+            types = {name: EventType.objects.get_or_create(name=name)[0] for name, _ in EventType.TYPE_CHOICES}
+            states = [AppointmentState.objects.get_or_create(name=name)[0] for name in self.STATES]
+            locations = self._create_locations(prefix, options['locations'])
+            services = self._create_services(prefix, options['services'])
+            clinicians = self._create_clinicians(prefix, options['clinicians'], locations, services)
+            care_teams = self._create_patients(prefix, options['patients'], clinicians, services)
+            events = self._create_appointments(care_teams, types, states, services, options['years'])
+            notes = self._create_notes(events, options['notes'])
+
+        self.stdout.write(self.style.SUCCESS(
+            f"Seeded '{prefix}': {len(clinicians)} clinicians, {options['patients']} patients, "
+            f"{len(care_teams)} care team links, {len(events)} appointments, {notes} notes"
+        ))
+
+    def _name(self):
+        return self.random.choice(self.FIRST_NAMES), self.random.choice(self.LAST_NAMES)
+
+    def _create_locations(self, prefix, count):
+        return Location.objects.bulk_create([
+            Location(name=f"{prefix} location {i + 1}", type='Onsite' if i else 'Telehealth')
+            for i in range(count)
+        ])
+
+    def _create_services(self, prefix, count):
+        return PracticeService.objects.bulk_create([
+            PracticeService(
+                type=f"{prefix} service {i + 1}",
+                rate=self.random.choice([90, 120, 150, 180]),
+                code=f"{prefix}-{90000 + i}",
+                duration=self.random.choice([30, 45, 60])
+            )
+            for i in range(count)
+        ])
+
+    def _create_clinicians(self, prefix, count, locations, services):
+        password = make_password(None)
+        logins = Login.objects.bulk_create([
+            Login(email=f"{prefix}-clinician-{i + 1}@example.com", password_hash=password, user_type='CLINICIAN')
+            for i in range(count)
+        ])
+        clinicians = Clinician.objects.bulk_create([
+            Clinician(
+                login_id=login.id,
+                first_name=first_name,
+                last_name=last_name,
+                address='1 Main St',
+                percentage_split=0.6,
+                field='Therapist',
+                color='#%06x' % self.random.randrange(0x1000000)
+            )
+            for login, (first_name, last_name) in ((login, self._name()) for login in logins)
+        ])
+        ClinicianLocation.objects.bulk_create([
+            ClinicianLocation(clinician=clinician, location=location)
+            for clinician in clinicians
+            for location in self.random.sample(locations, min(2, len(locations)))
+        ])
+        ClinicianService.objects.bulk_create([
+            ClinicianService(clinician=clinician, service=service, custom_rate=self.random.choice([None, service.rate + 10]))
+            for clinician in clinicians
+            for service in self.random.sample(services, min(4, len(services)))
+        ])
+        return clinicians
+
+    def _create_patients(self, prefix, count, clinicians, services):
+        patients = []
+        for i in range(count):
+            first_name, last_name = self._name()
+            patients.append(Patient(
+                first_name=first_name,
+                last_name=last_name,
+                email=f"{prefix}-patient-{i + 1}@example.com",
+                phone=f"555-{self.random.randrange(10000000):07d}",
+                login_id=f"{prefix}-patient-{i + 1}"
+            ))
+        patients = Patient.objects.bulk_create(patients)
+        # bulk_create sends no post_save
+        for i in range(0, len(patients), PatientSearchService.BATCH_SIZE):
+            PatientSearchService.index_patients(patients[i:i + PatientSearchService.BATCH_SIZE])
+
+        # Most patients see one clinician, some two
+        care_teams = CareTeam.objects.bulk_create([
+            CareTeam(patient=patient, clinician=clinician, is_primary=index == 0)
+            for patient in patients
+            for index, clinician in enumerate(self.random.sample(clinicians, 1 if self.random.random() < 0.8 else min(2, len(clinicians))))
+        ])
+        PatientDefaultService.objects.bulk_create([
+            PatientDefaultService(patient=patient, service=self.random.choice(services), is_primary=True)
+            for patient in patients
+        ])
+        return care_teams
+
+    def _create_appointments(self, care_teams, types, states, services, years):
+        """One weekly or biweekly series per care team link, stored as parent and child rows"""
+        today = date.today()
+        range_end = today + timedelta(days=90)
+        range_start = range_end - timedelta(days=int(years * 365))
+        appointment_type = types[EventType.APPOINTMENT]
+
+        series = []
+        for care_team in care_teams:
+            weekday = self.random.randrange(len(self.WEEKDAYS))
+            first_day = range_start + timedelta(days=(weekday - range_start.weekday()) % 7 + 7 * self.random.randrange(8))
+            start = datetime.combine(first_day, time(self.random.randrange(8, 18)), tzinfo=self.TIMEZONE)
+            until = range_end - timedelta(days=self.random.randrange(0, 180))
+            interval = self.random.choice([1, 1, 2])
+            rule = (
+                f"FREQ=WEEKLY;INTERVAL={interval};BYDAY={self.WEEKDAYS[weekday]};"
+                f"UNTIL={until.strftime('%Y%m%d')}T235959Z;"
+                f"DTSTART={start.astimezone(ZoneInfo('UTC')).strftime('%Y-%m-%dT%H:%M:%S.000Z')}"
+            )
+            starts = list(rrule.rrule(rrule.WEEKLY, dtstart=start, interval=interval,
+                                      until=datetime.combine(until, time.max, tzinfo=self.TIMEZONE)))
+            if starts:
+                series.append((care_team, rule, starts, timedelta(minutes=self.random.choice([45, 60]))))
+
+        def build(care_team, rule, start, duration, parent=None):
+            return Event(
+                type=appointment_type,
+                clinician_id=care_team.clinician_id,
+                patient_id=care_team.patient_id,
+                location_id=self._clinician_location(care_team.clinician_id),
+                status=states[0] if start.date() < today and self.random.random() < 0.9 else self.random.choice(states),
+                start_datetime=start,
+                end_datetime=start + duration,
+                appointment_total=120,
+                is_recurring=True,
+                recurrence_rule=rule,
+                parent_event=parent,
+                occurrence_date=start.date() if parent else None,
+                inherits_services=parent is not None
+            )
+
+        parents = Event.objects.bulk_create([
+            build(care_team, rule, starts[0], duration) for care_team, rule, starts, duration in series
+        ])
+        children = Event.objects.bulk_create([
+            build(care_team, rule, start, duration, parent)
+            for parent, (care_team, rule, starts, duration) in zip(parents, series)
+            for start in starts[1:]
+        ], batch_size=1000)
+
+        # Occurrences inherit the services of their series parent
+        EventService.objects.bulk_create([
+            EventService(event=parent, service=self.random.choice(services), fee=120, modifiers='')
+            for parent in parents
+        ], batch_size=1000)
+        return parents + children
+
+    def _clinician_location(self, clinician_id):
+        if not hasattr(self, '_locations_by_clinician'):
+            self._locations_by_clinician = {}
+            for link in ClinicianLocation.objects.values('clinician_id', 'location_id'):
+                self._locations_by_clinician.setdefault(link['clinician_id'], link['location_id'])
+        return self._locations_by_clinician.get(clinician_id)
+
+    def _create_notes(self, events, share):
+        """Progress notes on a share of past appointments, and a few psychotherapy notes"""
+        template, _ = NoteTemplate.objects.get_or_create(
+            name='Progress Note',
+            defaults={'template_data': {'fields': [{'name': 'summary', 'type': 'text'}]}}
+        )
+        now = datetime.now(self.TIMEZONE)
+        noted = [event for event in events if event.start_datetime < now and self.random.random() < share]
+        EventNote.objects.bulk_create([
+            EventNote(event=event, template=template, created_by_id=event.clinician_id,
+                      note_data={'summary': 'Session went as planned.'})
+            for event in noted
+        ], batch_size=1000)
+        PhsycotherapyNote.objects.bulk_create([
+            PhsycotherapyNote(event=event, created_by_id=event.clinician_id, note_data='Private note.')
+            for event in noted[::10]
+        ], batch_size=1000)
+        return len(noted) + len(noted[::10])
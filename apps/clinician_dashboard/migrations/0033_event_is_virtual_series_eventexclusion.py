@@ -0,0 +1,32 @@
+# Generated by Django 5.2.18 on 2026-10-18 10:17
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('clinician_dashboard', '0032_careteam_remove_patient_patient_clinici_1c5636_idx_and_more'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='event',
+            name='is_virtual_series',
+            field=models.BooleanField(default=False),
+        ),
+        migrations.CreateModel(
+            name='EventExclusion',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('occurrence_date', models.DateField()),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('parent_event', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='exclusions', to='clinician_dashboard.event')),
+            ],
+            options={
+                'db_table': 'Event_exclusions',
+                'unique_together': {('parent_event', 'occurrence_date')},
+            },
+        ),
+    ]
@@ -0,0 +1,25 @@
+# Generated by Django 5.2.18 on 2026-10-18 10:57
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('clinician_dashboard', '0033_event_is_virtual_series_eventexclusion'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='event',
+            name='Event_clinici_6d11ce_idx',
+        ),
+        migrations.AddIndex(
+            model_name='event',
+            index=models.Index(fields=['clinician', 'start_datetime'], include=('end_datetime',), name='Event_clinician_start_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='event',
+            index=models.Index(fields=['location', 'start_datetime'], include=('end_datetime',), name='Event_location_start_idx'),
+        ),
+    ]
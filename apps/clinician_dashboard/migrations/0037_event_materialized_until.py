@@ -0,0 +1,22 @@
+# Generated by Django 5.2.18 on 2026-10-18 11:20
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('clinician_dashboard', '0036_schedulerjob'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='event',
+            name='materialized_until',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.AddIndex(
+            model_name='event',
+            index=models.Index(fields=['materialized_until'], name='Event_materia_cd4f56_idx'),
+        ),
+    ]
@@ -0,0 +1,71 @@
+# Generated by Django 5.2.18 on 2026-10-18 11:27
+
+from django.db import migrations, models
+
+
+BATCH_SIZE = 500
+
+
+def _get_services(EventService, event_ids):
+    services = {}
+    for event_id, service_id, fee, modifiers in EventService.objects.filter(event_id__in=event_ids).values_list(
+        'event_id', 'service_id', 'fee', 'modifiers'
+    ):
+        services.setdefault(event_id, set()).add((service_id, fee, modifiers or ''))
+    return services
+
+
+def inherit_series_services(apps, schema_editor):
+    """Drop the service copies of occurrences identical to their series parent's"""
+    Event = apps.get_model('clinician_dashboard', 'Event')
+    EventService = apps.get_model('clinician_dashboard', 'EventService')
+    parent_ids = list(
+        Event.objects.filter(parent_event__isnull=False).values_list('parent_event_id', flat=True).distinct()
+    )
+    for i in range(0, len(parent_ids), BATCH_SIZE):
+        batch = parent_ids[i:i + BATCH_SIZE]
+        parent_services = _get_services(EventService, batch)
+        children = dict(Event.objects.filter(parent_event_id__in=batch).values_list('id', 'parent_event_id'))
+        child_services = _get_services(EventService, list(children))
+        inheriting = [
+            child_id for child_id, parent_id in children.items()
+            if child_services.get(child_id, set()) == parent_services.get(parent_id, set())
+        ]
+        for j in range(0, len(inheriting), BATCH_SIZE):
+            EventService.objects.filter(event_id__in=inheriting[j:j + BATCH_SIZE]).delete()
+            Event.objects.filter(id__in=inheriting[j:j + BATCH_SIZE]).update(inherits_services=True)
+
+
+def copy_series_services(apps, schema_editor):
+    """Give inheriting occurrences their own copy of their series parent's services again"""
+    Event = apps.get_model('clinician_dashboard', 'Event')
+    EventService = apps.get_model('clinician_dashboard', 'EventService')
+    children = list(Event.objects.filter(inherits_services=True).values_list('id', 'parent_event_id'))
+    for i in range(0, len(children), BATCH_SIZE):
+        batch = children[i:i + BATCH_SIZE]
+        parent_services = EventService.objects.filter(event_id__in={parent_id for _, parent_id in batch})
+        services = {}
+        for service in parent_services:
+            services.setdefault(service.event_id, []).append(service)
+        EventService.objects.bulk_create([
+            EventService(event_id=child_id, service_id=service.service_id, fee=service.fee, modifiers=service.modifiers)
+            for child_id, parent_id in batch
+            for service in services.get(parent_id, [])
+        ], batch_size=BATCH_SIZE)
+        Event.objects.filter(id__in=[child_id for child_id, _ in batch]).update(inherits_services=False)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('clinician_dashboard', '0037_event_materialized_until'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='event',
+            name='inherits_services',
+            field=models.BooleanField(default=False),
+        ),
+        migrations.RunPython(inherit_series_services, copy_series_services),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 5.2.18 on 2026-10-18 11:36
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('clinician_dashboard', '0038_event_inherits_services'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='event',
+            index=models.Index(fields=['patient', 'start_datetime'], include=('end_datetime',), name='Event_patient_start_idx'),
+        ),
+    ]
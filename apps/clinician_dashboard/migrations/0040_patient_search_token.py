@@ -0,0 +1,64 @@
+# Generated by Django 5.2.18 on 2026-10-18 11:42
+
+import re
+import unicodedata
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+BATCH_SIZE = 1000
+
+# Tokenizer of PatientSearchService as of this migration, frozen so later changes to it cannot
+# change what this migration does
+MAX_TOKEN_LENGTH = 100
+
+WORD = re.compile(r'[a-z0-9]+')
+
+
+def _normalize(text):
+    if not text:
+        return []
+    text = unicodedata.normalize('NFKD', text)
+    text = ''.join(char for char in text if not unicodedata.combining(char)).lower()
+    return [word[:MAX_TOKEN_LENGTH] for word in WORD.findall(text)]
+
+
+def _get_tokens(first_name, last_name, email):
+    return set(_normalize(first_name)) | set(_normalize(last_name)) | set(_normalize(email))
+
+
+def index_patients(apps, schema_editor):
+    """Build the search tokens of existing patients"""
+    Patient = apps.get_model('clinician_dashboard', 'Patient')
+    PatientSearchToken = apps.get_model('clinician_dashboard', 'PatientSearchToken')
+    patients = Patient.objects.order_by('id').values_list('id', 'first_name', 'last_name', 'email')
+    for i in range(0, patients.count(), BATCH_SIZE):
+        PatientSearchToken.objects.bulk_create([
+            PatientSearchToken(patient_id=patient_id, token=token)
+            for patient_id, first_name, last_name, email in patients[i:i + BATCH_SIZE]
+            for token in _get_tokens(first_name, last_name, email)
+        ], batch_size=BATCH_SIZE)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('clinician_dashboard', '0039_event_patient_start_idx'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='PatientSearchToken',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('token', models.CharField(max_length=100)),
+                ('patient', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='search_tokens', to='clinician_dashboard.patient')),
+            ],
+            options={
+                'db_table': 'Patient_search_tokens',
+                'indexes': [models.Index(fields=['token', 'patient'], name='Patient_search_token_idx')],
+            },
+        ),
+        migrations.RunPython(index_patients, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,22 @@
+# Generated by Django 5.2.18 on 2026-10-18 12:04
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('clinician_dashboard', '0041_patient_name_idx'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='eventtombstone',
+            name='clinician_id',
+            field=models.IntegerField(null=True),
+        ),
+        migrations.AddIndex(
+            model_name='eventtombstone',
+            index=models.Index(fields=['clinician_id', 'deleted_at'], name='Event_tombstone_clinician_idx'),
+        ),
+    ]
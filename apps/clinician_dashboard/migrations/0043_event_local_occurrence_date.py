@@ -0,0 +1,46 @@
+# Generated by Django 5.2.18 on 2026-10-18 12:20
+
+from zoneinfo import ZoneInfo
+
+from django.db import migrations
+
+
+BATCH_SIZE = 500
+
+TIMEZONE = ZoneInfo("America/New_York")
+UTC = ZoneInfo("UTC")
+
+
+def _set_occurrence_dates(apps, tz):
+    """Recompute the occurrence date of materialized occurrences in the given time zone"""
+    Event = apps.get_model('clinician_dashboard', 'Event')
+    occurrences = Event.objects.filter(
+        parent_event__isnull=False, parent_event__is_virtual_series=False
+    ).only('id', 'start_datetime', 'occurrence_date').order_by('id')
+    changed = []
+    for event in occurrences.iterator(chunk_size=BATCH_SIZE):
+        occurrence_date = event.start_datetime.astimezone(tz).date()
+        if event.occurrence_date != occurrence_date:
+            event.occurrence_date = occurrence_date
+            changed.append(event)
+    Event.objects.bulk_update(changed, ['occurrence_date'], batch_size=BATCH_SIZE)
+
+
+def use_local_dates(apps, schema_editor):
+    """Materialized occurrences were dated in UTC, so evening occurrences carried the next day"""
+    _set_occurrence_dates(apps, TIMEZONE)
+
+
+def use_utc_dates(apps, schema_editor):
+    _set_occurrence_dates(apps, UTC)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('clinician_dashboard', '0042_eventtombstone_clinician'),
+    ]
+
+    operations = [
+        migrations.RunPython(use_local_dates, use_utc_dates),
+    ]
@@ -0,0 +1,57 @@
+# Generated by Django 5.2.18 on 2026-10-18 15:40
+
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import migrations
+from django.db.models import F
+
+
+def split_long_events(apps, schema_editor):
+    """
+    Window queries only find events up to SCHEDULER_MAX_EVENT_DURATION_DAYS long, other than out of
+    office blocks. Split longer single events into consecutive rows of at most that length; series
+    rows are reported rather than split, their occurrences would no longer line up
+    """
+    Event = apps.get_model('clinician_dashboard', 'Event')
+    EventService = apps.get_model('clinician_dashboard', 'EventService')
+    max_duration = timedelta(days=getattr(settings, 'SCHEDULER_MAX_EVENT_DURATION_DAYS', 31))
+
+    long_events = Event.objects.filter(
+        end_datetime__gt=F('start_datetime') + max_duration
+    ).exclude(type__name='OUT_OF_OFFICE').order_by('id')
+
+    for event in long_events:
+        if event.is_recurring or event.parent_event_id:
+            print(f"Event {event.id} is longer than {max_duration.days} days and part of a series; not split")
+            continue
+
+        services = list(EventService.objects.filter(event_id=event.id))
+        end = event.end_datetime
+        event.end_datetime = event.start_datetime + max_duration
+        event.save(update_fields=['end_datetime'])
+
+        chunk_start = event.end_datetime
+        while chunk_start < end:
+            chunk = Event.objects.get(pk=event.pk)
+            chunk.pk = None
+            chunk.start_datetime = chunk_start
+            chunk.end_datetime = min(chunk_start + max_duration, end)
+            chunk.save()
+            EventService.objects.bulk_create([
+                EventService(event_id=chunk.id, service_id=service.service_id, fee=service.fee,
+                             modifiers=service.modifiers)
+                for service in services
+            ])
+            chunk_start = chunk.end_datetime
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('clinician_dashboard', '0043_event_local_occurrence_date'),
+    ]
+
+    operations = [
+        migrations.RunPython(split_long_events, migrations.RunPython.noop),
+    ]
@@ -168,6 +168,14 @@ class Event(models.Model):
     recurrence_rule = models.CharField(max_length=255, null=True, blank=True)
     parent_event = models.ForeignKey('self', null=True, blank=True, on_delete=models.CASCADE)
     occurrence_date = models.DateField(null=True, blank=True)
+    # Series expanded at read time; child rows only exist for edited occurrences
+    is_virtual_series = models.BooleanField(default=False)
+    # Materialized series whose occurrences are only stored up to this point; the
+    # extend_recurring_series command stores more as time passes. None once complete
+    materialized_until = models.DateTimeField(null=True, blank=True)
+    # Occurrence without EventService rows of its own, whose services are its series parent's.
+    # It gets its own rows (copy on write) once they differ from the series'
+    inherits_services = models.BooleanField(default=False)
     
     # Metadata
     created_at = models.DateTimeField(auto_now_add=True)
@@ -207,10 +215,83 @@ class Event(models.Model):
         db_table = 'Event'
         indexes = [
             models.Index(fields=['start_datetime', 'end_datetime']),
-            models.Index(fields=['clinician']),
+            # Calendar window lookups scoped to a clinician or location; end_datetime is
+            # included so the overlap check is answered from the index
+            models.Index(fields=['clinician', 'start_datetime'], include=['end_datetime'], name='Event_clinician_start_idx'),
+            models.Index(fields=['location', 'start_datetime'], include=['end_datetime'], name='Event_location_start_idx'),
+            # Double booking checks of a patient's appointments
+            models.Index(fields=['patient', 'start_datetime'], include=['end_datetime'], name='Event_patient_start_idx'),
             models.Index(fields=['type']),
             models.Index(fields=['parent_event']),
             models.Index(fields=['is_recurring']),
+            # Calendar delta syncs read events changed since a sync token
+            models.Index(fields=['updated_at']),
+            # Series due for extension
+            models.Index(fields=['materialized_until']),
+        ]
+
+class EventExclusion(models.Model):
+    """Deleted occurrence of a virtual series"""
+    parent_event = models.ForeignKey(Event, on_delete=models.CASCADE, related_name='exclusions')
+    occurrence_date = models.DateField()
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        db_table = 'Event_exclusions'
+        unique_together = ('parent_event', 'occurrence_date')
+
+class EventTombstone(models.Model):
+    """
+    Event deleted or moved off a clinician's calendar, kept for a while so calendar delta syncs
+    can tell that clinician's clients to drop it
+    """
+    event_id = models.IntegerField()
+    clinician_id = models.IntegerField(null=True)
+    deleted_at = models.DateTimeField(auto_now_add=True, db_index=True)
+
+    class Meta:
+        db_table = 'Event_tombstones'
+        indexes = [
+            models.Index(fields=['clinician_id', 'deleted_at'], name='Event_tombstone_clinician_idx'),
+        ]
+
+class SchedulerJob(models.Model):
+    """Background scheduler work, run by the run_scheduler_worker command"""
+    MATERIALIZE_SERIES = 'MATERIALIZE_SERIES'
+
+    KIND_CHOICES = [
+        (MATERIALIZE_SERIES, 'Materialize series'),
+    ]
+
+    PENDING = 'PENDING'
+    RUNNING = 'RUNNING'
+    DONE = 'DONE'
+    FAILED = 'FAILED'
+
+    STATUS_CHOICES = [
+        (PENDING, 'Pending'),
+        (RUNNING, 'Running'),
+        (DONE, 'Done'),
+        (FAILED, 'Failed'),
+    ]
+
+    kind = models.CharField(max_length=50, choices=KIND_CHOICES)
+    payload = models.JSONField(default=dict)
+    status = models.CharField(max_length=20, choices=STATUS_CHOICES, default=PENDING)
+    attempts = models.PositiveIntegerField(default=0)
+    max_attempts = models.PositiveIntegerField(default=5)
+    run_after = models.DateTimeField()
+    locked_at = models.DateTimeField(null=True, blank=True)
+    locked_by = models.CharField(max_length=255, null=True, blank=True)
+    last_error = models.TextField(null=True, blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+    finished_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        db_table = 'Scheduler_jobs'
+        indexes = [
+            # Workers claim the oldest due job of a status
+            models.Index(fields=['status', 'run_after']),
         ]
 
 class EventService(models.Model):
@@ -245,6 +326,20 @@ class Patient(models.Model):
         db_table = 'Patient'
         indexes = [
             models.Index(fields=['login_id']),
+            # Client directory pages, read by keyset in name order
+            models.Index(fields=['last_name', 'first_name'], name='Patient_name_idx'),
+        ]
+
+class PatientSearchToken(models.Model):
+    """Normalized word of a patient's name or email, see PatientSearchService"""
+    patient = models.ForeignKey(Patient, on_delete=models.CASCADE, related_name='search_tokens')
+    token = models.CharField(max_length=100)
+
+    class Meta:
+        db_table = 'Patient_search_tokens'
+        indexes = [
+            # Prefix lookups read patient IDs from the index alone
+            models.Index(fields=['token', 'patient'], name='Patient_search_token_idx'),
         ]
 
 class CareTeam(models.Model):
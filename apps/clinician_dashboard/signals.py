@@ -0,0 +1,110 @@
+from django.db.models.signals import post_delete, post_save, pre_save
+from django.dispatch import receiver
+from apps.accounts.models import Login
+from apps.clinician_dashboard.models import (
+    AppointmentState, CareTeam, Clinician, ClinicianService, EventType, Location, Patient, PatientDefaultService, PracticeService
+)
+from apps.shared.services.bookable_clinician_service import BookableClinicianService
+from apps.shared.services.calendar_cache_service import CalendarCacheService
+from apps.shared.services.lookup_service import LookupService
+from apps.shared.services.patient_search_service import PatientSearchService
+from apps.shared.services.reference_cache_service import ReferenceCacheService
+from apps.shared.services.service_price_service import ServicePriceService
+
+
+# Patient fields shown on calendar events
+PATIENT_CALENDAR_FIELDS = ('first_name', 'last_name')
+
+# Patient fields search tokens are built from
+PATIENT_SEARCH_FIELDS = ('first_name', 'last_name', 'email')
+
+
+@receiver([post_save, post_delete], sender=Location)
+@receiver([post_save, post_delete], sender=EventType)
+@receiver([post_save, post_delete], sender=AppointmentState)
+@receiver(post_delete, sender=Patient)
+def invalidate_calendar_windows(sender, **kwargs):
+    """Names of patients, locations, event types and states are part of cached calendar windows"""
+    CalendarCacheService.invalidate_all()
+
+
+@receiver(pre_save, sender=Patient)
+def remember_patient_fields(sender, instance, update_fields=None, **kwargs):
+    """Keep the stored values of the fields signals compare, so post_save can tell what changed"""
+    fields = [
+        field for field in dict.fromkeys(PATIENT_CALENDAR_FIELDS + PATIENT_SEARCH_FIELDS)
+        if not update_fields or field in update_fields
+    ]
+    if instance.pk is None or not fields:
+        instance._stored_fields = None
+        return
+    instance._stored_fields = Patient.objects.filter(pk=instance.pk).values(*fields).first()
+
+
+def _patient_changed(instance, created, fields) -> bool:
+    """Whether a save created the patient or changed any of the fields"""
+    if created:
+        return True
+    stored = getattr(instance, '_stored_fields', None) or {}
+    return any(stored[field] != getattr(instance, field) for field in fields if field in stored)
+
+
+@receiver(post_save, sender=Patient)
+def invalidate_patient_windows(sender, instance, created, **kwargs):
+    """Windows only change when a name shown on events does; other patient edits keep them cached"""
+    if not created and _patient_changed(instance, created, PATIENT_CALENDAR_FIELDS):
+        CalendarCacheService.invalidate_all()
+
+
+@receiver([post_save, post_delete], sender=EventType)
+@receiver([post_save, post_delete], sender=AppointmentState)
+def clear_lookups(sender, **kwargs):
+    LookupService.clear()
+
+
+@receiver([post_save, post_delete], sender=Location)
+def invalidate_locations(sender, **kwargs):
+    ReferenceCacheService.invalidate(ReferenceCacheService.LOCATIONS)
+
+
+@receiver([post_save, post_delete], sender=PracticeService)
+def invalidate_practice_services(sender, **kwargs):
+    ReferenceCacheService.invalidate(ReferenceCacheService.SERVICES)
+    ServicePriceService.invalidate_practice()
+
+
+@receiver([post_save, post_delete], sender=Clinician)
+def invalidate_clinicians(sender, **kwargs):
+    ReferenceCacheService.invalidate(ReferenceCacheService.CLINICIANS)
+
+
+@receiver([post_save, post_delete], sender=Login)
+def invalidate_admin_clinicians(sender, update_fields=None, **kwargs):
+    """Admin logins make their clinicians bookable for every patient"""
+    # Sign ins save last_login alone
+    if update_fields and 'user_type' not in update_fields:
+        return
+    ReferenceCacheService.invalidate(ReferenceCacheService.CLINICIANS)
+
+
+@receiver([post_save, post_delete], sender=CareTeam)
+def invalidate_care_team(sender, instance, **kwargs):
+    BookableClinicianService.invalidate_patient(instance.patient_id)
+    ServicePriceService.invalidate_patient(instance.patient_id)
+
+
+@receiver([post_save, post_delete], sender=ClinicianService)
+def invalidate_clinician_services(sender, instance, **kwargs):
+    ServicePriceService.invalidate_clinician(instance.clinician_id)
+
+
+@receiver([post_save, post_delete], sender=PatientDefaultService)
+def invalidate_patient_default_services(sender, instance, **kwargs):
+    ServicePriceService.invalidate_patient(instance.patient_id)
+
+
+@receiver(post_save, sender=Patient)
+def index_patient(sender, instance, created, **kwargs):
+    # Deleted patients lose their tokens through the foreign key cascade
+    if _patient_changed(instance, created, PATIENT_SEARCH_FIELDS):
+        PatientSearchService.index_patient(instance)
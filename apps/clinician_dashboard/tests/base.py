@@ -0,0 +1,81 @@
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+from zoneinfo import ZoneInfo
+
+from django.core.cache import cache
+from django.test import TestCase
+
+from apps.accounts.models import Login
+from apps.clinician_dashboard.models import (
+    AppointmentState, CareTeam, Clinician, ClinicianLocation, Event, EventType, Location, Patient, PracticeService
+)
+from apps.shared.services.job_service import JobService
+from apps.shared.services.lookup_service import LookupService
+from apps.shared.services.scheduler_service import SchedulerDataService
+
+
+class SchedulerTestCase(TestCase):
+    """A practice with a clinician, an admin clinician, a patient on the clinician's care team, a location and a service"""
+
+    TIMEZONE = ZoneInfo("America/New_York")
+
+    @classmethod
+    def setUpTestData(cls):
+        for name in ('APPOINTMENT', 'EVENT', 'OUT_OF_OFFICE'):
+            EventType.objects.create(name=name)
+        for name in ('Show', 'No Show', 'Late Cancel', 'Canceled', 'Clinician Canceled'):
+            AppointmentState.objects.create(name=name)
+
+        cls.admin_login = Login.objects.create_user('admin@example.com', 'password', user_type='ADMIN')
+        cls.clinician_login = Login.objects.create_user('clinician@example.com', 'password', user_type='CLINICIAN')
+        cls.location = Location.objects.create(name='Main Office', type='Onsite')
+        cls.clinician = Clinician.objects.create(
+            login_id=cls.clinician_login.id, first_name='Ann', last_name='Lee',
+            address='1 Main St', percentage_split=0.5, field='Therapy'
+        )
+        cls.admin_clinician = Clinician.objects.create(
+            login_id=cls.admin_login.id, first_name='Bob', last_name='Stone',
+            address='1 Main St', percentage_split=0.5, field='Therapy'
+        )
+        ClinicianLocation.objects.create(clinician=cls.clinician, location=cls.location)
+        cls.patient = Patient.objects.create(first_name='Pat', last_name='Smith', email='pat@example.com', login_id='pat')
+        CareTeam.objects.create(patient=cls.patient, clinician=cls.clinician)
+        cls.service = PracticeService.objects.create(type='Therapy', rate=100, code='90834', duration=45)
+
+    def setUp(self):
+        # Registries and cached entries outlive the rolled back rows of earlier tests
+        cache.clear()
+        LookupService._registry = None
+
+    def local(self, *args) -> datetime:
+        """Aware datetime in the practice time zone"""
+        return datetime(*args, tzinfo=self.TIMEZONE)
+
+    def appointment_data(self, start: datetime, end: datetime, rule: Optional[str] = None,
+                         clinician: Optional[Clinician] = None, **fields) -> Dict[str, Any]:
+        """Request body of an appointment, as the scheduler sends it"""
+        event_data = {
+            'eventType': 'APPOINTMENT',
+            'StartTime': start.isoformat(),
+            'EndTime': end.isoformat(),
+            'IsAllDay': False,
+            'Client': {'id': self.patient.id},
+            'Clinician': {'id': (clinician or self.clinician).id},
+            'Location': {'id': self.location.id},
+            'Services': [{'serviceId': self.service.id, 'fee': 100, 'modifiers': []}],
+            'AppointmentTotal': 100,
+        }
+        if rule:
+            event_data['RecurrenceRule'] = rule
+        event_data.update(fields)
+        return {'eventData': event_data}
+
+    def create_appointment(self, start: datetime, end: datetime, rule: Optional[str] = None, **fields) -> Event:
+        """Create an appointment and run the jobs it queued, such as materializing its series"""
+        event_dict = SchedulerDataService.create_event(self.appointment_data(start, end, rule, **fields))
+        JobService.run_pending()
+        return Event.objects.get(id=event_dict['Id'])
+
+    def local_starts(self, events) -> List[datetime]:
+        """Local start of each event, in order"""
+        return sorted(event.start_datetime.astimezone(self.TIMEZONE) for event in events)
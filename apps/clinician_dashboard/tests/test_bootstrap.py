@@ -0,0 +1,28 @@
+from django.urls import reverse
+
+from apps.accounts.models import Login
+from apps.clinician_dashboard.tests.base import SchedulerTestCase
+
+
+class BootstrapViewTests(SchedulerTestCase):
+    URL_NAMES = ('admin_dashboard:bootstrap', 'clinician_dashboard:bootstrap')
+
+    def test_login_is_required(self):
+        for url_name in self.URL_NAMES:
+            self.assertEqual(self.client.get(reverse(url_name)).status_code, 403)
+
+    def test_other_users_are_refused(self):
+        self.client.force_login(Login.objects.create_user('pat@example.com', 'password', user_type='PATIENT'))
+
+        for url_name in self.URL_NAMES:
+            self.assertEqual(self.client.get(reverse(url_name)).status_code, 403)
+
+    def test_unchanged_data_is_not_sent_again(self):
+        self.client.force_login(self.admin_login)
+
+        response = self.client.get(reverse('admin_dashboard:bootstrap'))
+        self.assertEqual(response.status_code, 200)
+        self.assertFalse(response.json()['is_clinician'])
+
+        revalidated = self.client.get(reverse('admin_dashboard:bootstrap'), HTTP_IF_NONE_MATCH=response['ETag'])
+        self.assertEqual(revalidated.status_code, 304)
@@ -0,0 +1,24 @@
+from apps.clinician_dashboard.tests.base import SchedulerTestCase
+from apps.shared.services.calendar_cache_service import CalendarCacheService
+
+
+class PatientInvalidationTests(SchedulerTestCase):
+    def save_patient(self, **fields):
+        for field, value in fields.items():
+            setattr(self.patient, field, value)
+        with self.captureOnCommitCallbacks(execute=True):
+            self.patient.save()
+
+    def test_edit_of_a_field_not_on_the_calendar_keeps_windows(self):
+        version = CalendarCacheService.get_shared_version()
+
+        self.save_patient(phone='555-0100', email='new@example.com')
+
+        self.assertEqual(CalendarCacheService.get_shared_version(), version)
+
+    def test_rename_invalidates_windows(self):
+        version = CalendarCacheService.get_shared_version()
+
+        self.save_patient(last_name='Jones')
+
+        self.assertNotEqual(CalendarCacheService.get_shared_version(), version)
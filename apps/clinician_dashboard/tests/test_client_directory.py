@@ -0,0 +1,88 @@
+from django.forms import ValidationError
+from django.urls import reverse
+
+from apps.accounts.models import Login
+from apps.clinician_dashboard.models import CareTeam, Patient
+from apps.clinician_dashboard.tests.base import SchedulerTestCase
+from apps.shared.services.scheduler_service import SchedulerDataService
+
+
+class ClientPageTests(SchedulerTestCase):
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        # Two Smiths with the same first name: the ID breaks the tie
+        for first_name, last_name in (('Al', 'Adams'), ('Pat', 'Smith'), ('Cy', 'Young'), ('Bo', 'Brown')):
+            patient = Patient.objects.create(
+                first_name=first_name, last_name=last_name,
+                email=f"{first_name}.{last_name}@example.com".lower(), login_id=f"{first_name}{last_name}"
+            )
+            if last_name != 'Brown':
+                CareTeam.objects.create(patient=patient, clinician=cls.clinician)
+
+    def get_names(self, page):
+        return [client['name'] for client in page['clients']]
+
+    def read_all(self, **kwargs):
+        names, cursor = [], None
+        while True:
+            page = SchedulerDataService.get_client_page(cursor=cursor, limit=2, **kwargs)
+            names.extend(self.get_names(page))
+            cursor = page['next']
+            if cursor is None:
+                return names
+
+    def test_pages_follow_each_other_in_name_order(self):
+        self.assertEqual(self.read_all(), ['Al Adams', 'Bo Brown', 'Pat Smith', 'Pat Smith', 'Cy Young'])
+
+    def test_last_page_has_no_cursor(self):
+        page = SchedulerDataService.get_client_page(limit=10)
+
+        self.assertEqual(len(page['clients']), 5)
+        self.assertIsNone(page['next'])
+
+    def test_clinician_sees_active_care_team_only(self):
+        CareTeam.objects.filter(patient__first_name='Cy').update(status='INACTIVE')
+
+        self.assertEqual(
+            self.read_all(login_id=self.clinician_login.id), ['Al Adams', 'Pat Smith', 'Pat Smith']
+        )
+
+    def test_query_filters_every_page(self):
+        self.assertEqual(self.read_all(query='smi'), ['Pat Smith', 'Pat Smith'])
+
+    def test_malformed_cursor_is_rejected(self):
+        with self.assertRaises(ValidationError):
+            SchedulerDataService.get_client_page(cursor='not-a-cursor')
+
+
+class ClientDirectoryViewTests(SchedulerTestCase):
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        Patient.objects.create(first_name='Bo', last_name='Brown', email='bo@example.com', login_id='bo')
+
+    def get_names(self, login, url_name='clinician_dashboard:client_directory'):
+        if login:
+            self.client.force_login(login)
+        response = self.client.get(reverse(url_name))
+        return response.status_code, [client['name'] for client in response.json().get('clients', [])]
+
+    def test_admin_sees_every_client(self):
+        self.assertEqual(self.get_names(self.admin_login), (200, ['Bo Brown', 'Pat Smith']))
+
+    def test_clinician_sees_their_care_team(self):
+        self.assertEqual(self.get_names(self.clinician_login), (200, ['Pat Smith']))
+        self.assertEqual(
+            self.get_names(self.clinician_login, 'admin_dashboard:client_directory'), (200, ['Pat Smith'])
+        )
+
+    def test_other_users_are_refused(self):
+        patient_login = Login.objects.create_user('pat@example.com', 'password', user_type='PATIENT')
+
+        self.assertEqual(self.get_names(patient_login), (403, []))
+        self.assertEqual(self.get_names(patient_login, 'admin_dashboard:client_directory'), (403, []))
+
+    def test_login_is_required(self):
+        self.assertEqual(self.client.get(reverse('clinician_dashboard:client_directory')).status_code, 403)
+        self.assertEqual(self.client.get(reverse('admin_dashboard:client_directory')).status_code, 403)
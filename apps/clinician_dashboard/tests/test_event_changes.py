@@ -0,0 +1,45 @@
+from apps.clinician_dashboard.tests.base import SchedulerTestCase
+from apps.shared.services.scheduler_service import SchedulerDataService
+
+
+class EventChangesTests(SchedulerTestCase):
+    def setUp(self):
+        super().setUp()
+        self.token = SchedulerDataService.get_sync_token()
+        self.own = self.create_appointment(self.local(2027, 3, 1, 9), self.local(2027, 3, 1, 9, 45))
+        self.other = self.create_appointment(
+            self.local(2027, 3, 2, 9), self.local(2027, 3, 2, 9, 45), clinician=self.admin_clinician
+        )
+
+    def get_changes(self, clinician=None):
+        """Changes seen by the clinician's own calendar, or by an admin viewing another clinician"""
+        if clinician is None:
+            return SchedulerDataService.get_event_changes(
+                'CLINICIAN', self.clinician_login.id, self.token, self.local(2027, 3, 1), self.local(2027, 4, 1)
+            )
+        return SchedulerDataService.get_event_changes(
+            'ADMIN', self.admin_login.id, self.token, self.local(2027, 3, 1), self.local(2027, 4, 1),
+            clinician_ids=[clinician.id]
+        )
+
+    def test_changes_are_limited_to_the_clinicians_in_view(self):
+        changes = self.get_changes()
+
+        self.assertEqual([event['Id'] for event in changes['events']], [self.own.id])
+        self.assertNotIn(self.other.id, changes['deleted'])
+
+    def test_deleted_event_is_reported_to_its_clinician_only(self):
+        SchedulerDataService.delete_event(self.own.id, 'single')
+
+        self.assertIn(self.own.id, self.get_changes()['deleted'])
+        self.assertNotIn(self.own.id, self.get_changes(self.admin_clinician)['deleted'])
+
+    def test_event_moved_to_another_clinician_leaves_the_old_calendar(self):
+        SchedulerDataService.update_event(self.own.id, self.appointment_data(
+            self.local(2027, 3, 1, 9), self.local(2027, 3, 1, 9, 45), clinician=self.admin_clinician, editType='single'
+        ))
+
+        self.assertIn(self.own.id, self.get_changes()['deleted'])
+        new_changes = self.get_changes(self.admin_clinician)
+        self.assertIn(self.own.id, [event['Id'] for event in new_changes['events']])
+        self.assertNotIn(self.own.id, new_changes['deleted'])
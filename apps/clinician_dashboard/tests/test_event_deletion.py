@@ -0,0 +1,60 @@
+from unittest import mock
+
+from django.test import SimpleTestCase
+
+from apps.clinician_dashboard.checks import check_event_dependents
+from apps.clinician_dashboard.models import (
+    Event, EventNote, EventService, EventTombstone, NoteTemplate, PhsycotherapyNote
+)
+from apps.clinician_dashboard.tests.base import SchedulerTestCase
+from apps.shared.services.scheduler_service import SchedulerDataService
+
+
+class EventDeletionTests(SchedulerTestCase):
+    def setUp(self):
+        super().setUp()
+        self.series = self.create_appointment(
+            self.local(2027, 3, 1, 9), self.local(2027, 3, 1, 9, 45), 'FREQ=WEEKLY;INTERVAL=1;BYDAY=MO;COUNT=4'
+        )
+        self.occurrence = Event.objects.filter(parent_event=self.series).order_by('start_datetime').first()
+        template = NoteTemplate.objects.create(name='Progress', template_data={})
+        EventNote.objects.create(event=self.occurrence, template=template, note_data={})
+        PhsycotherapyNote.objects.create(event=self.series, note_data='Session notes')
+        self.event_ids = [self.series.id] + list(
+            Event.objects.filter(parent_event=self.series).values_list('id', flat=True)
+        )
+
+    def test_deleting_a_series_deletes_its_occurrences_and_their_rows(self):
+        SchedulerDataService.delete_event(self.series.id, 'all')
+
+        self.assertFalse(Event.objects.filter(id__in=self.event_ids).exists())
+        self.assertFalse(EventService.objects.filter(event_id__in=self.event_ids).exists())
+        self.assertFalse(EventNote.objects.exists())
+        self.assertFalse(PhsycotherapyNote.objects.exists())
+        self.assertCountEqual(
+            EventTombstone.objects.values_list('event_id', 'clinician_id'),
+            [(event_id, self.clinician.id) for event_id in self.event_ids]
+        )
+
+    def test_deleting_an_occurrence_keeps_the_rest_of_the_series(self):
+        SchedulerDataService.delete_event(self.occurrence.id, 'single')
+
+        self.assertFalse(Event.objects.filter(id=self.occurrence.id).exists())
+        self.assertFalse(EventNote.objects.exists())
+        self.assertEqual(Event.objects.filter(id__in=self.event_ids).count(), len(self.event_ids) - 1)
+        self.assertTrue(EventService.objects.filter(event=self.series).exists())
+        self.assertTrue(PhsycotherapyNote.objects.exists())
+
+
+class EventDependentsCheckTests(SimpleTestCase):
+    def test_every_relation_to_event_is_listed(self):
+        self.assertEqual(check_event_dependents(None), [])
+
+    def test_missing_relation_is_reported(self):
+        dependents = tuple(
+            dependent for dependent in SchedulerDataService.EVENT_DEPENDENTS if dependent[0] is not EventNote
+        )
+        with mock.patch.object(SchedulerDataService, 'EVENT_DEPENDENTS', dependents):
+            errors = check_event_dependents(None)
+
+        self.assertEqual([error.id for error in errors], ['clinician_dashboard.E001'])
@@ -0,0 +1,79 @@
+import json
+from importlib import import_module
+
+from django.apps import apps
+from django.forms import ValidationError
+from django.urls import reverse
+
+from apps.clinician_dashboard.models import Event, EventService
+from apps.clinician_dashboard.tests.base import SchedulerTestCase
+from apps.shared.services.availability_service import AvailabilityService
+from apps.shared.services.scheduler_service import SchedulerDataService
+
+
+class EventDurationTests(SchedulerTestCase):
+    def leave_data(self, start, end):
+        return {'eventData': {
+            'eventType': 'OUT_OF_OFFICE',
+            'StartTime': start.isoformat(),
+            'EndTime': end.isoformat(),
+            'IsAllDay': True,
+            'TeamMember': {'id': self.clinician.id},
+        }}
+
+    def test_appointment_longer_than_the_bound_is_rejected(self):
+        with self.assertRaises(ValidationError):
+            self.create_appointment(self.local(2027, 3, 1, 10), self.local(2027, 4, 15, 10))
+
+    def test_long_leave_is_found_weeks_after_it_began(self):
+        # A six week leave
+        leave = SchedulerDataService.create_event(self.leave_data(self.local(2027, 3, 1), self.local(2027, 4, 12)))
+
+        events = SchedulerDataService.get_events(
+            'ADMIN', self.admin_login.id, self.local(2027, 4, 5), self.local(2027, 4, 6)
+        )
+
+        self.assertEqual([event['Id'] for event in events], [leave['Id']])
+
+    def test_long_leave_blocks_open_slots(self):
+        SchedulerDataService.create_event(self.leave_data(self.local(2027, 3, 1), self.local(2027, 4, 12)))
+
+        slots = AvailabilityService.find_open_slots(
+            self.local(2027, 4, 5).isoformat(), self.local(2027, 4, 6).isoformat(), AvailabilityService.get_duration(45),
+            clinician_ids=[self.clinician.id]
+        )
+
+        self.assertEqual(slots, [])
+
+    def test_dashboard_answers_invalid_event_with_400(self):
+        self.client.force_login(self.admin_login)
+        data = self.appointment_data(self.local(2027, 3, 1, 10), self.local(2027, 4, 15, 10))
+
+        response = self.client.post(
+            reverse('admin_dashboard:dashboard'), json.dumps({'action': 'create', **data}),
+            content_type='application/json'
+        )
+
+        self.assertEqual(response.status_code, 400)
+        self.assertIn('31 days', response.json()['message'])
+        self.assertFalse(Event.objects.exists())
+
+
+class SplitLongEventsMigrationTests(SchedulerTestCase):
+    def test_long_event_is_split_into_rows_within_the_bound(self):
+        event = self.create_appointment(self.local(2027, 3, 1, 10), self.local(2027, 3, 1, 11))
+        Event.objects.filter(id=event.id).update(end_datetime=self.local(2027, 5, 1, 11))
+
+        import_module('apps.clinician_dashboard.migrations.0044_split_long_events').split_long_events(apps, None)
+
+        rows = Event.objects.order_by('start_datetime')
+        self.assertEqual(
+            [(row.start_datetime, row.end_datetime) for row in rows],
+            [
+                # 31 days of elapsed time, across the change to daylight saving time
+                (self.local(2027, 3, 1, 10), self.local(2027, 4, 1, 11)),
+                (self.local(2027, 4, 1, 11), self.local(2027, 5, 1, 11)),
+            ]
+        )
+        self.assertEqual(rows[0].id, event.id)
+        self.assertEqual(EventService.objects.filter(event_id=rows[1].id).count(), 1)
@@ -0,0 +1,41 @@
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from apps.clinician_dashboard.tests.base import SchedulerTestCase
+from apps.shared.services.scheduler_service import SchedulerDataService
+
+
+class LastEventsTests(SchedulerTestCase):
+    def last_event_ids(self, event):
+        return [last['id'] for last in SchedulerDataService.get_event_data(event.id)['last_events']]
+
+    def test_two_previous_visits_latest_first(self):
+        first = self.create_appointment(self.local(2027, 3, 1, 10), self.local(2027, 3, 1, 10, 45))
+        second = self.create_appointment(self.local(2027, 3, 8, 10), self.local(2027, 3, 8, 10, 45))
+        third = self.create_appointment(self.local(2027, 3, 15, 10), self.local(2027, 3, 15, 10, 45))
+        fourth = self.create_appointment(self.local(2027, 3, 22, 10), self.local(2027, 3, 22, 10, 45))
+
+        self.assertEqual(self.last_event_ids(fourth), [third.id, second.id])
+        self.assertEqual(self.last_event_ids(second), [first.id])
+        self.assertEqual(self.last_event_ids(first), [])
+
+    def test_event_at_the_same_time_is_not_a_previous_visit(self):
+        earlier = self.create_appointment(self.local(2027, 3, 1, 10), self.local(2027, 3, 1, 10, 45))
+        booked = self.create_appointment(self.local(2027, 3, 8, 10), self.local(2027, 3, 8, 10, 45))
+        double_booked = self.create_appointment(
+            self.local(2027, 3, 8, 10), self.local(2027, 3, 8, 10, 45), AllowConflicts=True
+        )
+
+        self.assertEqual(self.last_event_ids(booked), [earlier.id])
+        self.assertEqual(self.last_event_ids(double_booked), [earlier.id])
+
+    def test_previous_visits_of_many_events_cost_one_query(self):
+        events = [
+            self.create_appointment(self.local(2027, 3, day, 10), self.local(2027, 3, day, 10, 45))
+            for day in (1, 8, 15, 22)
+        ]
+
+        with CaptureQueriesContext(connection) as queries:
+            SchedulerDataService._get_last_events(events)
+
+        self.assertEqual(len(queries), 1)
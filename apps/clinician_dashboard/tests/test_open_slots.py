@@ -0,0 +1,113 @@
+from datetime import datetime, timedelta
+from zoneinfo import ZoneInfo
+
+from apps.clinician_dashboard.models import AppointmentState, Event
+from apps.clinician_dashboard.tests.base import SchedulerTestCase
+from apps.shared.services.availability_service import AvailabilityService
+from apps.shared.services.scheduler_service import SchedulerDataService
+
+
+class SweepTests(SchedulerTestCase):
+    DURATION = timedelta(minutes=45)
+
+    def window(self, day=1):
+        return [(self.local(2027, 3, day, 8), self.local(2027, 3, day, 18))]
+
+    def gaps(self, busy, windows=None, duration=DURATION):
+        return [
+            (gap_start.astimezone(self.TIMEZONE), gap_end.astimezone(self.TIMEZONE))
+            for gap_start, gap_end in AvailabilityService._find_gaps(
+                AvailabilityService._merge(busy), windows or self.window(), duration
+            )
+        ]
+
+    def test_merge_joins_overlapping_and_touching_intervals(self):
+        merged = AvailabilityService._merge([
+            (self.local(2027, 3, 1, 13), self.local(2027, 3, 1, 14)),
+            (self.local(2027, 3, 1, 9), self.local(2027, 3, 1, 10)),
+            (self.local(2027, 3, 1, 9, 30), self.local(2027, 3, 1, 9, 45)),
+            (self.local(2027, 3, 1, 10), self.local(2027, 3, 1, 11)),
+        ])
+
+        self.assertEqual(merged, [
+            (self.local(2027, 3, 1, 9), self.local(2027, 3, 1, 11)),
+            (self.local(2027, 3, 1, 13), self.local(2027, 3, 1, 14)),
+        ])
+
+    def test_busy_intervals_straddling_the_window_edges_are_clipped(self):
+        busy = [
+            (self.local(2027, 3, 1, 7), self.local(2027, 3, 1, 9)),
+            (self.local(2027, 3, 1, 17), self.local(2027, 3, 1, 19)),
+        ]
+
+        self.assertEqual(self.gaps(busy), [(self.local(2027, 3, 1, 9), self.local(2027, 3, 1, 17))])
+
+    def test_gaps_start_on_the_slot_grid(self):
+        busy = [
+            (self.local(2027, 3, 1, 8), self.local(2027, 3, 1, 10, 50)),
+            (self.local(2027, 3, 1, 12), self.local(2027, 3, 1, 17, 20)),
+        ]
+
+        # 17:30 to 18:00 is shorter than the duration
+        self.assertEqual(self.gaps(busy), [(self.local(2027, 3, 1, 11), self.local(2027, 3, 1, 12))])
+
+    def test_busy_interval_spanning_days_blocks_each_window(self):
+        busy = [(self.local(2027, 3, 1, 16), self.local(2027, 3, 2, 9, 5))]
+
+        self.assertEqual(self.gaps(busy, self.window(1) + self.window(2)), [
+            (self.local(2027, 3, 1, 8), self.local(2027, 3, 1, 16)),
+            (self.local(2027, 3, 2, 9, 15), self.local(2027, 3, 2, 18)),
+        ])
+
+
+class OpenSlotTests(SchedulerTestCase):
+    def find(self, start, end, duration=45):
+        utc = ZoneInfo("UTC")
+        return [
+            tuple(
+                datetime.strptime(slot[key], '%Y-%m-%dT%H:%M:%S.000Z').replace(tzinfo=utc).astimezone(self.TIMEZONE)
+                for key in ('start', 'end')
+            )
+            for slot in AvailabilityService.find_open_slots(
+                start.isoformat(), end.isoformat(), AvailabilityService.get_duration(duration),
+                clinician_ids=[self.clinician.id]
+            )
+        ]
+
+    def test_appointment_takes_its_time(self):
+        self.create_appointment(self.local(2027, 3, 1, 10), self.local(2027, 3, 1, 11))
+
+        self.assertEqual(self.find(self.local(2027, 3, 1), self.local(2027, 3, 2)), [
+            (self.local(2027, 3, 1, 8), self.local(2027, 3, 1, 10)),
+            (self.local(2027, 3, 1, 11), self.local(2027, 3, 1, 18)),
+        ])
+
+    def test_canceled_appointment_leaves_the_time_free(self):
+        event = self.create_appointment(self.local(2027, 3, 1, 10), self.local(2027, 3, 1, 11))
+        Event.objects.filter(id=event.id).update(status=AppointmentState.objects.get(name='Canceled'))
+
+        self.assertEqual(
+            self.find(self.local(2027, 3, 1), self.local(2027, 3, 2)),
+            [(self.local(2027, 3, 1, 8), self.local(2027, 3, 1, 18))]
+        )
+
+    def test_out_of_office_blocks_the_time(self):
+        SchedulerDataService.create_event({'eventData': {
+            'eventType': 'OUT_OF_OFFICE',
+            'StartTime': self.local(2027, 3, 1, 8).isoformat(),
+            'EndTime': self.local(2027, 3, 1, 12, 30).isoformat(),
+            'IsAllDay': False,
+            'TeamMember': {'id': self.clinician.id},
+        }})
+
+        self.assertEqual(
+            self.find(self.local(2027, 3, 1), self.local(2027, 3, 2)),
+            [(self.local(2027, 3, 1, 12, 30), self.local(2027, 3, 1, 18))]
+        )
+
+    def test_working_hours_keep_their_local_time_across_dst(self):
+        # Clocks go forward on Sunday 2027-03-14; the weekend has no working hours
+        self.assertEqual(self.find(self.local(2027, 3, 12), self.local(2027, 3, 16)), [
+            (self.local(2027, 3, 12, 8), self.local(2027, 3, 12, 18)),
+            (self.local(2027, 3, 15, 8), self.local(2027, 3, 15, 18)),
+        ])
@@ -0,0 +1,28 @@
+from apps.clinician_dashboard.models import Patient, PatientSearchToken
+from apps.clinician_dashboard.tests.base import SchedulerTestCase
+from apps.shared.services.patient_search_service import PatientSearchService
+
+
+class PatientIndexingTests(SchedulerTestCase):
+    def get_token_ids(self):
+        return set(PatientSearchToken.objects.filter(patient=self.patient).values_list('id', flat=True))
+
+    def test_new_patient_is_found(self):
+        patient = Patient.objects.create(first_name='Zoë', last_name='Park', email='zp@example.com', login_id='zp')
+
+        self.assertEqual([found['id'] for found in PatientSearchService.search('zoe pa')], [patient.id])
+
+    def test_edit_of_a_field_not_searched_keeps_tokens(self):
+        token_ids = self.get_token_ids()
+
+        self.patient.phone = '555-0100'
+        self.patient.save()
+
+        self.assertEqual(self.get_token_ids(), token_ids)
+
+    def test_email_change_reindexes(self):
+        self.patient.email = 'psmith@clinic.org'
+        self.patient.save()
+
+        self.assertEqual([found['id'] for found in PatientSearchService.search('clinic')], [self.patient.id])
+        self.assertEqual(PatientSearchService.search('example'), [])
@@ -0,0 +1,75 @@
+from datetime import datetime, timedelta
+from zoneinfo import ZoneInfo
+
+from django.forms import ValidationError
+from django.test import SimpleTestCase, override_settings
+
+from apps.shared.services.recurrence_service import RecurrenceService
+
+
+class RecurrenceRuleTests(SimpleTestCase):
+    TIMEZONE = ZoneInfo("America/New_York")
+
+    def setUp(self):
+        RecurrenceService.clear_cache()
+
+    def local(self, *args) -> datetime:
+        return datetime(*args, tzinfo=self.TIMEZONE)
+
+    @override_settings(SCHEDULER_RECURRENCE_HORIZON_DAYS=30)
+    def test_open_ended_rule_stops_at_the_horizon(self):
+        starts = RecurrenceService.expand('FREQ=DAILY;INTERVAL=1', self.local(2027, 1, 1, 9))
+
+        self.assertEqual(len(starts), 30)
+        self.assertLess(starts[-1], self.local(2027, 1, 1, 9) + timedelta(days=30))
+
+    def test_expansion_is_limited_to_the_window(self):
+        starts = RecurrenceService.expand(
+            'FREQ=WEEKLY;INTERVAL=1;BYDAY=MO', self.local(2027, 1, 4, 9), self.local(2027, 2, 1), self.local(2027, 2, 15)
+        )
+
+        self.assertEqual(starts, [self.local(2027, 2, 1, 9), self.local(2027, 2, 8, 9)])
+
+    def test_until_date_includes_its_whole_day(self):
+        starts = RecurrenceService.expand('FREQ=DAILY;INTERVAL=1;UNTIL=20270105', self.local(2027, 1, 1, 18))
+
+        self.assertEqual(starts[-1], self.local(2027, 1, 5, 18))
+
+    def test_exdate_skips_occurrences(self):
+        starts = RecurrenceService.expand(
+            'FREQ=DAILY;INTERVAL=1;COUNT=5;EXDATE=20270102,20270104T090000', self.local(2027, 1, 1, 9)
+        )
+
+        self.assertEqual([start.day for start in starts], [1, 3, 5])
+
+    def test_occurrences_keep_their_local_time_across_dst(self):
+        # Clocks go back on 2027-11-07
+        starts = RecurrenceService.expand('FREQ=WEEKLY;INTERVAL=1;COUNT=3', self.local(2027, 10, 31, 10))
+
+        self.assertEqual([start.hour for start in starts], [10, 10, 10])
+        utc = ZoneInfo("UTC")
+        self.assertEqual(starts[1].astimezone(utc) - starts[0].astimezone(utc), timedelta(days=7, hours=1))
+
+    def test_next_occurrence_is_none_once_the_series_ends(self):
+        rule = 'FREQ=DAILY;INTERVAL=1;COUNT=3'
+
+        self.assertEqual(
+            RecurrenceService.get_next_occurrence(rule, self.local(2027, 1, 1, 9), self.local(2027, 1, 2, 12)),
+            self.local(2027, 1, 3, 9)
+        )
+        self.assertIsNone(RecurrenceService.get_next_occurrence(rule, self.local(2027, 1, 1, 9), self.local(2027, 1, 4)))
+
+    def test_rules_that_never_occur_are_rejected(self):
+        for rule in ('FREQ=MONTHLY;BYMONTHDAY=31;BYMONTH=2,4', 'FREQ=MONTHLY;BYMONTHDAY=0', 'FREQ=YEARLY;BYMONTH=13'):
+            with self.subTest(rule=rule), self.assertRaises(ValidationError):
+                RecurrenceService.expand(rule, self.local(2027, 1, 1, 9))
+
+    def test_unsupported_frequency_is_rejected(self):
+        with self.assertRaises(ValidationError):
+            RecurrenceService.compile('FREQ=HOURLY;INTERVAL=1', self.local(2027, 1, 1, 9))
+
+    def test_continued_rule_ends_where_the_series_did(self):
+        rule = RecurrenceService.continue_rule('FREQ=WEEKLY;COUNT=3;BYDAY=MO', self.local(2027, 1, 4, 9))
+
+        self.assertEqual(rule, 'FREQ=WEEKLY;UNTIL=20270118;BYDAY=MO')
+        self.assertEqual(RecurrenceService.continue_rule('FREQ=DAILY', self.local(2027, 1, 4, 9)), 'FREQ=DAILY')
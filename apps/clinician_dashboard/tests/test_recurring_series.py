@@ -0,0 +1,47 @@
+from apps.clinician_dashboard.models import Event
+from apps.clinician_dashboard.tests.base import SchedulerTestCase
+from apps.shared.services.availability_service import SchedulingConflictError
+
+
+class MaterializedSeriesTests(SchedulerTestCase):
+    RULE = 'FREQ=WEEKLY;INTERVAL=1;BYDAY=MO;COUNT=4'
+
+    def test_evening_occurrences_are_dated_in_local_time(self):
+        # 20:00 in New York is already the next day in UTC
+        series = self.create_appointment(self.local(2027, 3, 1, 20), self.local(2027, 3, 1, 20, 45), self.RULE)
+
+        occurrences = Event.objects.filter(parent_event=series).order_by('start_datetime')
+        self.assertEqual(
+            [occurrence.occurrence_date for occurrence in occurrences],
+            [start.date() for start in self.local_starts(occurrences)]
+        )
+
+    def test_occurrences_keep_their_local_time_across_dst(self):
+        # Clocks go forward on 2027-03-14
+        series = self.create_appointment(self.local(2027, 3, 1, 10), self.local(2027, 3, 1, 10, 45), self.RULE)
+
+        starts = self.local_starts(Event.objects.filter(parent_event=series))
+        self.assertEqual([(start.day, start.hour) for start in starts], [(8, 10), (15, 10), (22, 10)])
+
+    def test_booking_after_dst_conflicts_with_stored_occurrence(self):
+        self.create_appointment(self.local(2027, 3, 1, 10), self.local(2027, 3, 1, 10, 45), self.RULE)
+
+        with self.assertRaises(SchedulingConflictError):
+            self.create_appointment(self.local(2027, 3, 22, 10), self.local(2027, 3, 22, 10, 45))
+
+    def test_series_booked_before_dst_conflicts_with_event_after_it(self):
+        self.create_appointment(self.local(2027, 3, 22, 10), self.local(2027, 3, 22, 10, 45))
+
+        with self.assertRaises(SchedulingConflictError):
+            self.create_appointment(self.local(2027, 3, 1, 10), self.local(2027, 3, 1, 10, 45), self.RULE)
+
+    def test_open_ended_series_is_checked_inside_materialization_window_only(self):
+        # A year past the series start, well beyond the six months stored
+        self.create_appointment(self.local(2028, 3, 6, 10), self.local(2028, 3, 6, 10, 45))
+
+        series = self.create_appointment(
+            self.local(2027, 3, 1, 10), self.local(2027, 3, 1, 10, 45), 'FREQ=WEEKLY;INTERVAL=1;BYDAY=MO'
+        )
+
+        last_start = self.local_starts(Event.objects.filter(parent_event=series))[-1]
+        self.assertLess(last_start, self.local(2028, 3, 6))
@@ -0,0 +1,36 @@
+from io import StringIO
+from unittest import mock
+
+from django.core.management import call_command
+from django.db import OperationalError
+from django.test import SimpleTestCase
+
+
+class StopWorker(BaseException):
+    """Ends the worker loop from a test, as the signal handler would"""
+
+
+class SchedulerWorkerTests(SimpleTestCase):
+    def run_worker(self, outcomes, *args):
+        sleeps = []
+        with mock.patch('apps.shared.services.job_service.JobService.run_pending', side_effect=outcomes), \
+                mock.patch('apps.clinician_dashboard.management.commands.run_scheduler_worker.time.sleep',
+                           side_effect=sleeps.append), \
+                mock.patch('apps.clinician_dashboard.management.commands.run_scheduler_worker.signal.signal'), \
+                mock.patch('apps.clinician_dashboard.management.commands.run_scheduler_worker.close_old_connections'):
+            with self.assertRaises(StopWorker):
+                call_command('run_scheduler_worker', *args, stdout=StringIO(), stderr=StringIO())
+        return sleeps
+
+    def test_failures_back_off_and_the_worker_keeps_running(self):
+        with self.assertLogs('apps.clinician_dashboard.management.commands.run_scheduler_worker', 'ERROR') as logs:
+            sleeps = self.run_worker([OperationalError, OperationalError, 3, 0, StopWorker])
+
+        self.assertEqual(sleeps, [2.0, 4.0, 1.0])
+        self.assertEqual(len(logs.records), 2)
+
+    def test_backoff_is_capped(self):
+        with self.assertLogs('apps.clinician_dashboard.management.commands.run_scheduler_worker', 'ERROR'):
+            sleeps = self.run_worker([OperationalError] * 4 + [StopWorker], '--max-backoff', '5')
+
+        self.assertEqual(sleeps, [2.0, 4.0, 5.0, 5.0])
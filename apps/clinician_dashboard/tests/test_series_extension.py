@@ -0,0 +1,106 @@
+from datetime import datetime
+from io import StringIO
+from unittest import mock
+from zoneinfo import ZoneInfo
+
+from django.core.management import call_command
+
+from apps.clinician_dashboard.models import Event
+from apps.clinician_dashboard.tests.base import SchedulerTestCase
+from apps.shared.services.scheduler_service import SchedulerDataService
+
+
+class SeriesExtensionTests(SchedulerTestCase):
+    RULE = 'FREQ=WEEKLY;INTERVAL=1;BYDAY=MO'
+
+    def setUp(self):
+        super().setUp()
+        self.series = self.create_appointment(self.local(2027, 3, 1, 9), self.local(2027, 3, 1, 9, 45), self.RULE)
+
+    def extend_on(self, now: datetime) -> str:
+        """Run the nightly command as if it were now"""
+        out = StringIO()
+        with mock.patch('django.utils.timezone.now', return_value=now.astimezone(ZoneInfo("UTC"))):
+            call_command('extend_recurring_series', stdout=out)
+        return out.getvalue()
+
+    def get_last_start(self, parent: Event) -> datetime:
+        return self.local_starts(Event.objects.filter(parent_event=parent))[-1]
+
+    def test_command_stores_occurrences_coming_inside_the_window(self):
+        last_start = self.get_last_start(self.series)
+
+        output = self.extend_on(self.local(2027, 5, 1))
+
+        self.assertIn('Created', output)
+        self.assertGreater(self.get_last_start(self.series), last_start)
+        self.series.refresh_from_db()
+        self.assertGreaterEqual(self.series.materialized_until, self.local(2027, 11, 1))
+
+    def test_series_keeps_extending_after_its_parent_is_edited_alone(self):
+        SchedulerDataService.update_event(self.series.id, self.appointment_data(
+            self.local(2027, 3, 1, 14), self.local(2027, 3, 1, 14, 45), editType='occurrence'
+        ))
+        self.series.refresh_from_db()
+        continuing = Event.objects.get(parent_event__isnull=True, recurrence_rule__isnull=False)
+        last_start = self.get_last_start(continuing)
+
+        self.extend_on(self.local(2027, 5, 1))
+
+        self.assertIsNone(self.series.materialized_until)
+        self.assertGreater(self.get_last_start(continuing), last_start)
+
+    def test_failing_series_does_not_stop_the_others(self):
+        broken = self.create_appointment(
+            self.local(2027, 3, 2, 9), self.local(2027, 3, 2, 9, 45), 'FREQ=WEEKLY;INTERVAL=1;BYDAY=TU'
+        )
+        Event.objects.filter(id=broken.id).update(recurrence_rule='FREQ=HOURLY')
+        last_start = self.get_last_start(self.series)
+
+        with mock.patch('builtins.print'):
+            self.extend_on(self.local(2027, 5, 1))
+
+        self.assertGreater(self.get_last_start(self.series), last_start)
+
+
+class CountedSeriesTests(SchedulerTestCase):
+    # Runs past the first six months stored, so it is extended later
+    RULE = 'FREQ=WEEKLY;INTERVAL=1;BYDAY=MO;COUNT=40'
+
+    def setUp(self):
+        super().setUp()
+        self.series = self.create_appointment(self.local(2027, 3, 1, 9), self.local(2027, 3, 1, 9, 45), self.RULE)
+        self.last_start = self.local(2027, 11, 29, 9)
+
+    def extend(self):
+        with mock.patch('django.utils.timezone.now', return_value=self.local(2027, 7, 1)):
+            SchedulerDataService.extend_recurring_series()
+
+    def assert_series_ends_in_place(self, count):
+        starts = self.local_starts(Event.objects.filter(recurrence_rule__isnull=False))
+        self.assertEqual(len(starts), count)
+        self.assertEqual(starts[-1], self.last_start)
+
+    def test_promoted_parent_of_a_deleted_parent_ends_where_the_series_did(self):
+        SchedulerDataService.delete_event(self.series.id, 'single')
+        self.extend()
+
+        self.assert_series_ends_in_place(39)
+        self.assertNotIn('COUNT', Event.objects.get(parent_event__isnull=True).recurrence_rule)
+
+    def test_promoted_parent_of_an_edited_parent_ends_where_the_series_did(self):
+        SchedulerDataService.update_event(self.series.id, self.appointment_data(
+            self.local(2027, 3, 1, 14), self.local(2027, 3, 1, 14, 45), editType='occurrence'
+        ))
+        self.extend()
+
+        self.assert_series_ends_in_place(39)
+
+    def test_split_series_ends_where_the_series_did(self):
+        third = Event.objects.get(parent_event=self.series, start_datetime=self.local(2027, 3, 15, 9))
+        SchedulerDataService.update_event(third.id, self.appointment_data(
+            self.local(2027, 3, 15, 9), self.local(2027, 3, 15, 9, 45), self.RULE, editType='series', Subject='Moved'
+        ))
+        self.extend()
+
+        self.assert_series_ends_in_place(40)
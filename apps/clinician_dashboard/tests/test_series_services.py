@@ -0,0 +1,55 @@
+from apps.clinician_dashboard.models import Event, EventService
+from apps.clinician_dashboard.tests.base import SchedulerTestCase
+from apps.shared.services.scheduler_service import SchedulerDataService
+
+
+class SeriesServicesTests(SchedulerTestCase):
+    RULE = 'FREQ=WEEKLY;INTERVAL=1;BYDAY=MO;COUNT=3'
+
+    def setUp(self):
+        super().setUp()
+        self.series = self.create_appointment(self.local(2027, 3, 1, 9), self.local(2027, 3, 1, 9, 45), self.RULE)
+        self.first, self.second = Event.objects.filter(parent_event=self.series).order_by('start_datetime')
+
+    def get_fees(self, event):
+        return [float(service['fee']) for service in SchedulerDataService.get_event_data(event.id)['services']]
+
+    def edit(self, event, fee, edit_type='single'):
+        start = event.start_datetime.astimezone(self.TIMEZONE)
+        data = self.appointment_data(start, start + (event.end_datetime - event.start_datetime), self.RULE,
+                                     editType=edit_type)
+        data['eventData']['Services'][0]['fee'] = fee
+        SchedulerDataService.update_event(event.id, data)
+
+    def test_occurrences_inherit_the_series_services(self):
+        self.assertFalse(EventService.objects.filter(event__parent_event=self.series).exists())
+        self.assertEqual(self.get_fees(self.first), [100.0])
+
+    def test_unchanged_services_keep_the_occurrence_inheriting(self):
+        self.edit(self.first, 100)
+
+        self.first.refresh_from_db()
+        self.assertTrue(self.first.inherits_services)
+        self.assertFalse(EventService.objects.filter(event=self.first).exists())
+
+    def test_occurrence_edit_copies_its_services(self):
+        self.edit(self.first, 80)
+
+        self.first.refresh_from_db()
+        self.assertFalse(self.first.inherits_services)
+        self.assertEqual(self.get_fees(self.first), [80.0])
+        self.assertEqual(self.get_fees(self.second), [100.0])
+        self.assertEqual(self.get_fees(self.series), [100.0])
+
+    def test_parent_edit_pins_the_services_of_its_occurrences(self):
+        self.edit(self.series, 120)
+
+        self.assertEqual(self.get_fees(self.series), [120.0])
+        self.assertEqual(self.get_fees(self.first), [100.0])
+        self.assertEqual(self.get_fees(self.second), [100.0])
+
+    def test_series_edit_reaches_inheriting_occurrences(self):
+        self.edit(self.series, 120, 'series')
+
+        self.assertEqual(self.get_fees(self.first), [120.0])
+        self.assertEqual(self.get_fees(self.second), [120.0])
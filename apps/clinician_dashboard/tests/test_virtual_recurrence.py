@@ -0,0 +1,70 @@
+from datetime import datetime
+from zoneinfo import ZoneInfo
+
+from django.test import override_settings
+
+from apps.clinician_dashboard.models import Event, EventExclusion
+from apps.clinician_dashboard.tests.base import SchedulerTestCase
+from apps.shared.services.scheduler_service import SchedulerDataService
+
+
+@override_settings(SCHEDULER_VIRTUAL_RECURRENCE=True)
+class VirtualRecurrenceTests(SchedulerTestCase):
+    RULE = 'FREQ=WEEKLY;INTERVAL=1;BYDAY=MO'
+
+    def setUp(self):
+        super().setUp()
+        self.series = self.create_appointment(self.local(2027, 1, 4, 10), self.local(2027, 1, 4, 10, 45), self.RULE)
+
+    def get_march(self):
+        return SchedulerDataService.get_events(
+            'ADMIN', self.admin_login.id, self.local(2027, 3, 1), self.local(2027, 4, 1)
+        )
+
+    def local_start(self, event_dict) -> datetime:
+        utc = datetime.strptime(event_dict['StartTime'], '%Y-%m-%dT%H:%M:%S.000Z').replace(tzinfo=ZoneInfo("UTC"))
+        return utc.astimezone(self.TIMEZONE)
+
+    def test_series_is_stored_as_one_row(self):
+        self.assertTrue(self.series.is_virtual_series)
+        self.assertFalse(Event.objects.filter(parent_event=self.series).exists())
+
+    def test_occurrences_are_expanded_inside_the_window_only(self):
+        events = self.get_march()
+
+        self.assertEqual(
+            [event['Id'] for event in events],
+            [f"{self.series.id}_202703{day:02d}" for day in (1, 8, 15, 22, 29)]
+        )
+
+    def test_occurrences_keep_their_local_time_across_dst(self):
+        starts = [self.local_start(event) for event in self.get_march()]
+
+        self.assertEqual({(start.hour, start.minute) for start in starts}, {(10, 0)})
+
+    def test_deleted_occurrence_is_excluded(self):
+        SchedulerDataService.delete_event(f"{self.series.id}_20270308", 'single')
+
+        self.assertTrue(EventExclusion.objects.filter(parent_event=self.series).exists())
+        self.assertNotIn(f"{self.series.id}_20270308", [event['Id'] for event in self.get_march()])
+
+    def test_edited_occurrence_is_stored_as_an_exception(self):
+        SchedulerDataService.update_event(f"{self.series.id}_20270315", self.appointment_data(
+            self.local(2027, 3, 15, 14), self.local(2027, 3, 15, 14, 45), self.RULE, editType='single'
+        ))
+
+        exception = Event.objects.get(parent_event=self.series)
+        self.assertEqual(exception.start_datetime, self.local(2027, 3, 15, 14))
+        events = self.get_march()
+        self.assertEqual(len(events), 5)
+        self.assertIn(exception.id, [event['Id'] for event in events])
+        self.assertNotIn(f"{self.series.id}_20270315", [event['Id'] for event in events])
+
+    def test_series_edit_from_an_occurrence_splits_the_series(self):
+        SchedulerDataService.update_event(f"{self.series.id}_20270315", self.appointment_data(
+            self.local(2027, 3, 15, 11), self.local(2027, 3, 15, 11, 45), self.RULE, editType='series'
+        ))
+
+        starts = [self.local_start(event) for event in self.get_march()]
+        self.assertEqual([start.hour for start in starts], [10, 10, 11, 11, 11])
+        self.assertEqual(Event.objects.filter(is_virtual_series=True, parent_event__isnull=True).count(), 2)
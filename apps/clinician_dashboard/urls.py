@@ -6,14 +6,19 @@ app_name = 'clinician_dashboard'
 urlpatterns = [
     path('', views.DashboardView.as_view(), name='dashboard'),
     path('api/get_events/', views.GetEventsView.as_view(), name='get_events'),
+    path('api/clients/', views.ClientDirectoryView.as_view(), name='client_directory'),
     path('api/clients/search/', views.ClientSearchView.as_view(), name='client_search'),
     path('api/locations/search/', views.LocationSearchView.as_view(), name='location_search'),
     path('api/get_client_clinicians/<int:client_id>/', views.GetClientCliniciansView.as_view(), name='get_client_clinicians'),
     path('api/clinicians/search/', views.ClinicianSearchView.as_view(), name='clinician_search'),
+    path('api/open_slots/search/', views.OpenSlotSearchView.as_view(), name='open_slot_search'),
     path('api/get_clinician_services/<int:clinician_id>/<int:patient_id>/', views.GetClinicianServicesView.as_view(), name='get_clinician_services'),
     path('api/get_clinician_locations/<int:clinician_id>/', views.GetClinicianLocationsView.as_view(), name='get_clinician_locations'),
-    path('api/get_event_data/<int:event_id>/', views.GetEventDataView.as_view(), name='get_event_data'),
+    path('api/get_event_data/<str:event_id>/', views.GetEventDataView.as_view(), name='get_event_data'),
+    path('api/get_events_data/', views.GetEventsDataView.as_view(), name='get_events_data'),
     path('api/get_appointment_states/', views.GetAppointmentStatesView.as_view(), name='get_appointment_states'),
+    path('api/bootstrap/', views.BootstrapView.as_view(), name='bootstrap'),
+    path('api/get_job_status/<int:job_id>/', views.GetJobStatusView.as_view(), name='get_job_status'),
     path('notes/<int:event_id>/', views.GetEventDetailsDataView.as_view(), name='get_event_details'),
     path('notes/<int:event_id>/api/notes/', views.GetEventNotesDataView.as_view(), name='get_event_notes'),
     path('notes/<int:event_id>/api/notes/save/', views.SaveEventNoteView.as_view(), name='save_event_note'),
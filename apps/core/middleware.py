@@ -0,0 +1,132 @@
+import json
+import logging
+import time
+from contextvars import ContextVar
+from typing import Optional
+
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+from django.db import connections
+
+logger = logging.getLogger(__name__)
+
+
+class RequestTimings:
+    """Query, database time and cache counters of one request"""
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.queries = 0
+        self.db_seconds = 0.0
+        self.cache_hits = 0
+        self.cache_misses = 0
+
+    def __call__(self, execute, sql, params, many, context):
+        """Database execute wrapper"""
+        started = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.queries += 1
+            self.db_seconds += time.perf_counter() - started
+
+    def as_dict(self):
+        total_ms = (time.perf_counter() - self.started) * 1000
+        db_ms = self.db_seconds * 1000
+        return {
+            'total_ms': round(total_ms, 2),
+            'db_ms': round(db_ms, 2),
+            'app_ms': round(total_ms - db_ms, 2),
+            'queries': self.queries,
+            'cache_hits': self.cache_hits,
+            'cache_misses': self.cache_misses,
+        }
+
+
+_current_timings: ContextVar[Optional[RequestTimings]] = ContextVar('request_timings', default=None)
+
+
+def record_cache_lookup(hit: bool) -> None:
+    """Count a cache lookup against the current request; does nothing outside timed requests"""
+    timings = _current_timings.get()
+    if timings is not None:
+        if hit:
+            timings.cache_hits += 1
+        else:
+            timings.cache_misses += 1
+
+
+class RequestTimingMiddleware:
+    """
+    Report queries, database time, cache hits and Python time of every request
+
+    Adds a Server-Timing header and logs one JSON line per request tagged with the view name.
+    Only counts and durations are exposed, never SQL. Disabled unless REQUEST_TIMING is set,
+    in which case Django drops the middleware at startup and requests pay nothing.
+
+    Streamed responses run most of their queries after the headers are sent, so their header
+    only covers the work done before streaming; the log line is written once streaming ends
+    and covers everything.
+    """
+
+    def __init__(self, get_response):
+        if not getattr(settings, 'REQUEST_TIMING', False):
+            raise MiddlewareNotUsed
+        self.get_response = get_response
+        self.send_header = getattr(settings, 'REQUEST_TIMING_HEADER', True)
+
+    def __call__(self, request):
+        timings = RequestTimings()
+        token = _current_timings.set(timings)
+        for connection in connections.all():
+            connection.execute_wrappers.append(timings)
+        try:
+            response = self.get_response(request)
+        except Exception:
+            self._finish(request, timings, None)
+            raise
+        finally:
+            _current_timings.reset(token)
+
+        if self.send_header:
+            response['Server-Timing'] = self._format_header(timings.as_dict())
+
+        if response.streaming:
+            response.streaming_content = self._finish_after_streaming(
+                request, response, timings, response.streaming_content
+            )
+        else:
+            self._finish(request, timings, response)
+        return response
+
+    def _finish_after_streaming(self, request, response, timings, content):
+        token = _current_timings.set(timings)
+        try:
+            yield from content
+        finally:
+            _current_timings.reset(token)
+            self._finish(request, timings, response)
+
+    def _finish(self, request, timings, response):
+        for connection in connections.all():
+            if timings in connection.execute_wrappers:
+                connection.execute_wrappers.remove(timings)
+
+        match = getattr(request, 'resolver_match', None)
+        logger.info(json.dumps({
+            'event': 'request_timing',
+            'view': match.view_name if match else None,
+            'method': request.method,
+            'path': request.path,
+            'status': response.status_code if response is not None else 500,
+            **timings.as_dict(),
+        }))
+
+    @staticmethod
+    def _format_header(values):
+        return ', '.join([
+            f"db;dur={values['db_ms']};desc=\"{values['queries']} queries\"",
+            f"app;dur={values['app_ms']}",
+            f"cache;desc=\"{values['cache_hits']} hits, {values['cache_misses']} misses\"",
+            f"total;dur={values['total_ms']}",
+        ])
@@ -0,0 +1,477 @@
+import statistics
+import time
+import tracemalloc
+from datetime import datetime, timedelta
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from zoneinfo import ZoneInfo
+
+from django.conf import settings
+from django.db import connection
+from django.utils import timezone
+
+from apps.accounts.models import Login
+from apps.clinician_dashboard.models import CareTeam, Clinician, Event, EventNote, EventService, NoteTemplate, Patient, PhsycotherapyNote, PracticeService
+from apps.shared.services.availability_service import AvailabilityService
+from apps.shared.services.event_notes_service import EventNotesService
+from apps.shared.services.job_service import JobService
+from apps.shared.services.recurrence_service import RecurrenceService
+from apps.shared.services.reference_cache_service import ReferenceCacheService
+from apps.shared.services.scheduler_service import SchedulerDataService
+from apps.shared.services.service_price_service import ServicePriceService
+
+
+class _QueryCounter:
+    """Database execute wrapper counting queries"""
+
+    def __init__(self):
+        self.count = 0
+
+    def __call__(self, execute, sql, params, many, context):
+        self.count += 1
+        return execute(sql, params, many, context)
+
+
+class BenchmarkService:
+    """
+    Scheduler benchmark suite, run against a practice created by the seed_practice command
+
+    Every benchmark returns a (setup, run, cleanup) triple of callables; only run is measured. Queued
+    jobs (recurring event materialization) are run inline and counted. Peak memory is taken in one
+    extra run of its own, since tracing allocations would skew the timed runs.
+    """
+
+    TIMEZONE = ZoneInfo("America/New_York")
+
+    # Name of each benchmark and the method building it, in run order
+    BENCHMARKS = [
+        ('get_events_clinician_week', '_bench_get_events_clinician_week'),
+        ('get_events_admin_month', '_bench_get_events_admin_month'),
+        ('create_event_recurring', '_bench_create_event_recurring'),
+        ('update_event_series', '_bench_update_event_series'),
+        ('delete_event_all', '_bench_delete_event_all'),
+        ('delete_series_with_notes', '_bench_delete_series_with_notes'),
+        ('search_clients', '_bench_search_clients'),
+        ('dashboard_reference_data', '_bench_dashboard_reference_data'),
+        ('client_clinicians', '_bench_client_clinicians'),
+        ('clinician_services', '_bench_clinician_services'),
+        ('service_rates_batch', '_bench_service_rates_batch'),
+        ('find_open_slots_four_weeks', '_bench_find_open_slots_four_weeks'),
+        ('find_conflicts_single', '_bench_find_conflicts_single'),
+        ('find_conflicts_series', '_bench_find_conflicts_series'),
+        ('get_event_details', '_bench_get_event_details'),
+        ('recurrence_compile', '_bench_recurrence_compile'),
+        ('recurrence_expand_month', '_bench_recurrence_expand_month'),
+        ('recurrence_expand_open_ended', '_bench_recurrence_expand_open_ended'),
+    ]
+
+    # Occurrences of the series created by write benchmarks
+    SERIES_LENGTH = 52
+
+    # Occurrences of the noted series deleted by delete_series_with_notes
+    NOTED_SERIES_LENGTH = 500
+
+    # Occurrences of the two year weekly series checked by find_conflicts_series
+    CONFLICT_SERIES_LENGTH = 104
+
+    #region measuring
+
+    @classmethod
+    def _call_and_wait(cls, func: Callable[[], Any]) -> Any:
+        """Call func and run the jobs it queued"""
+        result = func()
+        JobService.run_pending()
+        return result
+
+    @classmethod
+    def measure(cls, func: Callable[[], Any]) -> Dict[str, float]:
+        """Wall time and query count of one call"""
+        counter = _QueryCounter()
+        with connection.execute_wrapper(counter):
+            started = time.perf_counter()
+            cls._call_and_wait(func)
+            wall = time.perf_counter() - started
+        return {'wall_ms': wall * 1000, 'queries': counter.count}
+
+    @classmethod
+    def measure_memory(cls, func: Callable[[], Any]) -> float:
+        """
+        Peak Python memory of one call, in KB
+
+        Kept apart from measure: tracing every allocation slows the call down several times.
+        """
+        tracemalloc.start()
+        try:
+            cls._call_and_wait(func)
+            return tracemalloc.get_traced_memory()[1] / 1024
+        finally:
+            tracemalloc.stop()
+
+    @classmethod
+    def _run_once(cls, context: Dict[str, Any], method: str, measure: Callable[[Callable[[], Any]], Any]) -> Any:
+        """Set up a fresh benchmark, measure its run and clean up after it"""
+        setup, func, cleanup = getattr(cls, method)(context)
+        state = cls._call_and_wait(setup)
+        try:
+            return measure(lambda: func(state))
+        finally:
+            cls._call_and_wait(lambda: cleanup(state))
+
+    @classmethod
+    def _summarize(cls, runs: List[Dict[str, float]], peak_kb: float) -> Dict[str, Any]:
+        walls = sorted(run['wall_ms'] for run in runs)
+        return {
+            'runs': len(runs),
+            'wall_ms': {
+                'min': round(walls[0], 2),
+                'median': round(statistics.median(walls), 2),
+                'max': round(walls[-1], 2),
+            },
+            'queries': max(run['queries'] for run in runs),
+            'peak_kb': round(peak_kb, 1),
+        }
+
+    #endregion measuring
+
+    #region suite
+
+    @classmethod
+    def _get_context(cls, prefix: str) -> Dict[str, Any]:
+        """Pick the seeded records the benchmarks work on"""
+        clinicians = Clinician.objects.filter(
+            login_id__in=Login.objects.filter(email__startswith=f"{prefix}-clinician-").values('id')
+        ).order_by('id')
+        clinician = clinicians.first()
+        if clinician is None:
+            raise ValueError(f"No practice seeded with prefix '{prefix}', run seed_practice first")
+
+        care_team = CareTeam.objects.filter(clinician=clinician).select_related('patient').order_by('id').first()
+        noted_event_id = EventNote.objects.filter(event__clinician=clinician).values_list('event_id', flat=True).first()
+        today = timezone.now().astimezone(cls.TIMEZONE).replace(hour=0, minute=0, second=0, microsecond=0)
+        week_start = today - timedelta(days=today.weekday())
+        return {
+            'clinician': clinician,
+            'clinician_ids': list(clinicians.values_list('id', flat=True)),
+            'patient': care_team.patient,
+            'location_id': clinician.locations.values_list('id', flat=True).first(),
+            'service': PracticeService.objects.filter(code__startswith=f"{prefix}-").order_by('id').first(),
+            'noted_event_id': noted_event_id,
+            'week': (week_start, week_start + timedelta(days=7)),
+            'month': (today.replace(day=1), (today.replace(day=1) + timedelta(days=32)).replace(day=1)),
+        }
+
+    @classmethod
+    def run(cls, prefix: str = 'seed', repeat: int = 5, only: Optional[List[str]] = None) -> Dict[str, Any]:
+        """Run the suite and build the report"""
+        context = cls._get_context(prefix)
+        ReferenceCacheService.reset_stats()
+        results = {}
+        for name, method in cls.BENCHMARKS:
+            if only and name not in only:
+                continue
+            # The first run warms per-process caches and is not reported
+            runs = [cls._run_once(context, method, cls.measure) for _ in range(repeat + 1)]
+            peak_kb = cls._run_once(context, method, cls.measure_memory)
+            results[name] = cls._summarize(runs[1:], peak_kb)
+
+        return {
+            'created_at': timezone.now().isoformat(),
+            'database': connection.vendor,
+            'settings': {
+                'SCHEDULER_VIRTUAL_RECURRENCE': getattr(settings, 'SCHEDULER_VIRTUAL_RECURRENCE', False),
+            },
+            'data': {
+                'events': Event.objects.count(),
+                'patients': Patient.objects.count(),
+                'clinicians': Clinician.objects.count(),
+            },
+            'repeat': repeat,
+            'results': results,
+            'reference_cache': ReferenceCacheService.get_stats(),
+        }
+
+    @classmethod
+    def compare(cls, report: Dict[str, Any], baseline: Dict[str, Any]) -> List[Tuple[str, str, float, float]]:
+        """Median wall time and query count changes against an earlier report, as (benchmark, metric, before, after)"""
+        changes = []
+        for name, result in report['results'].items():
+            previous = baseline.get('results', {}).get(name)
+            if previous:
+                changes.append((name, 'wall_ms', previous['wall_ms']['median'], result['wall_ms']['median']))
+                changes.append((name, 'queries', previous['queries'], result['queries']))
+        return changes
+
+    #endregion suite
+
+    #region benchmarks
+
+    @staticmethod
+    def _nothing(state=None):
+        return None
+
+    @classmethod
+    def _iso(cls, value: datetime) -> str:
+        return value.astimezone(ZoneInfo("UTC")).strftime('%Y-%m-%dT%H:%M:%S.000Z')
+
+    @classmethod
+    def _appointment_data(cls, context: Dict[str, Any], start: datetime, **extra) -> Dict[str, Any]:
+        """Appointment payload as sent by the scheduler editor"""
+        event_data = {
+            'eventType': 'APPOINTMENT',
+            'StartTime': cls._iso(start),
+            'EndTime': cls._iso(start + timedelta(minutes=45)),
+            'IsAllDay': False,
+            'Client': {'id': context['patient'].id},
+            'Clinician': {'id': context['clinician'].id},
+            'Location': {'id': context['location_id']},
+            'Services': [{'serviceId': context['service'].id, 'fee': context['service'].rate, 'modifiers': []}],
+            'AppointmentTotal': context['service'].rate,
+            'StateId': 1,
+        }
+        event_data.update(extra)
+        return {'eventData': event_data}
+
+    @classmethod
+    def _series_start(cls) -> datetime:
+        """A Sunday evening slot a year ahead, away from seeded appointments"""
+        start = timezone.now().astimezone(cls.TIMEZONE).replace(hour=21, minute=0, second=0, microsecond=0) + timedelta(days=365)
+        return start + timedelta(days=(6 - start.weekday()) % 7)
+
+    @classmethod
+    def _series_rule(cls, start: datetime) -> str:
+        return f"FREQ=WEEKLY;INTERVAL=1;BYDAY=SU;COUNT={cls.SERIES_LENGTH};DTSTART={cls._iso(start)}"
+
+    @classmethod
+    def _create_series(cls, context: Dict[str, Any]) -> Dict[str, Any]:
+        start = cls._series_start()
+        return SchedulerDataService.create_event(
+            cls._appointment_data(context, start, RecurrenceRule=cls._series_rule(start))
+        )
+
+    @classmethod
+    def _delete_series(cls, context: Dict[str, Any]) -> None:
+        """Delete every series the write benchmarks left in their slot"""
+        start = cls._series_start()
+        for parent_id in Event.objects.filter(
+            clinician=context['clinician'],
+            parent_event__isnull=True,
+            start_datetime__gte=start,
+            start_datetime__lt=start + timedelta(weeks=cls.SERIES_LENGTH + 1)
+        ).values_list('id', flat=True):
+            SchedulerDataService.delete_event(parent_id, 'all')
+
+    @classmethod
+    def _bench_get_events_clinician_week(cls, context):
+        week_start, week_end = context['week']
+        login_id = context['clinician'].login_id
+        return (
+            cls._nothing,
+            lambda state: SchedulerDataService.get_events('CLINICIAN', login_id, cls._iso(week_start), cls._iso(week_end)),
+            cls._nothing,
+        )
+
+    @classmethod
+    def _bench_get_events_admin_month(cls, context):
+        month_start, month_end = context['month']
+        return (
+            cls._nothing,
+            lambda state: SchedulerDataService.get_events('ADMIN', None, cls._iso(month_start), cls._iso(month_end)),
+            cls._nothing,
+        )
+
+    @classmethod
+    def _bench_create_event_recurring(cls, context):
+        return (
+            cls._nothing,
+            lambda state: cls._create_series(context),
+            lambda state: cls._delete_series(context),
+        )
+
+    @classmethod
+    def _bench_update_event_series(cls, context):
+        def setup():
+            parent = Event.objects.get(id=cls._call_and_wait(lambda: cls._create_series(context))['Id'])
+            # Edit "this and following" from the tenth occurrence
+            tenth = parent.start_datetime.astimezone(cls.TIMEZONE) + timedelta(weeks=9)
+            if parent.is_virtual_series:
+                return {'event_id': SchedulerDataService._make_occurrence_id(parent.id, tenth.date()), 'start': tenth}
+            child = Event.objects.filter(parent_event=parent).order_by('start_datetime')[8]
+            return {'event_id': child.id, 'start': child.start_datetime}
+
+        def update(state):
+            moved = state['start'] + timedelta(hours=1)
+            return SchedulerDataService.update_event(state['event_id'], cls._appointment_data(
+                context, moved, editType='series', RecurrenceRule=cls._series_rule(moved)
+            ))
+
+        return setup, update, lambda state: cls._delete_series(context)
+
+    @classmethod
+    def _bench_delete_event_all(cls, context):
+        return (
+            lambda: cls._create_series(context)['Id'],
+            lambda parent_id: SchedulerDataService.delete_event(parent_id, 'all'),
+            lambda state: cls._delete_series(context),
+        )
+
+    @classmethod
+    def _create_noted_series(cls, context: Dict[str, Any]) -> int:
+        """
+        Store a daily series of NOTED_SERIES_LENGTH occurrences, each with its own services and a
+        progress note and every tenth with a psychotherapy note, as a long-running series ends up
+        """
+        start = cls._series_start()
+        rule = f"FREQ=DAILY;INTERVAL=1;COUNT={cls.NOTED_SERIES_LENGTH}"
+        parent = Event.objects.get(id=SchedulerDataService.create_event(
+            cls._appointment_data(context, start, RecurrenceRule=rule)
+        )['Id'])
+        # Stored directly: the materialization window would only create the first months
+        occurrences = SchedulerDataService._build_series_occurrences(
+            parent, [start + timedelta(days=day) for day in range(1, cls.NOTED_SERIES_LENGTH)]
+        )
+        for occurrence in occurrences:
+            occurrence.inherits_services = False
+        occurrences = SchedulerDataService._create_occurrences(occurrences)
+
+        template = NoteTemplate.objects.order_by('id').first()
+        EventService.objects.bulk_create([
+            EventService(event=occurrence, service=context['service'], fee=context['service'].rate, modifiers='')
+            for occurrence in occurrences
+        ], batch_size=500)
+        EventNote.objects.bulk_create([
+            EventNote(event=occurrence, template=template, created_by=context['clinician'], note_data={'summary': 'Session went as planned.'})
+            for occurrence in occurrences
+        ], batch_size=500)
+        PhsycotherapyNote.objects.bulk_create([
+            PhsycotherapyNote(event=occurrence, created_by=context['clinician'], note_data='Private note.')
+            for occurrence in occurrences[::10]
+        ], batch_size=500)
+        return parent.id
+
+    @classmethod
+    def _bench_delete_series_with_notes(cls, context):
+        return (
+            lambda: cls._create_noted_series(context),
+            lambda parent_id: SchedulerDataService.delete_event(parent_id, 'all'),
+            lambda state: cls._delete_series(context),
+        )
+
+    @classmethod
+    def _bench_search_clients(cls, context):
+        query = context['patient'].last_name[:3]
+        return cls._nothing, lambda state: list(SchedulerDataService.search_clients(query)), cls._nothing
+
+    @classmethod
+    def _bench_dashboard_reference_data(cls, context):
+        """Reference data read by every admin dashboard load"""
+        def read(state):
+            SchedulerDataService.get_resources('ADMIN', None)
+            SchedulerDataService.get_locations()
+            SchedulerDataService.get_team_members()
+            SchedulerDataService.get_practice_services()
+        return cls._nothing, read, cls._nothing
+
+    @classmethod
+    def _bench_client_clinicians(cls, context):
+        """Clinician lists read when the appointment modal opens for a patient"""
+        patient_id = context['patient'].id
+        query = context['clinician'].last_name[:3]
+        def read(state):
+            SchedulerDataService.get_client_clinicians(patient_id)
+            SchedulerDataService.search_clinicians(patient_id, query)
+        return cls._nothing, read, cls._nothing
+
+    @classmethod
+    def _bench_clinician_services(cls, context):
+        """Services offered when a clinician is picked in the appointment modal"""
+        clinician_id, patient_id = context['clinician'].id, context['patient'].id
+        return cls._nothing, lambda state: SchedulerDataService.get_clinician_services(clinician_id, patient_id), cls._nothing
+
+    @classmethod
+    def _bench_service_rates_batch(cls, context):
+        """Effective rates of every seeded clinician with every patient of their care teams, as a billing report reads them"""
+        pairs = list(CareTeam.objects.filter(clinician_id__in=context['clinician_ids']).values_list('clinician_id', 'patient_id'))
+        return cls._nothing, lambda state: ServicePriceService.get_rates(pairs), cls._nothing
+
+    @classmethod
+    def _bench_find_open_slots_four_weeks(cls, context):
+        """Open 45 minute slots of every seeded clinician over the next four weeks"""
+        start = timezone.now()
+        return cls._nothing, lambda state: AvailabilityService.find_open_slots(
+            start, start + timedelta(weeks=4), timedelta(minutes=45), clinician_ids=context['clinician_ids']
+        ), cls._nothing
+
+    @classmethod
+    def _conflict_intervals(cls, context: Dict[str, Any], count: int) -> List[Tuple[datetime, datetime]]:
+        """
+        Weekly 45 minute bookings from this week's Tuesday morning, among seeded appointments
+
+        Built directly rather than with get_rule_intervals, which stops at the materialization window.
+        """
+        first = context['week'][0] + timedelta(days=1, hours=10)
+        starts = [first + timedelta(weeks=week) for week in range(count)]
+        return [(start, start + timedelta(minutes=45)) for start in starts]
+
+    @classmethod
+    def _find_conflicts(cls, context: Dict[str, Any], intervals: List[Tuple[datetime, datetime]]) -> List[Dict[str, Any]]:
+        return AvailabilityService.find_conflicts(
+            intervals, clinician_id=context['clinician'].id, patient_id=context['patient'].id,
+            location_id=context['location_id']
+        )
+
+    @classmethod
+    def _bench_find_conflicts_single(cls, context):
+        """Double booking check of one appointment"""
+        intervals = cls._conflict_intervals(context, 1)
+        return cls._nothing, lambda state: cls._find_conflicts(context, intervals), cls._nothing
+
+    @classmethod
+    def _bench_find_conflicts_series(cls, context):
+        """Double booking check of every occurrence of a two year weekly series"""
+        intervals = cls._conflict_intervals(context, cls.CONFLICT_SERIES_LENGTH)
+        return cls._nothing, lambda state: cls._find_conflicts(context, intervals), cls._nothing
+
+    @classmethod
+    def _bench_get_event_details(cls, context):
+        event_id = context['noted_event_id']
+        return cls._nothing, lambda state: EventNotesService.get_event_details(event_id), cls._nothing
+
+    # Rule shapes the recurrence editor produces, for the recurrence microbenchmarks
+    RECURRENCE_RULES = [
+        'FREQ=WEEKLY;INTERVAL=1;BYDAY=MO;COUNT={n}',
+        'FREQ=WEEKLY;INTERVAL=2;BYDAY=TU,TH;COUNT={n}',
+        'FREQ=MONTHLY;INTERVAL=1;BYMONTHDAY=15;COUNT={n}',
+        'FREQ=MONTHLY;INTERVAL=1;BYDAY=FR;BYSETPOS=-1;COUNT={n}',
+    ]
+
+    @classmethod
+    def _bench_recurrence_compile(cls, context):
+        """Compile 200 distinct rules with an empty cache"""
+        start = cls._series_start()
+        rules = [rule.format(n=n) for n in range(1, 51) for rule in cls.RECURRENCE_RULES]
+
+        def setup():
+            RecurrenceService.clear_cache()
+
+        return setup, lambda state: [RecurrenceService.compile(rule, start) for rule in rules], cls._nothing
+
+    @classmethod
+    def _bench_recurrence_expand_month(cls, context):
+        """Expand 200 compiled open-ended series over a month, as calendar reads of virtual series do"""
+        month_start, month_end = context['month']
+        series = [
+            (rule.split(';COUNT')[0], month_start - timedelta(weeks=n))
+            for n in range(1, 51) for rule in cls.RECURRENCE_RULES
+        ]
+
+        def run(state):
+            return [RecurrenceService.expand(rule, start, month_start, month_end) for rule, start in series]
+
+        return lambda: run(None), run, cls._nothing
+
+    @classmethod
+    def _bench_recurrence_expand_open_ended(cls, context):
+        """Expand an open-ended daily series, which stops at the horizon"""
+        start = cls._series_start()
+        return cls._nothing, lambda state: RecurrenceService.expand('FREQ=DAILY;INTERVAL=1', start), cls._nothing
+
+    #endregion benchmarks
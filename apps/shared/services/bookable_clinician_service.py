@@ -0,0 +1,137 @@
+import threading
+from typing import Any, Dict, List, Optional, Set
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+
+from apps.accounts.models import Login
+from apps.clinician_dashboard.models import CareTeam, Clinician
+from apps.shared.services.reference_cache_service import ReferenceCacheService
+
+
+class BookableClinicianService:
+    """
+    Clinicians a patient can be booked with: every admin clinician and the patient's active care team
+
+    Clinician names and the admin set are held in a process-wide name index, rebuilt when the
+    clinicians version of ReferenceCacheService moves; clinician and login saves bump it through
+    signals. The active care team of each patient is kept in the cache backend and dropped when
+    one of its CareTeam rows is saved or deleted. A lookup is then one version read and one cache
+    read, with no query once both are warm. Bulk writes send no signals; entries also expire after
+    SCHEDULER_REFERENCE_CACHE_TIMEOUT seconds.
+    """
+
+    KEY_PREFIX = 'bookable_clinicians'
+
+    # Replaced as a whole on every build, so concurrent readers never see a partial index
+    _index: Optional[Dict[str, Any]] = None
+    _lock = threading.Lock()
+
+    #region name index
+
+    @classmethod
+    def _build_index(cls, version: int) -> Dict[str, Any]:
+        admin_login_ids = set(Login.objects.filter(user_type='ADMIN').values_list('id', flat=True))
+        names, words, admin_ids = {}, {}, []
+        for clinician_id, login_id, first_name, last_name in Clinician.objects.order_by('id').values_list(
+            'id', 'login_id', 'first_name', 'last_name'
+        ):
+            names[clinician_id] = f"{first_name or ''} {last_name or ''}"
+            words[clinician_id] = ((first_name or '').lower(), (last_name or '').lower())
+            if login_id in admin_login_ids:
+                admin_ids.append(clinician_id)
+        cls._index = {
+            'version': version,
+            'names': names,
+            'words': words,
+            'admin_ids': frozenset(admin_ids),
+        }
+        return cls._index
+
+    @classmethod
+    def _get_index(cls) -> Dict[str, Any]:
+        version = ReferenceCacheService.get_version(ReferenceCacheService.CLINICIANS)
+        index = cls._index
+        if index is None or index['version'] != version:
+            with cls._lock:
+                index = cls._index
+                if index is None or index['version'] != version:
+                    index = cls._build_index(version)
+        return index
+
+    #endregion name index
+
+    #region care teams
+
+    @classmethod
+    def _care_team_key(cls, patient_id: int) -> str:
+        return f"{cls.KEY_PREFIX}:care_team:{patient_id}"
+
+    @classmethod
+    def _get_care_team_ids(cls, patient_id: int) -> Set[int]:
+        key = cls._care_team_key(patient_id)
+        clinician_ids = cache.get(key)
+        if clinician_ids is None:
+            clinician_ids = list(CareTeam.objects.filter(
+                patient_id=patient_id, status='ACTIVE'
+            ).values_list('clinician_id', flat=True))
+            cache.set(key, clinician_ids, getattr(settings, 'SCHEDULER_REFERENCE_CACHE_TIMEOUT', 60 * 60))
+        return set(clinician_ids)
+
+    @classmethod
+    def invalidate_patient(cls, patient_id: int) -> None:
+        """Drop the cached care team of a patient once the current transaction commits"""
+        transaction.on_commit(lambda: cache.delete(cls._care_team_key(patient_id)))
+
+    #endregion care teams
+
+    #region lookups
+
+    @classmethod
+    def _get_bookable_ids(cls, index: Dict[str, Any], patient_id: int) -> Set[int]:
+        return index['admin_ids'] | cls._get_care_team_ids(patient_id)
+
+    @classmethod
+    def get_clinicians(cls, patient_id: int) -> List[Dict[str, Any]]:
+        """
+        Clinicians a patient can be booked with
+
+        Returns:
+            List of dictionaries containing clinician id and full name, by id
+        """
+        index = cls._get_index()
+        clinician_ids = cls._get_bookable_ids(index, patient_id)
+        if not clinician_ids <= index['names'].keys():
+            # Care team member added by another process since the last build
+            index = cls._build_index(index['version'])
+        return [
+            {'id': clinician_id, 'name': index['names'][clinician_id]}
+            for clinician_id in sorted(clinician_ids) if clinician_id in index['names']
+        ]
+
+    @classmethod
+    def search(cls, query: str, patient_id: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        Clinicians whose first or last name contains the query, ignoring case
+
+        Args:
+            query: Search string, an empty one matches every clinician
+            patient_id: Limits the results to the clinicians the patient can be booked with
+
+        Returns:
+            List of dictionaries containing clinician id and full name, by id
+        """
+        index = cls._get_index()
+        if patient_id is None:
+            clinician_ids = index['names'].keys()
+        else:
+            clinician_ids = cls._get_bookable_ids(index, patient_id) & index['names'].keys()
+        query = query.lower()
+        return [
+            {'id': clinician_id, 'name': index['names'][clinician_id]}
+            for clinician_id in sorted(clinician_ids)
+            if query in index['words'][clinician_id][0] or query in index['words'][clinician_id][1]
+        ]
+
+    #endregion lookups
@@ -0,0 +1,128 @@
+import hashlib
+import time
+from datetime import datetime
+from typing import Iterable, Iterator, List, Optional
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+
+from apps.core.middleware import record_cache_lookup
+
+
+class CalendarCacheService:
+    """
+    Cache of serialized calendar windows
+
+    Entries are keyed by the window, the clinician and location filters, and version counters
+    that every write bumps, so a changed week is never served from the cache. Version counters
+    live in the same cache backend as the entries: the local-memory backend is enough for a
+    single worker, multi-worker deployments need a shared backend (see CACHES in settings).
+    """
+
+    KEY_PREFIX = 'calendar'
+
+    # Version covering every clinician, used for unfiltered admin windows
+    ALL_CLINICIANS = 'all'
+
+    # Version bumped when data shown on events but stored elsewhere changes (patient and location names, states)
+    SHARED = 'shared'
+
+    @classmethod
+    def _get_timeout(cls) -> int:
+        return getattr(settings, 'SCHEDULER_CALENDAR_CACHE_TIMEOUT', 60 * 60 * 24)
+
+    @classmethod
+    def _get_max_bytes(cls) -> int:
+        return getattr(settings, 'SCHEDULER_CALENDAR_CACHE_MAX_BYTES', 2 * 1024 * 1024)
+
+    @classmethod
+    def _version_key(cls, scope) -> str:
+        return f"{cls.KEY_PREFIX}:version:{scope}"
+
+    @classmethod
+    def _get_versions(cls, scopes: List) -> List[int]:
+        """Read version counters, creating missing ones"""
+        keys = [cls._version_key(scope) for scope in scopes]
+        versions = cache.get_many(keys)
+        for key in keys:
+            if key not in versions:
+                # Start from the clock rather than 1 so an evicted counter never reuses old versions
+                cache.add(key, time.time_ns(), timeout=None)
+                versions[key] = cache.get(key)
+        return [versions[key] for key in keys]
+
+    @classmethod
+    def _bump(cls, scopes: Iterable) -> None:
+        for scope in scopes:
+            key = cls._version_key(scope)
+            try:
+                cache.incr(key)
+            except ValueError:
+                cache.add(key, time.time_ns(), timeout=None)
+
+    @classmethod
+    def invalidate_clinicians(cls, clinician_ids: Iterable[Optional[int]]) -> None:
+        """
+        Invalidate cached windows of the given clinicians once the current transaction commits
+
+        Bumping before commit would let a concurrent read cache pre-commit data under the new version.
+        """
+        scopes = {clinician_id for clinician_id in clinician_ids if clinician_id is not None}
+        scopes.add(cls.ALL_CLINICIANS)
+        transaction.on_commit(lambda: cls._bump(scopes))
+
+    @classmethod
+    def invalidate_all(cls) -> None:
+        """Invalidate every cached window once the current transaction commits"""
+        transaction.on_commit(lambda: cls._bump([cls.SHARED]))
+
+    @classmethod
+    def get_shared_version(cls) -> int:
+        """Current version of the data shown on events but stored elsewhere"""
+        return cls._get_versions([cls.SHARED])[0]
+
+    @classmethod
+    def get_key(cls, start_date: datetime, end_date: datetime, clinician_ids: Optional[List[int]],
+                location_ids: Optional[List[int]]) -> str:
+        """
+        Build the cache key of a window
+
+        Args:
+            clinician_ids: Clinicians the window is limited to, or None for all clinicians
+            location_ids: Locations the window is limited to, or None for all locations
+        """
+        clinician_scopes = sorted(set(clinician_ids)) if clinician_ids is not None else [cls.ALL_CLINICIANS]
+        versions = cls._get_versions([cls.SHARED, *clinician_scopes])
+        locations = ','.join(str(location_id) for location_id in sorted(set(location_ids))) if location_ids is not None else 'all'
+        raw_key = '|'.join([
+            start_date.isoformat(),
+            end_date.isoformat(),
+            ','.join(str(scope) for scope in clinician_scopes),
+            locations,
+            ','.join(str(version) for version in versions),
+        ])
+        return f"{cls.KEY_PREFIX}:window:{hashlib.md5(raw_key.encode()).hexdigest()}"
+
+    @classmethod
+    def get_window(cls, key: str) -> Optional[bytes]:
+        """Get a cached serialized window"""
+        window = cache.get(key)
+        record_cache_lookup(window is not None)
+        return window
+
+    @classmethod
+    def cache_stream(cls, key: str, chunks: Iterable[bytes]) -> Iterator[bytes]:
+        """Pass chunks through, caching the full payload once streamed unless it is too large"""
+        buffer = []
+        size = 0
+        for chunk in chunks:
+            if buffer is not None:
+                size += len(chunk)
+                if size <= cls._get_max_bytes():
+                    buffer.append(chunk)
+                else:
+                    buffer = None
+            yield chunk
+        if buffer is not None:
+            cache.set(key, b''.join(buffer), cls._get_timeout())
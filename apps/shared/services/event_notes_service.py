@@ -152,7 +152,9 @@ class EventNotesService:
                 'name': service.service.description,
                 'fee': service.fee
             }
-            for service in EventService.objects.filter(event=event)
+            for service in EventService.objects.filter(
+                event_id=SchedulerDataService.get_services_event_id(event)
+            ).select_related('service')
         ]
         
         return json.dumps(services)
@@ -0,0 +1,117 @@
+import os
+import socket
+import traceback
+from datetime import timedelta
+from typing import Any, Callable, Dict, Optional
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Q
+from django.utils import timezone
+
+from apps.clinician_dashboard.models import SchedulerJob
+
+
+class JobService:
+    """
+    Durable queue of background scheduler work
+
+    Jobs are rows in SchedulerJob, written in the caller's transaction so they only become
+    visible once it commits. Workers (manage.py run_scheduler_worker) claim them with row locks,
+    skipping rows another worker holds, and retry failures with exponential backoff. A job left
+    running by a worker that died is claimed again once its lock is older than LOCK_TIMEOUT.
+    """
+
+    # Seconds before a failed job is retried, doubled on every attempt
+    RETRY_DELAY = 5
+
+    @classmethod
+    def _get_lock_timeout(cls) -> timedelta:
+        return timedelta(seconds=getattr(settings, 'SCHEDULER_JOB_LOCK_TIMEOUT', 600))
+
+    @classmethod
+    def _get_handlers(cls) -> Dict[str, Callable[..., Any]]:
+        """Function run for each job kind, called with the job payload as keyword arguments"""
+        from apps.shared.services.scheduler_service import SchedulerDataService
+        return {
+            SchedulerJob.MATERIALIZE_SERIES: SchedulerDataService.materialize_series,
+        }
+
+    @classmethod
+    def get_worker_id(cls) -> str:
+        return f"{socket.gethostname()}:{os.getpid()}"
+
+    @classmethod
+    def enqueue(cls, kind: str, payload: Dict[str, Any]) -> SchedulerJob:
+        """Add a job, due right away"""
+        return SchedulerJob.objects.create(kind=kind, payload=payload, run_after=timezone.now())
+
+    @classmethod
+    def claim(cls, worker_id: str) -> Optional[SchedulerJob]:
+        """Lock the next due job for a worker and mark it running, or return None when there is nothing to do"""
+        now = timezone.now()
+        with transaction.atomic():
+            job = SchedulerJob.objects.select_for_update(skip_locked=True).filter(
+                Q(status=SchedulerJob.PENDING, run_after__lte=now) |
+                Q(status=SchedulerJob.RUNNING, locked_at__lt=now - cls._get_lock_timeout())
+            ).order_by('run_after', 'id').first()
+            if job is None:
+                return None
+            job.status = SchedulerJob.RUNNING
+            job.attempts += 1
+            job.locked_at = now
+            job.locked_by = worker_id
+            job.save(update_fields=['status', 'attempts', 'locked_at', 'locked_by'])
+        return job
+
+    @classmethod
+    def run(cls, job: SchedulerJob) -> None:
+        """Run a claimed job and record the outcome, scheduling a retry if it failed"""
+        try:
+            cls._get_handlers()[job.kind](**job.payload)
+        except Exception as e:
+            print(f"Error running job {job.id} ({job.kind}): {str(e)}")
+            job.last_error = traceback.format_exc()
+            if job.attempts >= job.max_attempts:
+                job.status = SchedulerJob.FAILED
+                job.finished_at = timezone.now()
+            else:
+                job.status = SchedulerJob.PENDING
+                job.run_after = timezone.now() + timedelta(seconds=cls.RETRY_DELAY * 2 ** (job.attempts - 1))
+        else:
+            job.status = SchedulerJob.DONE
+            job.finished_at = timezone.now()
+        job.locked_at = None
+        job.locked_by = None
+        job.save(update_fields=['status', 'run_after', 'last_error', 'finished_at', 'locked_at', 'locked_by'])
+
+    @classmethod
+    def run_pending(cls, worker_id: Optional[str] = None, limit: Optional[int] = None) -> int:
+        """Run due jobs until there are none left or limit is reached, and return how many ran"""
+        worker_id = worker_id or cls.get_worker_id()
+        count = 0
+        while limit is None or count < limit:
+            job = cls.claim(worker_id)
+            if job is None:
+                break
+            cls.run(job)
+            count += 1
+        return count
+
+    @classmethod
+    def get_status(cls, job_id: int) -> Dict[str, Any]:
+        """
+        Get the status of a job
+
+        Raises:
+            SchedulerJob.DoesNotExist: If there is no job with that ID
+        """
+        job = SchedulerJob.objects.get(id=job_id)
+        return {
+            'id': job.id,
+            'kind': job.kind,
+            'status': job.status,
+            'attempts': job.attempts,
+            'created_at': job.created_at.isoformat(),
+            'finished_at': job.finished_at.isoformat() if job.finished_at else None,
+        }
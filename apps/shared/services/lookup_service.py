@@ -0,0 +1,84 @@
+import time
+from typing import Any, Dict, List, Optional
+
+from django.db import transaction
+
+from apps.clinician_dashboard.models import AppointmentState, EventType
+
+
+class LookupService:
+    """
+    Process-wide registry of the EventType and AppointmentState lookup tables
+
+    Both tables are loaded once and names are resolved to IDs and back without touching the
+    database. Saves and deletes in this process clear the registry through signals; other
+    processes reload after TTL seconds, or right away when a name or ID is not found.
+    """
+
+    TTL = 300
+
+    # Replaced as a whole on every load, so concurrent readers never see a partial registry
+    _registry: Optional[Dict[str, Any]] = None
+
+    @classmethod
+    def _load(cls) -> Dict[str, Any]:
+        event_types = list(EventType.objects.values_list('id', 'name'))
+        states = list(AppointmentState.objects.order_by('id').values('id', 'name'))
+        cls._registry = {
+            'loaded_at': time.monotonic(),
+            'event_type_ids': {name: type_id for type_id, name in event_types},
+            'event_type_names': {type_id: name for type_id, name in event_types},
+            'states': states,
+            'state_names': {state['id']: state['name'] for state in states},
+        }
+        return cls._registry
+
+    @classmethod
+    def _get_registry(cls) -> Dict[str, Any]:
+        registry = cls._registry
+        if registry is None or time.monotonic() - registry['loaded_at'] > cls.TTL:
+            registry = cls._load()
+        return registry
+
+    @classmethod
+    def _lookup(cls, table: str, key: Any) -> Any:
+        value = cls._get_registry()[table].get(key)
+        if value is None:
+            # Possibly added by another process since the last load
+            value = cls._load()[table].get(key)
+        return value
+
+    @classmethod
+    def clear(cls) -> None:
+        """Drop the registry once the current transaction commits; the next lookup reloads it"""
+        def _clear():
+            cls._registry = None
+        transaction.on_commit(_clear)
+
+    @classmethod
+    def get_event_type_id(cls, name: str) -> int:
+        """
+        Get the ID of an event type by name
+
+        Raises:
+            EventType.DoesNotExist: If there is no event type with that name
+        """
+        type_id = cls._lookup('event_type_ids', name)
+        if type_id is None:
+            raise EventType.DoesNotExist(f"EventType matching name {name} does not exist")
+        return type_id
+
+    @classmethod
+    def get_event_type_name(cls, type_id: Optional[int]) -> Optional[str]:
+        """Get the name of an event type by ID"""
+        return cls._lookup('event_type_names', type_id) if type_id is not None else None
+
+    @classmethod
+    def get_state_name(cls, state_id: Optional[int]) -> Optional[str]:
+        """Get the name of an appointment state by ID"""
+        return cls._lookup('state_names', state_id) if state_id is not None else None
+
+    @classmethod
+    def get_appointment_states(cls) -> List[Dict[str, Any]]:
+        """Get all appointment states as id/name dictionaries"""
+        return [dict(state) for state in cls._get_registry()['states']]
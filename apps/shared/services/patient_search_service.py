@@ -0,0 +1,141 @@
+import re
+import unicodedata
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+from django.db import transaction
+from django.db.models import CharField, Exists, F, OuterRef, QuerySet, Value
+from django.db.models.functions import Concat
+
+from apps.clinician_dashboard.models import Patient, PatientSearchToken
+
+
+class PatientSearchService:
+    """
+    Prefix search over patient names and emails
+
+    Every patient has one PatientSearchToken row per normalized word of their first name, last
+    name and email. A query matches patients having, for each of its words, a token starting with
+    it; each word is a range on the token index instead of a '%word%' scan of the Patient table.
+    Tokens are rewritten when a patient is saved. Bulk writes skip signals, so run
+    manage.py rebuild_patient_search after them.
+    """
+
+    # Longest token stored; longer words are cut, and so are query words
+    MAX_TOKEN_LENGTH = 100
+
+    # Query words looked at, the rest are ignored
+    MAX_QUERY_WORDS = 4
+
+    # Results returned by default
+    LIMIT = 20
+
+    BATCH_SIZE = 1000
+
+    WORD = re.compile(r'[a-z0-9]+')
+
+    #region tokens
+
+    @classmethod
+    def normalize(cls, text: Optional[str]) -> List[str]:
+        """Lowercase words of a text without accents, in order"""
+        if not text:
+            return []
+        text = unicodedata.normalize('NFKD', text)
+        text = ''.join(char for char in text if not unicodedata.combining(char)).lower()
+        return [word[:cls.MAX_TOKEN_LENGTH] for word in cls.WORD.findall(text)]
+
+    @classmethod
+    def get_tokens(cls, first_name: Optional[str], last_name: Optional[str], email: Optional[str]) -> Set[str]:
+        return set(cls.normalize(first_name)) | set(cls.normalize(last_name)) | set(cls.normalize(email))
+
+    @classmethod
+    def _build_tokens(cls, patients: Iterable[Patient]) -> List[PatientSearchToken]:
+        return [
+            PatientSearchToken(patient_id=patient.id, token=token)
+            for patient in patients
+            for token in cls.get_tokens(patient.first_name, patient.last_name, patient.email)
+        ]
+
+    @classmethod
+    def index_patients(cls, patients: List[Patient]) -> None:
+        """Replace the tokens of some patients"""
+        with transaction.atomic():
+            PatientSearchToken.objects.filter(patient_id__in=[patient.id for patient in patients]).delete()
+            PatientSearchToken.objects.bulk_create(cls._build_tokens(patients), batch_size=cls.BATCH_SIZE)
+
+    @classmethod
+    def index_patient(cls, patient: Patient) -> None:
+        cls.index_patients([patient])
+
+    @classmethod
+    def rebuild(cls, batch_size: Optional[int] = None) -> int:
+        """
+        Rebuild the tokens of every patient, a batch of patients per transaction
+
+        Returns:
+            Number of patients indexed
+        """
+        batch_size = batch_size or cls.BATCH_SIZE
+        count = 0
+        last_id = 0
+        while True:
+            patients = list(Patient.objects.filter(id__gt=last_id).order_by('id').only(
+                'id', 'first_name', 'last_name', 'email'
+            )[:batch_size])
+            if not patients:
+                return count
+            cls.index_patients(patients)
+            count += len(patients)
+            last_id = patients[-1].id
+
+    #endregion tokens
+
+    #region search
+
+    @classmethod
+    def _get_prefix_range(cls, word: str) -> Tuple[str, str]:
+        """
+        Bounds of the tokens starting with word
+
+        Tokens only hold digits and letters, and z sorts last among them in every collation, so a
+        range answers the prefix lookup from the index on any backend; some do not use an index
+        for LIKE 'word%'.
+        """
+        return word, word + 'z' * (cls.MAX_TOKEN_LENGTH - len(word))
+
+    @classmethod
+    def _get_words(cls, query: Optional[str]) -> List[str]:
+        return list(dict.fromkeys(cls.normalize(query)))[:cls.MAX_QUERY_WORDS]
+
+    @classmethod
+    def filter(cls, patients: QuerySet, query: Optional[str]) -> QuerySet:
+        """Patients having, for each word of the query, a token starting with it; all of them for an empty query"""
+        # Longest words first: they match the fewest tokens
+        for word in sorted(cls._get_words(query), key=len, reverse=True):
+            patients = patients.filter(
+                id__in=PatientSearchToken.objects.filter(token__range=cls._get_prefix_range(word)).values('patient_id')
+            )
+        return patients
+
+    @classmethod
+    def search(cls, query: str, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        Patients whose names or email have a word starting with each word of the query
+
+        Patients with a word equal to one of the query words come first, then by last and first name.
+
+        Returns:
+            At most limit patients as id, name, email and phone
+        """
+        words = cls._get_words(query)
+        if not words:
+            return []
+
+        return list(cls.filter(Patient.objects.all(), query).annotate(
+            exact=Exists(PatientSearchToken.objects.filter(patient_id=OuterRef('id'), token__in=words)),
+            name=Concat(F('first_name'), Value(' '), F('last_name'), output_field=CharField())
+        ).order_by('-exact', 'last_name', 'first_name', 'id').values(
+            'id', 'name', 'email', 'phone'
+        )[:limit or cls.LIMIT])
+
+    #endregion search
@@ -0,0 +1,99 @@
+import threading
+import time
+from typing import Any, Callable, Dict, Iterable, List
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+
+from apps.core.middleware import record_cache_lookup
+
+
+class ReferenceCacheService:
+    """
+    Shared cache of the reference tables every dashboard load and modal reads
+
+    Locations, practice services and clinicians change a few times a month. Their readers keep
+    their results in the cache backend under a version counter per table; saves and deletes bump
+    it through signals once their transaction commits, so readers in every process move to fresh
+    entries at once. Entries also expire after SCHEDULER_REFERENCE_CACHE_TIMEOUT seconds, which
+    covers bulk writes that send no signals. Hits and misses are counted per reader in this
+    process, and per request for the Server-Timing header.
+    """
+
+    KEY_PREFIX = 'reference'
+
+    # Tables a cached reader depends on
+    LOCATIONS = 'locations'
+    SERVICES = 'services'
+    CLINICIANS = 'clinicians'
+
+    _stats: Dict[str, Dict[str, int]] = {}
+    _stats_lock = threading.Lock()
+
+    @classmethod
+    def _get_timeout(cls) -> int:
+        return getattr(settings, 'SCHEDULER_REFERENCE_CACHE_TIMEOUT', 60 * 60)
+
+    @classmethod
+    def _version_key(cls, table: str) -> str:
+        return f"{cls.KEY_PREFIX}:version:{table}"
+
+    @classmethod
+    def get_version(cls, table: str) -> int:
+        """Current version of a table; it changes whenever the table is invalidated"""
+        key = cls._version_key(table)
+        version = cache.get(key)
+        if version is None:
+            # Start from the clock rather than 1 so an evicted counter never reuses old versions
+            cache.add(key, time.time_ns(), timeout=None)
+            version = cache.get(key)
+        return version
+
+    @classmethod
+    def _count(cls, name: str, hit: bool) -> None:
+        with cls._stats_lock:
+            stats = cls._stats.setdefault(name, {'hits': 0, 'misses': 0})
+            stats['hits' if hit else 'misses'] += 1
+        record_cache_lookup(hit)
+
+    @classmethod
+    def get(cls, name: str, table: str, loader: Callable[[], Iterable[Any]], scope: Any = None) -> List[Any]:
+        """
+        Get the cached result of a reader, loading and caching it on a miss
+
+        Args:
+            name: Reader name, counted in the stats
+            table: Table the result is read from, one of LOCATIONS, SERVICES or CLINICIANS
+            loader: Reads the result from the database
+            scope: Distinguishes results of one reader that depend on an argument, such as a user
+        """
+        key = f"{cls.KEY_PREFIX}:{name}:{scope}:{cls.get_version(table)}"
+        value = cache.get(key)
+        cls._count(name, value is not None)
+        if value is None:
+            value = list(loader())
+            cache.set(key, value, cls._get_timeout())
+        return value
+
+    @classmethod
+    def invalidate(cls, table: str) -> None:
+        """Move readers of a table to fresh entries once the current transaction commits"""
+        def _bump():
+            key = cls._version_key(table)
+            try:
+                cache.incr(key)
+            except ValueError:
+                cache.add(key, time.time_ns(), timeout=None)
+        transaction.on_commit(_bump)
+
+    @classmethod
+    def get_stats(cls) -> Dict[str, Dict[str, int]]:
+        """Hits and misses of each reader since this process started or the stats were reset"""
+        with cls._stats_lock:
+            return {name: dict(stats) for name, stats in cls._stats.items()}
+
+    @classmethod
+    def reset_stats(cls) -> None:
+        with cls._stats_lock:
+            cls._stats = {}
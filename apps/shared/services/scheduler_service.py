@@ -1,22 +1,32 @@
-from typing import Dict, Any, List, Optional, Union
-from datetime import datetime, timedelta
-from django.db.models import Q, Value, F, CharField
+from typing import Dict, Any, Iterable, Iterator, List, Optional, Tuple, Union
+from datetime import date, datetime, time, timedelta
+from django.db.models import Q, Value, F, CharField, Max
 from django.db.models.functions import Concat
 from django.conf import settings
 from django.forms import BooleanField, ValidationError
 from django.utils import timezone
 from django.utils.timezone import make_aware
 from zoneinfo import ZoneInfo
+import base64
 import pytz
-from dateutil import rrule
+from dateutil.relativedelta import relativedelta
+import json
 from django.contrib.auth.models import User 
-import threading
 from django.db import transaction
 from django.db.models import QuerySet
 from django.db.models import F
+from django.db.models import OuterRef, Subquery
 from django.db.models.functions import ExtractYear, ExtractMonth, ExtractDay
-from apps.clinician_dashboard.models import AppointmentState, CareTeam, Clinician, Event, EventService, EventType, Patient, Location, PracticeService, PatientDefaultService, ClinicianService, ClinicianLocation
-from apps.accounts.models import Login  
+from apps.clinician_dashboard.models import Clinician, Event, EventExclusion, EventNote, EventService, EventTombstone, EventType, PhsycotherapyNote, Patient, SchedulerJob, Location, PracticeService, ClinicianLocation
+from apps.shared.services.availability_service import AvailabilityService, SchedulingConflictError
+from apps.shared.services.bookable_clinician_service import BookableClinicianService
+from apps.shared.services.calendar_cache_service import CalendarCacheService
+from apps.shared.services.job_service import JobService
+from apps.shared.services.lookup_service import LookupService
+from apps.shared.services.patient_search_service import PatientSearchService
+from apps.shared.services.recurrence_service import RecurrenceService
+from apps.shared.services.reference_cache_service import ReferenceCacheService
+from apps.shared.services.service_price_service import ServicePriceService
 
 class SchedulerDataService:
     """Service class to handle all scheduler related data operations"""
@@ -25,34 +35,40 @@ class SchedulerDataService:
 
     @classmethod
     def get_resources(cls, user_role: str, user: User) -> List[Dict[str, Any]]:
-        """Get resources (clinicians) based on user role"""
+        """Get resources (clinicians) based on user role, cached until clinicians change"""
         if user_role == 'ADMIN':
-            return Clinician.objects.annotate(
-                text=Concat(
-                    F('first_name'),
-                    Value(' '),
-                    F('last_name'),
-                    output_field=CharField()
-                ),
-                designation=F('field')
-            ).values('id', 'text', 'color', 'designation')
+            return ReferenceCacheService.get(
+                'resources', ReferenceCacheService.CLINICIANS, lambda: cls._load_resources(), scope='admin'
+            )
         elif user_role == 'CLINICIAN':
             clinician_id = user.id 
-            return Clinician.objects.filter(login_id=clinician_id).annotate(
-                text=Concat(
-                    F('first_name'),
-                    Value(' '),
-                    F('last_name'),
-                    output_field=CharField()
-                ),
-                designation=F('field')
-            ).values('id', 'text', 'color', 'designation')
+            return ReferenceCacheService.get(
+                'resources', ReferenceCacheService.CLINICIANS, lambda: cls._load_resources(clinician_id), scope=clinician_id
+            )
         return []
 
     @classmethod
-    def get_events(cls, user_role: str, clinician_id: int = None, start_date=None, end_date=None, 
-                   clinician_ids: Optional[List[int]] = None, location_ids: Optional[List[int]] = None) -> List[Dict[str, Any]]:
-        """Get scheduled events based on user role, date range, and location IDs"""
+    def _load_resources(cls, login_id: Optional[int] = None) -> QuerySet:
+        """Clinicians as scheduler resources, only the one with that login ID if given"""
+        clinicians = Clinician.objects.all()
+        if login_id is not None:
+            clinicians = clinicians.filter(login_id=login_id)
+        return clinicians.annotate(
+            text=Concat(
+                F('first_name'),
+                Value(' '),
+                F('last_name'),
+                output_field=CharField()
+            ),
+            designation=F('field')
+        ).values('id', 'text', 'color', 'designation')
+
+    @classmethod
+    def _get_date_window(cls, start_date=None, end_date=None) -> Tuple[datetime, datetime]:
+        """Parse the requested date window, defaulting to the current month"""
+        if isinstance(start_date, datetime) and isinstance(end_date, datetime):
+            return start_date, end_date
+
         # Set default dates if not provided
         today = timezone.now()
         if not start_date or not end_date:
@@ -68,90 +84,386 @@ class SchedulerDataService:
                 # Fallback to current month if dates are invalid
                 start_date = today.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
                 end_date = (start_date + timedelta(days=32)).replace(day=1)
+        return start_date, end_date
 
-        base_query = Event.objects.select_related(
-            'type',
-            'clinician',
-            'patient',
-            'location',
-            'status'
-        ).filter(
-            start_datetime__gte=start_date,
-            start_datetime__lt=end_date
-        )
+    @classmethod
+    def _get_max_event_duration(cls) -> timedelta:
+        """Longest allowed event; bounds how far before a window an overlapping event can start"""
+        return timedelta(days=getattr(settings, 'SCHEDULER_MAX_EVENT_DURATION_DAYS', 31))
+
+    @classmethod
+    def _validate_event_duration(cls, start_datetime: datetime, end_datetime: datetime,
+                                 event_type: Optional[str] = None) -> None:
+        """
+        Reject events longer than the calendar window queries can find
+
+        Out of office blocks may be longer; window queries match them by overlap alone.
+        """
+        if event_type == 'OUT_OF_OFFICE':
+            return
+        if start_datetime and end_datetime and end_datetime - start_datetime > cls._get_max_event_duration():
+            raise ValidationError(f"Events cannot be longer than {cls._get_max_event_duration().days} days")
 
+    @classmethod
+    def _filter_events(cls, events: QuerySet, user_role: str, clinician_id: int = None,
+                       clinician_ids: Optional[List[int]] = None,
+                       location_ids: Optional[List[int]] = None) -> Optional[QuerySet]:
+        """Apply clinician, location and role filters; returns None if the user may not see any events"""
         # Filter by clinician IDs if provided
         if clinician_ids is not None:
-            base_query = base_query.filter(clinician_id__in=clinician_ids)
+            events = events.filter(clinician_id__in=clinician_ids)
 
         # Filter by location IDs if provided
         if location_ids is not None:
-            base_query = base_query.filter(location_id__in=location_ids)
+            events = events.filter(location_id__in=location_ids)
 
         # Continue with user role checks
         if user_role == 'ADMIN':
-            events = base_query
+            return events
         elif user_role == 'CLINICIAN' and clinician_id is not None:
             clinician = Clinician.objects.filter(login_id=clinician_id).first()
             if clinician:
-                events = base_query.filter(clinician_id=clinician.id)
-            else:
-                return []
-        else:
+                return events.filter(clinician_id=clinician.id)
+        return None
+
+    # Columns read for calendar events, in the order of the rows passed to _convert_row_to_dict
+    EVENT_COLUMNS = (
+        'id', 'start_datetime', 'end_datetime', 'is_all_day', 'clinician_id',
+        'recurrence_rule', 'is_recurring', 'appointment_total', 'type_id',
+        'title', 'notes', 'status_id', 'patient_id', 'patient__first_name',
+        'patient__last_name', 'location_id', 'location__name',
+        'cancel_appointments', 'notify_clients',
+    )
+
+    # Rows fetched per database round trip and events per streamed chunk
+    EVENT_CHUNK_SIZE = 2000
+    STREAM_CHUNK_SIZE = 500
+
+    @classmethod
+    def _get_event_rows(cls, user_role: str, clinician_id: int = None, start_date=None, end_date=None,
+                        clinician_ids: Optional[List[int]] = None, 
+                        location_ids: Optional[List[int]] = None) -> Optional[Tuple[QuerySet, QuerySet, datetime, datetime]]:
+        """Build the row querysets for stored events and virtual series parents in a date window"""
+        start_date, end_date = cls._get_date_window(start_date, end_date)
+
+        events = cls._filter_events(Event.objects.all(), user_role, clinician_id, clinician_ids, location_ids)
+        if events is None:
+            return None
+
+        # Events overlapping the window, including multi-day events that began before it.
+        # Virtual series parents are never returned as rows, only as expanded occurrences
+        stored_events = events.filter(AvailabilityService.get_overlap_filter(start_date, end_date)).exclude(is_virtual_series=True, parent_event__isnull=True)
+
+        series_parents = events.filter(
+            is_virtual_series=True,
+            parent_event__isnull=True,
+            start_datetime__lt=end_date
+        )
+
+        return (
+            stored_events.values_list(*cls.EVENT_COLUMNS, named=True),
+            series_parents.values_list(*cls.EVENT_COLUMNS, named=True),
+            start_date,
+            end_date
+        )
+
+    @classmethod
+    def _iter_events(cls, event_rows: QuerySet, series_rows: QuerySet, 
+                     start_date: datetime, end_date: datetime) -> Iterator[Dict[str, Any]]:
+        """Yield event dictionaries without loading the whole window into memory"""
+        for row in event_rows.iterator(chunk_size=cls.EVENT_CHUNK_SIZE):
+            yield cls._convert_row_to_dict(row)
+        yield from cls._expand_virtual_series(series_rows, start_date, end_date)
+
+    @classmethod
+    def get_events(cls, user_role: str, clinician_id: int = None, start_date=None, end_date=None, 
+                   clinician_ids: Optional[List[int]] = None, location_ids: Optional[List[int]] = None) -> List[Dict[str, Any]]:
+        """Get scheduled events based on user role, date range, and location IDs"""
+        rows = cls._get_event_rows(user_role, clinician_id, start_date, end_date, clinician_ids, location_ids)
+        if rows is None:
+            return []
+        return list(cls._iter_events(*rows))
+
+    @classmethod
+    def stream_events(cls, user_role: str, clinician_id: int = None, start_date=None, end_date=None, 
+                      clinician_ids: Optional[List[int]] = None, 
+                      location_ids: Optional[List[int]] = None) -> Iterator[bytes]:
+        """
+        Same as get_events, encoded as a JSON array in chunks for a StreamingHttpResponse
+
+        Filters are resolved before returning, so only row fetching happens while streaming.
+        Windows are served from CalendarCacheService when no event in them changed since they were cached.
+        """
+        start_date, end_date = cls._get_date_window(start_date, end_date)
+        cache_key = CalendarCacheService.get_key(
+            start_date, end_date, cls._get_visible_clinician_ids(user_role, clinician_id, clinician_ids), location_ids
+        )
+        cached = CalendarCacheService.get_window(cache_key)
+        if cached is not None:
+            return iter([cached])
+
+        rows = cls._get_event_rows(user_role, clinician_id, start_date, end_date, clinician_ids, location_ids)
+        if rows is None:
+            return iter([b'[]'])
+        return CalendarCacheService.cache_stream(cache_key, cls._encode_json_array(cls._iter_events(*rows)))
+
+    # Changes read by a delta sync start this long before its token, covering transactions that
+    # committed after the token was issued and cache invalidations still pending on commit
+    SYNC_GRACE = timedelta(seconds=5)
+    # Tombstones older than this are pruned; older sync tokens require a full fetch
+    SYNC_TOMBSTONE_RETENTION = timedelta(days=7)
+
+    @classmethod
+    def get_sync_token(cls) -> str:
+        """Token for a calendar fetch made now, to be passed to get_event_changes later"""
+        synced_at = int(timezone.now().timestamp() * 1_000_000)
+        return f"{synced_at}.{CalendarCacheService.get_shared_version()}"
+
+    @classmethod
+    def _parse_sync_token(cls, token: str) -> datetime:
+        """
+        Get the time a sync token was issued at
+
+        Raises:
+            ValidationError: If the token is malformed or too old, or names of patients, locations,
+                types or states changed since it was issued; the client has to fetch the full window
+        """
+        try:
+            synced_at, shared_version = str(token).split('.', 1)
+            synced_at = datetime.fromtimestamp(int(synced_at) / 1_000_000, tz=ZoneInfo("UTC"))
+        except (TypeError, ValueError, OverflowError):
+            raise ValidationError(f"Invalid sync token: {token}")
+        if synced_at < timezone.now() - cls.SYNC_TOMBSTONE_RETENTION:
+            raise ValidationError("Sync token expired")
+        if shared_version != str(CalendarCacheService.get_shared_version()):
+            raise ValidationError("Calendar reference data changed")
+        return synced_at
+
+    @classmethod
+    def get_event_changes(cls, user_role: str, clinician_id: int = None, since: str = None,
+                          start_date=None, end_date=None, clinician_ids: Optional[List[int]] = None,
+                          location_ids: Optional[List[int]] = None) -> Dict[str, Any]:
+        """
+        Get the changes to a calendar window since a sync token
+
+        Returns:
+            'events': Changed events in the window, to add or replace by Id
+            'deleted': IDs to remove; events whose Id or SeriesId is listed are gone or left the window
+            'token': Token for the next sync
+
+        Raises:
+            ValidationError: If the sync token can't be used, see _parse_sync_token
+        """
+        token = cls.get_sync_token()
+        changed_since = cls._parse_sync_token(since) - cls.SYNC_GRACE
+
+        # Every changed or deleted event of the clinicians in view is reported as deleted unless it
+        # is returned again, so edits that move an event out of the window or the filters drop it on
+        # the client. Events moved to another clinician leave a tombstone for the one they left
+        changed_events = Event.objects.filter(updated_at__gte=changed_since)
+        tombstones = EventTombstone.objects.filter(deleted_at__gte=changed_since)
+        visible_clinician_ids = cls._get_visible_clinician_ids(user_role, clinician_id, clinician_ids)
+        if visible_clinician_ids is not None:
+            changed_events = changed_events.filter(clinician_id__in=visible_clinician_ids)
+            tombstones = tombstones.filter(
+                Q(clinician_id__in=visible_clinician_ids) | Q(clinician_id__isnull=True)
+            )
+        deleted_ids = set(changed_events.values_list('id', flat=True))
+        deleted_ids.update(tombstones.values_list('event_id', flat=True))
+
+        events = []
+        rows = cls._get_event_rows(user_role, clinician_id, start_date, end_date, clinician_ids, location_ids)
+        if rows is not None:
+            event_rows, series_rows, start_date, end_date = rows
+            # Series parents are listed as deleted too: their old occurrences are dropped by SeriesId
+            # and the current ones in the window are expanded again
+            events = list(cls._iter_events(
+                event_rows.filter(updated_at__gte=changed_since),
+                series_rows.filter(updated_at__gte=changed_since),
+                start_date,
+                end_date
+            ))
+            deleted_ids.difference_update(event['Id'] for event in events)
+
+        return {'events': events, 'deleted': sorted(deleted_ids), 'token': token}
+
+    @classmethod
+    def _get_visible_clinician_ids(cls, user_role: str, clinician_id: int = None,
+                                   clinician_ids: Optional[List[int]] = None) -> Optional[List[int]]:
+        """Clinicians whose events a request can see, or None for all clinicians"""
+        if user_role != 'CLINICIAN':
+            return clinician_ids
+        own_id = Clinician.objects.filter(login_id=clinician_id).values_list('id', flat=True).first()
+        if own_id is None or (clinician_ids is not None and own_id not in clinician_ids):
             return []
+        return [own_id]
+
+    @classmethod
+    def _get_series_clinicians(cls, event: Event) -> Dict[int, int]:
+        """Clinician of every event in the series of an event, by event ID"""
+        parent_id = event.parent_event_id or event.id
+        return dict(Event.objects.filter(
+            Q(id=parent_id) | Q(parent_event_id=parent_id)
+        ).values_list('id', 'clinician_id'))
+
+    @classmethod
+    def _get_series_clinician_ids(cls, event: Event) -> set:
+        """Clinicians of every event in the series of an event, whose cached windows a write can change"""
+        return set(cls._get_series_clinicians(event).values())
 
-        return [cls._convert_event_to_dict(event) for event in events]
+    @classmethod
+    def _encode_json_array(cls, items: Iterable[Dict[str, Any]]) -> Iterator[bytes]:
+        """Encode items as a JSON array, yielding a chunk every STREAM_CHUNK_SIZE items"""
+        chunk = ['[']
+        separator = ''
+        for count, item in enumerate(items, 1):
+            chunk.append(separator)
+            chunk.append(json.dumps(item))
+            separator = ','
+            if count % cls.STREAM_CHUNK_SIZE == 0:
+                yield ''.join(chunk).encode()
+                chunk = []
+        chunk.append(']')
+        yield ''.join(chunk).encode()
     
     @classmethod
-    def get_event_data(cls, event_id: int) -> Dict[str, Any]:
+    def get_event_data(cls, event_id: Union[int, str]) -> Dict[str, Any]:
         """Get event data for a specific event by event ID, including associated services and client information"""
-        try:
-            event = Event.objects.get(id=event_id)
+        return cls.get_events_data([event_id]).get(str(event_id), {'error': 'Event not found'})
+
+    @classmethod
+    def get_events_data(cls, event_ids: List[Union[int, str]]) -> Dict[str, Dict[str, Any]]:
+        """
+        Get the get_event_data details of many events at once, keyed by the requested ID
+
+        Events, services and previous visits are read in three queries whatever the number of
+        events; only virtual occurrences, which have no row of their own, add one query each
+        for their previous visits. Unknown IDs are left out of the result.
+        """
+        requested = {}
+        for event_id in event_ids:
+            try:
+                requested[str(event_id)] = cls._parse_occurrence_id(event_id)
+            except ValidationError:
+                continue
+
+        stored = Event.objects.select_related('patient', 'location').in_bulk(
+            {row_id for row_id, _ in requested.values()}
+        )
+
+        events = {}
+        for key, (row_id, occurrence_date) in requested.items():
+            if row_id not in stored:
+                continue
+            if occurrence_date:
+                # Virtual occurrence: describe it from its series parent
+                try:
+                    events[key] = cls._get_virtual_occurrence(stored[row_id], occurrence_date)
+                except ValidationError:
+                    continue
+                events[key].patient = stored[row_id].patient
+                events[key].location = stored[row_id].location
+            else:
+                events[key] = stored[row_id]
+
+        appointments = {
+            key: event for key, event in events.items()
+            if LookupService.get_event_type_name(event.type_id) == EventType.APPOINTMENT and event.patient
+        }
+        services = {}
+        for service in EventService.objects.filter(
+            event_id__in={cls.get_services_event_id(event) for event in appointments.values()}
+        ).values('event_id', 'service_id', 'fee', 'modifiers'):
+            services.setdefault(service.pop('event_id'), []).append(service)
+        last_events = cls._get_last_events([event for event in appointments.values() if event.id is not None])
+
+        events_data = {}
+        for key, event in events.items():
+            row_id, occurrence_date = requested[key]
             event_data = cls._convert_event_to_dict(event)
+            if occurrence_date:
+                event_data.update(cls._get_occurrence_fields(row_id, event.start_datetime, event.end_datetime))
 
-            # Fetch client information if the event is an appointment
-            if event.type.name == EventType.APPOINTMENT and event.patient:
+            # Client information if the event is an appointment
+            if key in appointments:
                 event_data['Client'] = {
                     'id': event.patient.id,
                     'full_name': event.patient.get_full_name(),
                     'email': event.patient.email,
                     'phone': event.patient.phone,
                 }
-                # Fetch associated services
-                event_services = EventService.objects.filter(event=event).values(
-                    'service_id', 'fee', 'modifiers'
-                )
-                event_data['services'] = list(event_services)
+                event_data['services'] = services.get(cls.get_services_event_id(event), [])
 
-                # Fetch appointment state
-                if event.status:
+                if event.status_id:
                     event_data['Status'] = {
-                        'id': event.status.id,
-                        'name': event.status.name,
+                        'id': event.status_id,
+                        'name': LookupService.get_state_name(event.status_id),
                     }
 
-                # Fetch last 2 events for the same clinician and patient
-                last_events = Event.objects.filter(
-                clinician=event.clinician,
-                patient=event.patient,
-                start_datetime__lt=event.start_datetime 
-                ).exclude(id=event_id).order_by('-start_datetime')[:2] 
-
-                event_data['last_events'] = [
-                    {
-                        'id': event.id, 
-                        'date': event.start_datetime.date().strftime('%m/%d/%Y')
-                    } 
-                    for event in last_events
-                ]
+                if event.id is None:
+                    event_data['last_events'] = cls._get_last_events_before(event, exclude_id=row_id)
+                else:
+                    event_data['last_events'] = last_events.get(event.id, [])
 
-            return event_data
-        except Event.DoesNotExist:
-            return {'error': 'Event not found'}
+            events_data[key] = event_data
+        return events_data
+
+    @classmethod
+    def _format_last_event(cls, event_id: int, start_datetime: datetime) -> Dict[str, Any]:
+        return {
+            'id': event_id,
+            'date': start_datetime.date().strftime('%m/%d/%Y')
+        }
+
+    @classmethod
+    def _get_last_events(cls, events: List[Event]) -> Dict[int, List[Dict[str, Any]]]:
+        """
+        Last 2 earlier events of the same clinician and patient for each of the given stored events
+
+        One query: each requested row looks up the events of its pair that start strictly before it,
+        so an event booked at the same time does not count as a previous visit.
+        """
+        if not events:
+            return {}
+
+        earlier = Event.objects.filter(
+            clinician_id=OuterRef('clinician_id'),
+            patient_id=OuterRef('patient_id'),
+            start_datetime__lt=OuterRef('start_datetime')
+        ).order_by('-start_datetime', '-id')
+
+        rows = Event.objects.filter(
+            id__in=[event.id for event in events]
+        ).annotate(
+            previous_id=Subquery(earlier.values('id')[:1]),
+            previous_start=Subquery(earlier.values('start_datetime')[:1]),
+            second_previous_id=Subquery(earlier.values('id')[1:2]),
+            second_previous_start=Subquery(earlier.values('start_datetime')[1:2]),
+        ).values_list('id', 'previous_id', 'previous_start', 'second_previous_id', 'second_previous_start')
+
+        last_events = {}
+        for row_id, previous_id, previous_start, second_previous_id, second_previous_start in rows:
+            last_events[row_id] = [
+                cls._format_last_event(last_id, last_start)
+                for last_id, last_start in ((previous_id, previous_start), (second_previous_id, second_previous_start))
+                if last_id is not None
+            ]
+        return last_events
+
+    @classmethod
+    def _get_last_events_before(cls, event: Event, exclude_id: int) -> List[Dict[str, Any]]:
+        """Last 2 events of the same clinician and patient before an event that is not stored"""
+        last_events = Event.objects.filter(
+            clinician_id=event.clinician_id,
+            patient_id=event.patient_id,
+            start_datetime__lt=event.start_datetime
+        ).exclude(id=exclude_id).order_by('-start_datetime').values_list('id', 'start_datetime')[:2]
+        return [cls._format_last_event(last_id, last_start) for last_id, last_start in last_events]
     
     @classmethod
     def _convert_event_to_dict(cls, event: Event) -> Dict[str, Any]:
         """Convert event model to dictionary format"""
+        type_name = LookupService.get_event_type_name(event.type_id)
         event_dict = {
             'Id': event.id,
             'StartTime': event.start_datetime.strftime('%Y-%m-%dT%H:%M:%S.000Z'),
@@ -160,41 +472,87 @@ class SchedulerDataService:
             'ResourceId': event.clinician_id,
             'RecurrenceRuleString': event.recurrence_rule if event.is_recurring else None,
             'IsRecurring': event.is_recurring,
-            'AppointmentTotal': event.appointment_total if event.type.name == EventType.APPOINTMENT else None,
+            'AppointmentTotal': event.appointment_total if type_name == EventType.APPOINTMENT else None,
             }
             
         # Add type-specific fields
-        if event.type.name == EventType.APPOINTMENT:
+        if type_name == EventType.APPOINTMENT:
             event_dict.update({
-                'Type': event.type.name,
+                'Type': type_name,
                 'Subject': f"Appointment - {event.patient.get_full_name() if event.patient else 'No Patient'}",
                 'Description': f"Patient Appointment at {event.location.name if event.location else 'No Location'}",
-                'Status': event.status.name if event.status else None,
-                'Client': event.patient.id if event.patient else None,
-                'Location': event.location.id if event.location else None,
-                'Clinician': event.clinician.id if event.clinician else None,
+                'Status': LookupService.get_state_name(event.status_id),
+                'Client': event.patient_id,
+                'Location': event.location_id,
+                'Clinician': event.clinician_id,
             })
-        elif event.type.name == EventType.EVENT:
+        elif type_name == EventType.EVENT:
             event_dict.update({
-                'Type': event.type.name,
+                'Type': type_name,
                 'Subject': event.title,
                 'Description': event.notes,
-                'Status': event.status.name if event.status else None,
-                'Clinician': event.clinician.id if event.clinician else None,
-                'Location': event.location.id if event.location else None,
+                'Status': LookupService.get_state_name(event.status_id),
+                'Clinician': event.clinician_id,
+                'Location': event.location_id,
             })
         else:  # OUT_OF_OFFICE
             event_dict.update({
-                'Type': event.type.name,
+                'Type': type_name,
                 'Subject': 'Out of Office',
                 'Description': event.notes,
-                'Clinician': event.clinician.id if event.clinician else None,
+                'Clinician': event.clinician_id,
                 'IsCancelAppointment': event.cancel_appointments,
                 'IsNotifyClient': event.notify_clients,
             })
 
         return event_dict
 
+    @classmethod
+    def _convert_row_to_dict(cls, row: Any) -> Dict[str, Any]:
+        """Convert an EVENT_COLUMNS row to the same dictionary format as _convert_event_to_dict"""
+        type_name = LookupService.get_event_type_name(row.type_id)
+        event_dict = {
+            'Id': row.id,
+            'StartTime': row.start_datetime.strftime('%Y-%m-%dT%H:%M:%S.000Z'),
+            'EndTime': row.end_datetime.strftime('%Y-%m-%dT%H:%M:%S.000Z'),
+            'IsAllDay': row.is_all_day,
+            'ResourceId': row.clinician_id,
+            'RecurrenceRuleString': row.recurrence_rule if row.is_recurring else None,
+            'IsRecurring': row.is_recurring,
+            'AppointmentTotal': row.appointment_total if type_name == EventType.APPOINTMENT else None,
+            'Type': type_name,
+        }
+
+        # Add type-specific fields
+        if type_name == EventType.APPOINTMENT:
+            patient_name = f"{row.patient__first_name} {row.patient__last_name}" if row.patient_id else 'No Patient'
+            event_dict.update({
+                'Subject': f"Appointment - {patient_name}",
+                'Description': f"Patient Appointment at {row.location__name if row.location_id else 'No Location'}",
+                'Status': LookupService.get_state_name(row.status_id),
+                'Client': row.patient_id,
+                'Location': row.location_id,
+                'Clinician': row.clinician_id,
+            })
+        elif type_name == EventType.EVENT:
+            event_dict.update({
+                'Subject': row.title,
+                'Description': row.notes,
+                'Status': LookupService.get_state_name(row.status_id),
+                'Clinician': row.clinician_id,
+                'Location': row.location_id,
+            })
+        else:  # OUT_OF_OFFICE
+            event_dict.update({
+                'Subject': 'Out of Office',
+                'Description': row.notes,
+                'Clinician': row.clinician_id,
+                'IsCancelAppointment': row.cancel_appointments,
+                'IsNotifyClient': row.notify_clients,
+            })
+
+        return event_dict
+
     @classmethod
     def get_clients(cls) -> List[Dict[str, Any]]:
         """Get all clients (patients)"""
@@ -244,6 +602,79 @@ class SchedulerDataService:
                     'phone'
                 ))
 
+    #region client directory
+
+    # Clients per directory page, the first of which is embedded in the dashboard page
+    CLIENT_PAGE_SIZE = 50
+
+    @classmethod
+    def _encode_client_cursor(cls, last_name: str, first_name: str, client_id: int) -> str:
+        return base64.urlsafe_b64encode(json.dumps([last_name, first_name, client_id]).encode()).decode()
+
+    @classmethod
+    def _parse_client_cursor(cls, cursor: str) -> Tuple[str, str, int]:
+        """
+        Raises:
+            ValidationError: If the cursor was not issued by get_client_page
+        """
+        try:
+            last_name, first_name, client_id = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+            return str(last_name), str(first_name), int(client_id)
+        except (TypeError, ValueError, UnicodeError):
+            raise ValidationError(f"Invalid client cursor: {cursor}")
+
+    @classmethod
+    def get_client_page(cls, login_id: Optional[int] = None, query: Optional[str] = None,
+                        cursor: Optional[str] = None, limit: Optional[int] = None) -> Dict[str, Any]:
+        """
+        Get a page of clients in last name, first name order
+
+        Pages are read by keyset on the (last_name, first_name) index: each starts after the last
+        client of the previous one, so any page costs the same as the first.
+
+        Args:
+            login_id: Clinician's login ID to list only their active clients, all clients if None
+            query: Start of words of the clients' names or email, see PatientSearchService
+            cursor: The next value of the previous page
+
+        Returns:
+            Dict with the clients, as id, name, email and phone, and the cursor of the next page or None
+
+        Raises:
+            ValidationError: If the cursor is malformed
+        """
+        limit = min(limit or cls.CLIENT_PAGE_SIZE, cls.CLIENT_PAGE_SIZE)
+        patients = Patient.objects.all()
+        if login_id is not None:
+            patients = patients.filter(
+                careteam__clinician__login_id=login_id,
+                careteam__status='ACTIVE'
+            )
+        patients = PatientSearchService.filter(patients, query)
+        if cursor:
+            last_name, first_name, client_id = cls._parse_client_cursor(cursor)
+            # The redundant last_name__gte gives the index a range to seek to
+            patients = patients.filter(last_name__gte=last_name).filter(
+                Q(last_name__gt=last_name) |
+                Q(last_name=last_name, first_name__gt=first_name) |
+                Q(last_name=last_name, first_name=first_name, id__gt=client_id)
+            )
+
+        rows = list(patients.order_by('last_name', 'first_name', 'id').values(
+            'id', 'first_name', 'last_name', 'email', 'phone'
+        )[:limit + 1])
+        page = rows[:limit]
+        return {
+            'clients': [
+                {'id': row['id'], 'name': f"{row['first_name']} {row['last_name']}", 'email': row['email'], 'phone': row['phone']}
+                for row in page
+            ],
+            'next': cls._encode_client_cursor(page[-1]['last_name'], page[-1]['first_name'], page[-1]['id'])
+                    if len(rows) > limit else None
+        }
+
+    #endregion client directory
+
     @classmethod
     def get_location_by_clinician_login_id(cls, login_id: int) -> List[Dict[str, Any]]:
         """Get all locations by clinician based on login ID"""
@@ -255,31 +686,24 @@ class SchedulerDataService:
     
     @classmethod
     def get_locations(cls) -> List[Dict[str, Any]]:
-        """Get all locations"""
-        return Location.objects.values('id', 'name', 'type', 'color')
+        """Get all locations, cached until locations change"""
+        return ReferenceCacheService.get(
+            'locations', ReferenceCacheService.LOCATIONS,
+            lambda: Location.objects.values('id', 'name', 'type', 'color')
+        )
 
     @classmethod
     def search_clients(cls, query: str) -> List[Dict[str, Any]]:
-        """Search clients by name or email"""
-        return Patient.objects.annotate(
-            name=Concat(
-                F('first_name'),
-                Value(' '),
-                F('last_name'),
-                output_field=CharField()
-            )
-        ).filter(
-            Q(first_name__icontains=query) |
-            Q(last_name__icontains=query) |
-            Q(email__icontains=query)
-        ).values('id', 'name', 'email', 'phone')
+        """Search clients by the start of words of their name or email, see PatientSearchService"""
+        return PatientSearchService.search(query)
     
     @classmethod
     def get_team_members(cls) -> List[Dict[str, Any]]:
-        """Get all team members (clinicians)"""
-        return Clinician.objects.annotate(
-            name=Concat('first_name', Value(' '), 'last_name')
-        ).values('id', 'name')
+        """Get all team members (clinicians), cached until clinicians change"""
+        return ReferenceCacheService.get(
+            'team_members', ReferenceCacheService.CLINICIANS,
+            lambda: Clinician.objects.annotate(name=Concat('first_name', Value(' '), 'last_name')).values('id', 'name')
+        )
 
 
     @classmethod
@@ -292,8 +716,11 @@ class SchedulerDataService:
     
     @classmethod
     def get_practice_services(cls) -> List[Dict[str, Any]]:
-        """Get all practice services"""
-        return PracticeService.objects.values('id', 'type', 'rate', 'code', 'description')
+        """Get all practice services, cached until services change"""
+        return ReferenceCacheService.get(
+            'practice_services', ReferenceCacheService.SERVICES,
+            lambda: PracticeService.objects.values('id', 'type', 'rate', 'code', 'description')
+        )
     
 
     @classmethod
@@ -308,64 +735,23 @@ class SchedulerDataService:
             - id: Clinician ID
             - name: Full name
         """
-        # Get all clinicians with user type 'ADMIN'
-        admin_clinicians = Clinician.objects.filter(
-            login_id__in=Login.objects.filter(user_type='ADMIN').values('id')
-        ).annotate(
-            name=Concat('first_name', Value(' '), 'last_name')
-        )
-
-        # Get assigned clinicians with relationship details from CareTeam
-        assigned_clinicians = Clinician.objects.filter(
-            careteam__patient_id=patient_id
-        ).annotate(
-            name=Concat('first_name', Value(' '), 'last_name')
-        )
-
-        # Combine and return results
-        combined_clinicians = admin_clinicians | assigned_clinicians
-
-        return list(combined_clinicians.values(
-            'id', 
-            'name'
-        ).distinct())
+        return BookableClinicianService.get_clinicians(patient_id)
     
     @classmethod
-    def search_clinicians(cls, patient_id: int, query: str) -> List[Dict[str, Any]]:
+    def search_clinicians(cls, patient_id: Optional[int], query: str) -> List[Dict[str, Any]]:
         """
         Search clinicians by name including:
         - Admin clinicians 
         - Active care team members for the patient
         
         Args:
-            patient_id: ID of the patient
+            patient_id: ID of the patient, or None to search every clinician
             query: Search string to filter clinicians by name
             
         Returns:
             List of dictionaries containing clinician id and full name
         """
-        # Get all clinicians with user type 'ADMIN'
-        admin_clinicians = Clinician.objects.filter(
-            login_id__in=Login.objects.filter(user_type='ADMIN').values('id')
-        )
-
-        # Get clinicians from active care team
-        care_team_clinicians = Clinician.objects.filter(
-            careteam__patient_id=patient_id,
-            careteam__status='ACTIVE'
-        )
-
-        # Combine both querysets and apply the search query
-        combined_clinicians = admin_clinicians | care_team_clinicians
-
-        return list(combined_clinicians.filter(
-            Q(first_name__icontains=query) | Q(last_name__icontains=query)
-        ).annotate(
-            name=Concat('first_name', Value(' '), 'last_name'),
-        ).values(
-            'id', 
-            'name'
-        ).distinct()) 
+        return BookableClinicianService.search(query, patient_id)
     
     @classmethod
     def get_clinician_services(cls, clinician_id: int, patient_id: int) -> Dict[str, Any]:
@@ -380,99 +766,7 @@ class SchedulerDataService:
             Dict containing either clinician_services or practice_services, 
             along with patient_default_services
         """
-        # Check if clinician is in patient's active care team
-        is_assigned = CareTeam.objects.filter(
-            patient_id=patient_id,
-            clinician_id=clinician_id,
-            status='ACTIVE'
-        ).exists()
-
-        # Get patient default services
-        patient_defaults = PatientDefaultService.objects.filter(
-            patient_id=patient_id
-        ).select_related('service').values(
-            'service_id',
-            'custom_rate',
-            'is_primary',
-            'service__id',
-            'service__type',
-            'service__rate',
-            'service__code',
-            'service__description',
-            'service__duration'
-        )
-
-        # Process default services to match service structure
-        processed_default_services = []
-        for default in patient_defaults:
-            processed_default_services.append({
-                'id': default['service__id'],
-                'type': default['service__type'],
-                'rate': float(default['custom_rate'] if default['custom_rate'] is not None else default['service__rate']),
-                'code': default['service__code'],
-                'description': default['service__description'],
-                'duration': default['service__duration'],
-                'is_primary': default['is_primary']
-            })
-
-        if is_assigned:
-            # Get clinician's active services
-            clinician_services = ClinicianService.objects.filter(
-                clinician_id=clinician_id,
-                is_active=True
-            ).select_related('service').values(
-                'service__id',
-                'service__type',
-                'custom_rate',
-                'service__code',
-                'service__description',
-                'service__duration',
-                'service__rate'
-            )
-
-            # Process clinician services
-            services_data = []
-            for service in clinician_services:
-                services_data.append({
-                    'id': service['service__id'],
-                    'type': service['service__type'],
-                    'rate': float(service['custom_rate'] if service['custom_rate'] is not None else service['service__rate']),
-                    'code': service['service__code'],
-                    'description': service['service__description'],
-                    'duration': service['service__duration']
-                })
-
-            return {
-                'clinician_services': services_data,
-                'patient_default_services': processed_default_services
-            }
-        else:
-            # Get all practice services
-            practice_services = PracticeService.objects.all().values(
-                'id',
-                'type',
-                'rate',
-                'code',
-                'description',
-                'duration'
-            )
-
-            # Process practice services
-            services_data = []
-            for service in practice_services:
-                services_data.append({
-                    'id': service['id'],
-                    'type': service['type'],
-                    'rate': float(service['rate']),
-                    'code': service['code'],
-                    'description': service['description'],
-                    'duration': service['duration']
-                })
-
-            return {
-                'practice_services': services_data,
-                'patient_default_services': processed_default_services
-            }
+        return ServicePriceService.get_services(clinician_id, patient_id)
     
     @classmethod
     def get_clinician_locations(cls, clinician_id: int) -> List[Dict[str, Any]]:
@@ -503,10 +797,33 @@ class SchedulerDataService:
             color=F('location__color')
         ).values('id', 'name', 'type', 'color'))
 
+    @classmethod
+    def get_bootstrap_data(cls, user: User) -> Dict[str, Any]:
+        """
+        Reference data the scheduler of a user needs, in one payload
+
+        Clinicians get their own resource and locations and no team members, as their dashboard
+        shows them. Built from the cached readers, so it rarely queries the database.
+        """
+        resources = cls.get_resources(user.user_type, user)
+        is_clinician = user.user_type == 'CLINICIAN'
+        if is_clinician:
+            locations = cls.get_clinician_locations(resources[0]['id']) if resources else []
+        else:
+            locations = cls.get_locations()
+        return {
+            'resources': resources,
+            'locations': locations,
+            'team_members': [] if is_clinician else cls.get_team_members(),
+            'appointment_states': cls.get_appointment_states(),
+            'practice_services': cls.get_practice_services(),
+            'is_clinician': is_clinician,
+        }
+
     @classmethod
     def get_appointment_states(cls) -> List[Dict[str, Any]]:
         """Get all appointment states"""
-        return list(AppointmentState.objects.values('id', 'name'))
+        return LookupService.get_appointment_states()
     
     @classmethod
     def create_event(cls, data: Dict[str, Any]) -> Dict[str, Any]:
@@ -522,27 +839,43 @@ class SchedulerDataService:
         if isinstance(end_time, str):
             end_time = datetime.fromisoformat(end_time.replace('Z', '+00:00'))
 
+        cls._validate_event_duration(start_time, end_time, event_type)
+
         # If it's a recurring event, get the first occurrence date
         if recurrence_rule and event_type != 'OUT_OF_OFFICE':
             try:
-                recurring_dates = cls._get_future_dates_from_rule(start_time, recurrence_rule)
-                if recurring_dates:
+                first_occurrence = RecurrenceService.get_first_occurrence(recurrence_rule, start_time.astimezone(cls.TIMEZONE))
+                if first_occurrence:
                     event_duration = end_time - start_time
-                    start_time = recurring_dates[0]
+                    start_time = first_occurrence
                     end_time = start_time + event_duration
             except Exception as e:
                 print(f"Error getting first occurrence date: {str(e)}")
 
+        if event_type != 'OUT_OF_OFFICE':
+            event_data = data.get('eventData')
+            clinician = event_data.get('Clinician') if event_type == 'APPOINTMENT' else event_data.get('TeamMember')
+            cls._check_conflicts(
+                event_data,
+                AvailabilityService.get_rule_intervals(recurrence_rule, start_time, end_time),
+                clinician_id=(clinician or {}).get('id'),
+                patient_id=(event_data.get('Client') or {}).get('id') if event_type == 'APPOINTMENT' else None,
+                location_id=(event_data.get('Location') or {}).get('id')
+            )
+
+        is_virtual_series = bool(recurrence_rule) and event_type != 'OUT_OF_OFFICE' and cls._use_virtual_recurrence()
+
         # Common event fields
         common_fields = {
-            'type_id': EventType.objects.get(name=event_type).id,
+            'type_id': LookupService.get_event_type_id(event_type),
             'start_datetime': start_time,
             'end_datetime': end_time,
             'is_all_day': data.get('eventData').get('IsAllDay', False),
             'status_id': 1,  # Default status
             'is_recurring': bool(recurrence_rule),
             'recurrence_rule': recurrence_rule,
-            'parent_event': None
+            'parent_event': None,
+            'is_virtual_series': is_virtual_series
         }
 
         try:
@@ -590,20 +923,83 @@ class SchedulerDataService:
                     notify_clients=data.get('eventData').get('NotifyClients', False),
                 )
 
-            # Handle recurring events in background thread
-            if recurrence_rule and event_type != 'OUT_OF_OFFICE':
-                threading.Thread(
-                    target=cls._handle_recurring_events,
-                    args=(event, recurrence_rule, data.get('eventData')),
-                    daemon=True
-                ).start()
+            CalendarCacheService.invalidate_clinicians([event.clinician_id])
+
+            event_dict = cls._convert_event_to_dict(event)
+
+            # Occurrences are created by the scheduler worker; virtual series are expanded on read
+            if recurrence_rule and event_type != 'OUT_OF_OFFICE' and not is_virtual_series:
+                job = JobService.enqueue(SchedulerJob.MATERIALIZE_SERIES, {'event_id': event.id})
+                event_dict['JobId'] = job.id
 
-            return cls._convert_event_to_dict(event)
+            return event_dict
 
         except Exception as e:
             print(f"Error creating event: {str(e)}")
             raise    
 
+    #region conflicts
+
+    @classmethod
+    def _check_conflicts(cls, event_data: Dict[str, Any], intervals: List[Tuple[datetime, datetime]],
+                         clinician_id: Optional[int] = None, patient_id: Optional[int] = None,
+                         location_id: Optional[int] = None, exclude_ids: Iterable[int] = (),
+                         exclude_series_id: Optional[int] = None) -> None:
+        """
+        Reject a booking that overlaps existing events, unless the user chose to allow it
+
+        Raises:
+            SchedulingConflictError: With the conflicting events, when eventData.AllowConflicts is not set
+        """
+        if event_data.get('AllowConflicts'):
+            return
+        conflicts = AvailabilityService.find_conflicts(
+            intervals, clinician_id=clinician_id, patient_id=patient_id, location_id=location_id,
+            exclude_ids=exclude_ids, exclude_series_id=exclude_series_id
+        )
+        if conflicts:
+            raise SchedulingConflictError(conflicts)
+
+    @classmethod
+    def _get_booking_key(cls, event: Event) -> Tuple[Any, ...]:
+        """What an edit must change for the event to be checked for conflicts again"""
+        return (event.start_datetime, event.end_datetime, event.clinician_id, event.patient_id,
+                event.location_id, event.recurrence_rule, event.status_id)
+
+    @classmethod
+    def _check_updated_conflicts(cls, event: Event, booking_key: Tuple[Any, ...], edit_type: str,
+                                 event_data: Dict[str, Any]) -> None:
+        """
+        Check an edited event, or its whole series after a series edit, against other bookings
+
+        Runs after the edit inside its transaction, so the stored result is checked whatever
+        path the edit took; raising rolls it back. Edits that keep the times, people, location,
+        rule and state, such as a new title, are not checked again.
+
+        Raises:
+            SchedulingConflictError: If the result overlaps other events
+        """
+        if (event_data.get('AllowConflicts')
+                or cls._get_booking_key(event) == booking_key
+                or event.type_id == LookupService.get_event_type_id('OUT_OF_OFFICE')
+                or event.status_id in AvailabilityService.get_free_state_ids()):
+            return
+
+        series = event.parent_event or event
+        if edit_type == cls.UpdateType.SERIES and series.is_recurring:
+            intervals = AvailabilityService.get_series_intervals(series)
+            exclude_ids, exclude_series_id = (), series.id
+        else:
+            intervals = [(event.start_datetime, event.end_datetime)]
+            exclude_ids, exclude_series_id = (event.id,), None
+
+        cls._check_conflicts(
+            event_data, intervals, clinician_id=event.clinician_id, patient_id=event.patient_id,
+            location_id=event.location_id, exclude_ids=exclude_ids, exclude_series_id=exclude_series_id
+        )
+
+    #endregion conflicts
+
     #region update events
 
     class UpdateType:
@@ -628,10 +1024,13 @@ class SchedulerDataService:
     def _get_common_fields(cls, event_data: Dict[str, Any]) -> Dict[str, Any]:
         """Extract and validate common fields from event data"""
         try:
+            start_datetime = cls._parse_datetime(event_data.get('StartTime'))
+            end_datetime = cls._parse_datetime(event_data.get('EndTime'))
+            cls._validate_event_duration(start_datetime, end_datetime, event_data.get('eventType'))
             return {
-                'type_id': EventType.objects.get(name=event_data.get('eventType')).id,
-                'start_datetime': cls._parse_datetime(event_data.get('StartTime')),
-                'end_datetime': cls._parse_datetime(event_data.get('EndTime')),
+                'type_id': LookupService.get_event_type_id(event_data.get('eventType')),
+                'start_datetime': start_datetime,
+                'end_datetime': end_datetime,
                 'is_all_day': event_data.get('IsAllDay', False),
                 'location_id': event_data.get('Location', {}).get('id'),
                 'cancel_appointments': event_data.get('IsCancelAppointment', False),
@@ -639,13 +1038,25 @@ class SchedulerDataService:
             }
         except EventType.DoesNotExist:
             raise ValidationError(f"Invalid event type: {event_data.get('eventType')}")
+        except ValidationError:
+            raise
         except Exception as e:
             raise ValidationError(f"Error processing event data: {str(e)}")
 
     @classmethod
     def update_event_services(cls, event: 'Event', services: List[Dict[str, Any]]) -> None:
-        """Update event services efficiently"""
+        """
+        Update event services efficiently
+
+        An occurrence inheriting its series' services only gets rows of its own when the new
+        services differ from the series'; the caller saves the event.
+        """
         with transaction.atomic():
+            if event.inherits_services:
+                if cls._get_service_keys(services) == cls._get_stored_service_keys(event.parent_event_id):
+                    return
+                event.inherits_services = False
+
             current_services = set(EventService.objects.filter(event=event).values_list('service_id', flat=True))
             new_services = {service.get('serviceId') for service in services}
             
@@ -666,50 +1077,120 @@ class SchedulerDataService:
                 )
 
     @classmethod
-    def _update_appointment_specific_fields(cls, event: 'Event', event_data: Dict[str, Any]) -> None:
-        """Update appointment-specific fields"""
-        event.appointment_total = event_data.get('AppointmentTotal')
-        event.clinician_id = event_data.get('Clinician').get('id')
-        event.status_id = event_data.get('StateId')
-        if event_data.get('Services'):
-            cls.update_event_services(event, event_data.get('Services'))
-    
+    def _get_service_keys(cls, services: List[Dict[str, Any]]) -> set:
+        """Comparable (service, fee, modifiers) of services as sent by the editor"""
+        return {
+            (
+                int(service.get('serviceId')),
+                float(service['fee']) if service.get('fee') is not None else None,
+                ', '.join(service.get('modifiers', []))
+            )
+            for service in services
+        }
+
     @classmethod
-    def _update_event_specific_fields(cls, event: 'Event', event_data: Dict[str, Any]) -> None:
-        """Update event-specific fields"""
-        event.title = event_data.get('Subject')
-        event.clinician_id = event_data.get('TeamMember').get('id')
+    def _get_stored_service_keys(cls, event_id: int) -> set:
+        """Comparable (service, fee, modifiers) of an event's EventService rows"""
+        return {
+            (service_id, fee, modifiers or '')
+            for service_id, fee, modifiers in EventService.objects.filter(event_id=event_id).values_list(
+                'service_id', 'fee', 'modifiers'
+            )
+        }
 
     @classmethod
-    def _update_out_of_office_specific_fields(cls, event: 'Event', event_data: Dict[str, Any]) -> None:
-        """Update out of office-specific fields"""
-        event.clinician_id = event_data.get('TeamMember').get('id')
-        event.cancel_appointments = event_data.get('CancelAppointments', False)
-        event.notify_clients = event_data.get('NotifyClients', False)
-       
+    def get_services_event_id(cls, event: 'Event') -> Optional[int]:
+        """ID of the event whose EventService rows hold an event's services, its series parent's for inheriting or virtual occurrences"""
+        return event.parent_event_id if event.id is None or event.inherits_services else event.id
 
     @classmethod
-    def _update_base_event_fields(cls, event: 'Event', common_fields: Dict[str, Any], 
-                                event_data: Dict[str, Any]) -> None:
-        """Update base event fields with validation"""
-        for field, value in common_fields.items():
-            if value is not None:  # Only update non-None values
-                setattr(event, field, value)
-        
+    def _pin_inherited_services(cls, parent: 'Event', services: List[Dict[str, Any]]) -> None:
+        """Before a series parent's services change on it alone, give the occurrences inheriting them their own copy"""
+        if cls._get_service_keys(services) == cls._get_stored_service_keys(parent.id):
+            return
+        inheriting = Event.objects.filter(parent_event=parent, inherits_services=True)
+        parent_services = list(EventService.objects.filter(event=parent))
+        EventService.objects.bulk_create([
+            EventService(event_id=event_id, service_id=service.service_id, fee=service.fee, modifiers=service.modifiers)
+            for event_id in inheriting.values_list('id', flat=True)
+            for service in parent_services
+        ], batch_size=getattr(settings, 'SCHEDULER_BULK_CREATE_BATCH_SIZE', 90))
+        inheriting.update(inherits_services=False, updated_at=timezone.now())
+
+    @classmethod
+    def _detach_services(cls, event: 'Event') -> None:
+        """Give an occurrence its own copy of the series' services before it leaves the series; the caller saves it"""
+        if event.inherits_services:
+            cls._copy_services(event.parent_event, event)
+            event.inherits_services = False
+
+    @classmethod
+    def _get_event_field_values(cls, common_fields: Dict[str, Any], event_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Field values an edit sets on an event, common and type-specific"""
+        values = {field: value for field, value in common_fields.items() if value is not None}
+
         if event_data.get('eventType') == 'APPOINTMENT':
-            cls._update_appointment_specific_fields(event, event_data)
+            values.update({
+                'appointment_total': event_data.get('AppointmentTotal'),
+                'clinician_id': event_data.get('Clinician').get('id'),
+                'status_id': event_data.get('StateId')
+            })
         if event_data.get('eventType') == 'EVENT':
-            cls._update_event_specific_fields(event, event_data)
+            values.update({
+                'title': event_data.get('Subject'),
+                'clinician_id': event_data.get('TeamMember').get('id')
+            })
         if event_data.get('eventType') == 'OUT_OF_OFFICE':
-            cls._update_out_of_office_specific_fields(event, event_data)
+            values.update({
+                'clinician_id': event_data.get('TeamMember').get('id'),
+                'cancel_appointments': event_data.get('CancelAppointments', False),
+                'notify_clients': event_data.get('NotifyClients', False)
+            })
+        return values
+
+    @classmethod
+    def _update_base_event_fields(cls, event: 'Event', common_fields: Dict[str, Any], 
+                                event_data: Dict[str, Any]) -> None:
+        """Update base event fields with validation"""
+        for field, value in cls._get_event_field_values(common_fields, event_data).items():
+            setattr(event, field, value)
+
+        if event_data.get('eventType') == 'APPOINTMENT' and event_data.get('Services'):
+            cls.update_event_services(event, event_data.get('Services'))
+
+    @classmethod
+    def _update_series_events(cls, events: QuerySet, time_diff: timedelta, common_fields: Dict[str, Any],
+                              event_data: Dict[str, Any], **extra_values) -> None:
+        """
+        Shift many events of a series by -time_diff and apply an edit's shared fields to them
+
+        Runs as a few set-based statements whatever the number of events. Services set by the
+        edit are the parent's; the events drop their own and inherit them.
+        """
+        if event_data.get('eventType') == 'APPOINTMENT' and event_data.get('Services'):
+            EventService.objects.filter(event__in=events).delete()
+            extra_values['inherits_services'] = True
+
+        values = cls._get_event_field_values(
+            {k: v for k, v in common_fields.items() if k not in ['start_datetime', 'end_datetime']},
+            event_data
+        )
+        events.update(
+            start_datetime=F('start_datetime') - time_diff,
+            end_datetime=F('end_datetime') - time_diff,
+            updated_at=timezone.now(),
+            **values,
+            **extra_values
+        )
 
     @classmethod
     def _handle_series_update_timing(cls, events: QuerySet, time_diff: timedelta) -> None:
         """Update timing for a series of events"""
-        for event in events:
-            event.start_datetime -= time_diff
-            event.end_datetime -= time_diff
-            event.save(update_fields=['start_datetime', 'end_datetime'])
+        events.update(
+            start_datetime=F('start_datetime') - time_diff,
+            end_datetime=F('end_datetime') - time_diff,
+            updated_at=timezone.now()
+        )
 
     @classmethod
     def _update_series_child(cls, event: 'Event', common_fields: Dict[str, Any], 
@@ -720,12 +1201,22 @@ class SchedulerDataService:
             future_events = Event.objects.filter(
                 parent_event=event.parent_event,
                 start_datetime__gt=event.start_datetime
-            ).select_for_update().order_by('start_datetime')
+            ).exclude(id=event.id)
             
             # Calculate time difference
             time_diff = event.start_datetime - common_fields['start_datetime']
             
-            # Update current event as new parent
+            # Update current event as new parent; the old series now ends before it
+            old_parent = event.parent_event
+            if recurrence_rule == old_parent.recurrence_rule:
+                # The rule carries on, so the new series must end where the old one did
+                recurrence_rule = RecurrenceService.continue_rule(
+                    recurrence_rule, old_parent.start_datetime.astimezone(cls.TIMEZONE)
+                )
+            cls._detach_services(event)
+            event.materialized_until = old_parent.materialized_until
+            old_parent.materialized_until = None
+            old_parent.save(update_fields=['materialized_until'])
             event.parent_event = None
             event.is_recurring = True
             event.recurrence_rule = recurrence_rule
@@ -733,65 +1224,76 @@ class SchedulerDataService:
             event.save()
             
             # Update future events
-            for future_event in future_events.exclude(id=event.id):
-                future_event.start_datetime -= time_diff
-                future_event.end_datetime -= time_diff
-                cls._update_base_event_fields(future_event, 
-                    {k: v for k, v in common_fields.items() if k not in ['start_datetime', 'end_datetime']},
-                    event_data
-                )
-                future_event.parent_event = event
-                future_event.save()
+            cls._update_series_events(
+                future_events, time_diff, common_fields, event_data, parent_event=event, recurrence_rule=recurrence_rule
+            )
+
+    # Occurrence IDs per DELETE, well under the 2100 parameters SQL Server allows in one statement
+    SERIES_DELETE_BATCH_SIZE = 1000
+
+    @classmethod
+    def _diff_series(cls, occurrences: List[Tuple[int, datetime]],
+                     new_starts: List[datetime]) -> Tuple[List[int], List[int], List[datetime]]:
+        """
+        Match the stored occurrences of a series against the starts of its new rule
+
+        Args:
+            occurrences: (id, start) of each stored occurrence, start already moved to the edited time
+            new_starts: Occurrence starts the new rule produces
+            
+        Returns:
+            IDs of the occurrences to keep, IDs of those to delete, and the starts no occurrence matched
+        """
+        wanted = set(new_starts)
+        matched = set()
+        keep_ids, delete_ids = [], []
+        for occurrence_id, start in occurrences:
+            if start in wanted and start not in matched:
+                matched.add(start)
+                keep_ids.append(occurrence_id)
+            else:
+                delete_ids.append(occurrence_id)
+        return keep_ids, delete_ids, [start for start in new_starts if start not in matched]
 
     @classmethod
     def _update_series_parent(cls, event: 'Event', common_fields: Dict[str, Any], 
-                            event_data: Dict[str, Any], recurrence_rule: str) -> None:
-        """Handle series update for a parent event"""
+                            event_data: Dict[str, Any], recurrence_rule: str) -> Dict[str, Any]:
+        """
+        Handle series update for a parent event
+
+        A new rule is applied as a diff: occurrences it still produces are kept and updated in
+        place, the rest are deleted by ID in batches and the missing ones bulk inserted.
+
+        Returns:
+            The series' events after the edit and the IDs of the occurrences deleted, in the
+            format of get_event_changes
+        """
         with transaction.atomic():
             # Get all series events
             series_events = Event.objects.filter(parent_event=event).select_for_update()
             time_diff = event.start_datetime - common_fields['start_datetime']
+            new_start = common_fields['start_datetime']
+            # Virtual series are expanded on read; their stored children are only exceptions
+            rule_changed = event.recurrence_rule != recurrence_rule and not event.is_virtual_series
+            delete_ids = []
             
-            # If recurrence rule has changed, handle the change
-            if event.recurrence_rule != recurrence_rule:
-                # Get all future dates based on new recurrence rule
-                new_dates = cls._get_future_dates_from_rule(
-                    common_fields['start_datetime'],
-                    recurrence_rule
-                )
-                
-                # Get all existing event dates
-                existing_dates = set(
-                    series_events.values_list('start_datetime', flat=True)
-                )
+            if rule_changed:
+                # Get the dates of the new recurrence rule inside the materialization window
+                window_end = cls._get_materialization_end(new_start)
+                new_dates = [
+                    start for start in cls._get_future_dates_from_rule(new_start, recurrence_rule, window_end)
+                    if start != new_start
+                ]
                 
-                # Delete events that don't match new recurrence pattern
-                events_to_delete = series_events.exclude(
-                    start_datetime__in=new_dates
+                # Compare in the edited time, where kept occurrences will be after the shift
+                keep_ids, delete_ids, missing_dates = cls._diff_series(
+                    [(event_id, start - time_diff) for event_id, start in series_events.values_list('id', 'start_datetime')],
+                    new_dates
                 )
-                events_to_delete.delete()
-                
-                # Create new events for dates that don't exist
-                event_duration = event.end_datetime - event.start_datetime
-                for new_date in new_dates:
-                    if new_date not in existing_dates:
-                        new_event = Event.objects.create(
-                            parent_event=event,
-                            start_datetime=new_date,
-                            end_datetime=new_date + event_duration,
-                            is_recurring=True,
-                            recurrence_rule=recurrence_rule,
-                            **{k: getattr(event, k) for k in [
-                                'type_id', 'clinician_id', 'is_all_day', 'title',
-                                'notes', 'location_id', 'patient_id', 'status_id',
-                                'cancel_appointments', 'notify_clients',
-                                'appointment_total'
-                            ]}
-                        )
-                        
-                        # Copy services if it's an appointment
-                        if event.type.name == 'APPOINTMENT' and event_data.get('Services'):
-                            cls.update_event_services(new_event, event_data.get('Services'))
+                for i in range(0, len(delete_ids), cls.SERIES_DELETE_BATCH_SIZE):
+                    cls._delete_events_and_services(
+                        Event.objects.filter(id__in=delete_ids[i:i + cls.SERIES_DELETE_BATCH_SIZE])
+                    )
             
             # Update parent
             cls._update_base_event_fields(event, common_fields, event_data)
@@ -799,97 +1301,153 @@ class SchedulerDataService:
             event.recurrence_rule = recurrence_rule
             event.save()
             
-            # Update remaining series events
-            remaining_series_events = Event.objects.filter(parent_event=event)
-            for series_event in remaining_series_events:
-                series_event.start_datetime -= time_diff
-                series_event.end_datetime -= time_diff
-                cls._update_base_event_fields(series_event, 
-                    {k: v for k, v in common_fields.items() if k not in ['start_datetime', 'end_datetime']},
-                    event_data
-                )
-                series_event.save()
+            # Update remaining series events before adding new ones, which are created at their final time
+            cls._update_series_events(
+                Event.objects.filter(parent_event=event), time_diff, common_fields, event_data,
+                **({'recurrence_rule': recurrence_rule} if rule_changed else {})
+            )
+            
+            if rule_changed:
+                cls._create_occurrences(cls._build_series_occurrences(event, missing_dates))
+                if recurrence_rule:
+                    cls._mark_materialized(event, window_end)
+
+            rows = Event.objects.filter(Q(id=event.id) | Q(parent_event=event)).values_list(*cls.EVENT_COLUMNS, named=True)
+            return {
+                'events': [cls._convert_row_to_dict(row) for row in rows],
+                'deleted': delete_ids
+            }
+
+    @classmethod
+    def _create_occurrences(cls, occurrences: List[Event]) -> List[Event]:
+        """
+        Insert unsaved occurrence rows
+
+        Rows are written with batched multi-row INSERTs instead of one round trip per row;
+        the batch size is SCHEDULER_BULK_CREATE_BATCH_SIZE.
+        """
+        batch_size = getattr(settings, 'SCHEDULER_BULK_CREATE_BATCH_SIZE', 90)
+        return Event.objects.bulk_create(occurrences, batch_size=batch_size)
+
+    @classmethod
+    def _build_series_occurrences(cls, parent: Event, starts: List[datetime]) -> List[Event]:
+        """Build unsaved occurrence rows of a materialized series, inheriting the parent's services"""
+        duration = parent.end_datetime - parent.start_datetime
+        return [
+            Event(
+                type_id=parent.type_id,
+                clinician_id=parent.clinician_id,
+                start_datetime=start,
+                end_datetime=start + duration,
+                is_all_day=parent.is_all_day,
+                title=parent.title,
+                notes=parent.notes,
+                location_id=parent.location_id,
+                patient_id=parent.patient_id,
+                status_id=parent.status_id,
+                cancel_appointments=parent.cancel_appointments,
+                notify_clients=parent.notify_clients,
+                is_recurring=True,
+                recurrence_rule=parent.recurrence_rule,
+                parent_event=parent,
+                occurrence_date=start.astimezone(cls.TIMEZONE).date(),
+                appointment_total=parent.appointment_total,
+                inherits_services=True
+            )
+            for start in starts
+        ]
+
+    #region materialization window
+
+    @classmethod
+    def _get_materialization_end(cls, dtstart: datetime) -> datetime:
+        """How far ahead the occurrences of a materialized series starting at dtstart are stored"""
+        return RecurrenceService.get_materialization_end(dtstart)
 
     @classmethod
-    def _get_future_dates_from_rule(cls, start_date: datetime, recurrence_rule: str) -> List[datetime]:
+    def _mark_materialized(cls, parent: Event, window_end: datetime) -> None:
+        """Record that a series is stored up to window_end, or that it is complete if it ends before"""
+        next_start = RecurrenceService.get_next_occurrence(
+            parent.recurrence_rule, parent.start_datetime.astimezone(cls.TIMEZONE), window_end
+        )
+        parent.materialized_until = window_end if next_start else None
+        parent.save(update_fields=['materialized_until'])
+
+    @classmethod
+    def extend_recurring_series(cls, batch_size: int = 100) -> int:
+        """
+        Store the occurrences that have come inside the materialization window, for every series
+        not yet complete; run nightly by the extend_recurring_series command
+
+        Series are read in batches and each is extended from its last stored occurrence with
+        the parent row locked, so concurrent edits are not duplicated. A series that fails is
+        logged and skipped, so it cannot hold back the others.
+
+        Returns:
+            Number of occurrences created
+        """
+        months = getattr(settings, 'SCHEDULER_MATERIALIZE_MONTHS', 6)
+        target = timezone.now() + relativedelta(months=months)
+        created = 0
+        last_id = 0
+        while True:
+            parent_ids = list(Event.objects.filter(
+                parent_event__isnull=True,
+                recurrence_rule__isnull=False,
+                materialized_until__lt=target,
+                id__gt=last_id
+            ).order_by('id').values_list('id', flat=True)[:batch_size])
+            if not parent_ids:
+                return created
+            last_id = parent_ids[-1]
+
+            clinician_ids = set()
+            for parent_id in parent_ids:
+                try:
+                    with transaction.atomic():
+                        parent = Event.objects.select_for_update().filter(
+                            id=parent_id, materialized_until__isnull=False, recurrence_rule__isnull=False
+                        ).first()
+                        if parent is None:
+                            continue
+                        last_start = Event.objects.filter(parent_event=parent).aggregate(
+                            last_start=Max('start_datetime')
+                        )['last_start'] or parent.start_datetime
+                        window_end = cls._get_materialization_end(parent.start_datetime)
+                        starts = [
+                            start for start in RecurrenceService.expand(
+                                parent.recurrence_rule, parent.start_datetime.astimezone(cls.TIMEZONE),
+                                last_start, window_end
+                            )
+                            if start > last_start
+                        ]
+                        cls._create_occurrences(cls._build_series_occurrences(parent, starts))
+                        cls._mark_materialized(parent, window_end)
+                except Exception as e:
+                    print(f"Error extending series {parent_id}: {str(e)}")
+                    continue
+                created += len(starts)
+                if starts:
+                    clinician_ids.add(parent.clinician_id)
+            CalendarCacheService.invalidate_clinicians(clinician_ids)
+
+    #endregion materialization window
+
+    @classmethod
+    def _get_future_dates_from_rule(cls, start_date: datetime, recurrence_rule: str,
+                                    end_date: Optional[datetime] = None) -> List[datetime]:
         """
         Get all future dates based on a recurrence rule
         
         Args:
-            start_date: The start date for the recurrence
+            start_date: The start date for the recurrence, expanded in local time
             recurrence_rule: The recurrence rule string (iCal format)
+            end_date: Exclusive end of the dates wanted, the recurrence horizon by default
             
         Returns:
-            List of datetime objects for all occurrences
+            List of datetime objects for all occurrences before end_date
         """
-        try:
-            # Parse the recurrence rule
-            rule_parts = recurrence_rule.split(';')
-            rule_dict = {}
-            for part in rule_parts:
-                if '=' in part:
-                    key, value = part.split('=')
-                    rule_dict[key.strip()] = value.strip()
-
-            # Map frequency
-            freq_map = {
-                'DAILY': rrule.DAILY,
-                'WEEKLY': rrule.WEEKLY,
-                'MONTHLY': rrule.MONTHLY,
-                'YEARLY': rrule.YEARLY
-            }
-
-            # Build rule parameters
-            rule_params = {
-                'dtstart': start_date,
-                'freq': freq_map[rule_dict['FREQ']],
-                'interval': int(rule_dict.get('INTERVAL', 1))
-            }
-
-            # Add count or until if present
-            if 'COUNT' in rule_dict:
-                rule_params['count'] = int(rule_dict['COUNT'])
-            if 'UNTIL' in rule_dict:
-                until_str = rule_dict['UNTIL']
-                if 'T' in until_str:
-                    until_str = until_str.replace('T', '').replace('Z', '')
-                year = int(until_str[:4])
-                month = int(until_str[4:6])
-                day = int(until_str[6:8])
-                hour = int(until_str[8:10]) if len(until_str) > 8 else 23
-                minute = int(until_str[10:12]) if len(until_str) > 10 else 59
-                second = int(until_str[12:14]) if len(until_str) > 12 else 59
-                rule_params['until'] = datetime(year, month, day, hour, minute, second, tzinfo=start_date.tzinfo)
-
-            # Handle weekly recurrence
-            if rule_dict['FREQ'] == 'WEEKLY' and 'BYDAY' in rule_dict:
-                weekday_map = {
-                    'MO': rrule.MO, 'TU': rrule.TU, 'WE': rrule.WE,
-                    'TH': rrule.TH, 'FR': rrule.FR, 'SA': rrule.SA, 'SU': rrule.SU
-                }
-                byweekday = [weekday_map[day] for day in rule_dict['BYDAY'].split(',')]
-                rule_params['byweekday'] = byweekday
-
-            # Handle monthly recurrence
-            if rule_dict['FREQ'] == 'MONTHLY':
-                if 'BYMONTHDAY' in rule_dict:
-                    rule_params['bymonthday'] = int(rule_dict['BYMONTHDAY'])
-                elif 'BYDAY' in rule_dict and 'BYSETPOS' in rule_dict:
-                    weekday_map = {
-                        'MO': rrule.MO, 'TU': rrule.TU, 'WE': rrule.WE,
-                        'TH': rrule.TH, 'FR': rrule.FR, 'SA': rrule.SA, 'SU': rrule.SU
-                    }
-                    bysetpos = int(rule_dict['BYSETPOS'])
-                    weekday = weekday_map[rule_dict['BYDAY']]
-                    rule_params['byweekday'] = weekday(-1) if bysetpos == -1 else weekday(bysetpos)
-
-            # Create the rule and get all dates
-            rule = rrule.rrule(**rule_params)
-            return list(rule)
-
-        except Exception as e:
-            print(f"Error parsing recurrence rule: {str(e)}")
-            raise ValidationError(f"Invalid recurrence rule format: {str(e)}")
+        return RecurrenceService.expand(recurrence_rule, start_date.astimezone(cls.TIMEZONE), window_end=end_date)
 
     @classmethod
     def _handle_occurrence_update(cls, event: 'Event', common_fields: Dict[str, Any], 
@@ -898,6 +1456,7 @@ class SchedulerDataService:
         with transaction.atomic():
             if event.parent_event:
                 # Handle child event
+                cls._detach_services(event)
                 event.parent_event = None
                 event.is_recurring = False
                 event.recurrence_rule = None
@@ -911,30 +1470,40 @@ class SchedulerDataService:
                 ).select_for_update().order_by('start_datetime').first()
                 
                 if next_event:
-                    # Setup new parent
+                    # Setup new parent; it carries on the series and its extension
+                    cls._detach_services(next_event)
                     next_event.parent_event = None
                     next_event.is_recurring = True
-                    next_event.recurrence_rule = event.recurrence_rule
+                    next_event.recurrence_rule = RecurrenceService.continue_rule(
+                        event.recurrence_rule, event.start_datetime.astimezone(cls.TIMEZONE)
+                    )
+                    next_event.materialized_until = event.materialized_until
                     next_event.save()
                     
                     # Update remaining events
                     Event.objects.filter(
                         parent_event=event,
                         start_datetime__gt=next_event.start_datetime
-                    ).update(parent_event=next_event)
+                    ).update(parent_event=next_event, recurrence_rule=next_event.recurrence_rule, updated_at=timezone.now())
                 
                 # Update current event
                 event.is_recurring = False
                 event.recurrence_rule = None
+                event.materialized_until = None
                 cls._update_base_event_fields(event, common_fields, event_data)
                 event.save()
 
     @classmethod
-    def update_event(cls, event_id: int, data: Dict[str, Any]) -> Dict[str, Any]:
+    def update_event(cls, event_id: Union[int, str], data: Dict[str, Any]) -> Dict[str, Any]:
         """Main method to update an event with specific edit type handling"""
         try:
             with transaction.atomic():
+                event_id, occurrence_date = cls._parse_occurrence_id(event_id)
                 event = Event.objects.select_for_update().get(id=event_id)
+                series_clinicians = cls._get_series_clinicians(event)
+                booking_key = cls._get_booking_key(
+                    cls._get_virtual_occurrence(event, occurrence_date) if occurrence_date else event
+                )
                 event_data = data.get('eventData', {})
                 recurrence_rule = event_data.get('RecurrenceRule') or event.recurrence_rule
                 edit_type = event_data.get('editType')
@@ -943,21 +1512,45 @@ class SchedulerDataService:
                     raise ValidationError(f"Invalid edit type: {edit_type}")
                 
                 common_fields = cls._get_common_fields(event_data)
+                series_changes = None
                 
-                if edit_type == cls.UpdateType.SERIES:
+                if occurrence_date or cls._is_virtual_exception(event):
+                    event = cls._update_virtual_series_event(
+                        event, occurrence_date, common_fields, event_data, recurrence_rule, edit_type
+                    )
+
+                elif edit_type == cls.UpdateType.SERIES:
                     if event.parent_event:
                         cls._update_series_child(event, common_fields, event_data, recurrence_rule)
                     else:
-                        cls._update_series_parent(event, common_fields, event_data, recurrence_rule)
+                        series_changes = cls._update_series_parent(event, common_fields, event_data, recurrence_rule)
                 
                 elif edit_type == cls.UpdateType.OCCURRENCE:
                     cls._handle_occurrence_update(event, common_fields, event_data)
                 
                 elif edit_type == cls.UpdateType.SINGLE:
+                    if event.parent_event_id is None and event_data.get('eventType') == 'APPOINTMENT' and event_data.get('Services'):
+                        cls._pin_inherited_services(event, event_data.get('Services'))
                     cls._update_base_event_fields(event, common_fields, event_data)
                     event.save()
+
+                cls._check_updated_conflicts(event, booking_key, edit_type, event_data)
                 
-                return cls._convert_event_to_dict(event)
+                # Edits can move events to another clinician, so windows of both sides are stale
+                # and delta syncs of the old one must drop them
+                updated_clinicians = cls._get_series_clinicians(event)
+                cls._record_tombstones([
+                    (series_event_id, clinician_id) for series_event_id, clinician_id in series_clinicians.items()
+                    if updated_clinicians.get(series_event_id, clinician_id) != clinician_id
+                ])
+                CalendarCacheService.invalidate_clinicians(
+                    set(series_clinicians.values()) | set(updated_clinicians.values())
+                )
+                event_dict = cls._convert_event_to_dict(event)
+                if series_changes is not None:
+                    # Lets the client patch its view without a sync round trip
+                    event_dict['SeriesChanges'] = series_changes
+                return event_dict
 
         except Event.DoesNotExist:
             raise ValidationError(f"Event with id {event_id} does not exist")
@@ -972,12 +1565,12 @@ class SchedulerDataService:
     VALID_DELETE_TYPES = {'series', 'all', 'occurrence', 'single'}
 
     @classmethod
-    def delete_event(cls, event_id: int, delete_type: str) -> None:
+    def delete_event(cls, event_id: Union[int, str], delete_type: str) -> None:
         """
         Delete an event and its related data based on the specified delete type.
         
         Args:
-            event_id: The ID of the event to delete
+            event_id: The ID of the event, or "<parent_id>_<YYYYMMDD>" for a virtual occurrence
             delete_type: Type of deletion ('series', 'all', 'occurrence', 'single')
             
         Raises:
@@ -989,9 +1582,13 @@ class SchedulerDataService:
 
         try:
             with transaction.atomic():
+                event_id, occurrence_date = cls._parse_occurrence_id(event_id)
                 event = cls._get_event(event_id)
+                CalendarCacheService.invalidate_clinicians(cls._get_series_clinician_ids(event))
                 
-                if delete_type in ('occurrence', 'single'):
+                if occurrence_date or cls._is_virtual_exception(event):
+                    cls._delete_virtual_series_event(event, occurrence_date, delete_type)
+                elif delete_type in ('occurrence', 'single'):
                     cls._delete_single_event(event)
                 elif delete_type == 'series':
                     cls._delete_series(event)
@@ -1009,46 +1606,65 @@ class SchedulerDataService:
         """Retrieve event by ID"""
         return Event.objects.get(id=event_id)
 
-    @staticmethod
-    def _delete_event_and_services(event: Event) -> None:
+    # Rows that belong to an event and are deleted with it, as (model, foreign key); every relation
+    # to Event must be listed, which the clinician_dashboard.E001 system check enforces
+    EVENT_DEPENDENTS = (
+        (EventService, 'event'),
+        (EventNote, 'event'),
+        (PhsycotherapyNote, 'event'),
+        (EventExclusion, 'parent_event'),
+    )
+
+    @classmethod
+    def _delete_event_and_services(cls, event: Event) -> None:
         """
-        Delete a single event and its associated services if it's an appointment.
+        Delete a single event, its occurrences if it is a series parent, and their related rows
         
         Args:
             event: Event instance to delete
         """
-        if event.type_id == EventType.objects.get(name=EventType.APPOINTMENT).id:
-            EventService.objects.filter(event=event).delete()
-        event.delete()
+        cls._delete_events_and_services(Event.objects.filter(id=event.id))
 
     @classmethod
     def _delete_events_and_services(cls, events: QuerySet) -> None:
         """
-        Delete multiple events and their associated services based on event type.
+        Delete multiple events, the occurrences of those that are series parents, and their
+        services, notes and exclusions
+
+        Every table is cleared with one DELETE filtered by a subquery on the events, whatever
+        their number. Dependent rows have no relations or signals of their own, so
+        QuerySet.delete takes its fast path for them. The events themselves are deleted raw:
+        the collector would load each one and look up every dependent again.
         
         Args:
             events: QuerySet of events to delete
         """
-        if not events.exists():
+        targets = Event.objects.filter(Q(id__in=events.values('id')) | Q(parent_event__in=events.values('id')))
+        event_clinicians = list(targets.values_list('id', 'clinician_id'))
+        if not event_clinicians:
             return
-            
-        event_ids = list(events.values_list('id', flat=True))
-        
-        # Get the ID of the APPOINTMENT type
-        appointment_type_id = EventType.objects.get(name=EventType.APPOINTMENT).id
-        
-        # Get unique event type IDs in a single query
-        event_type_ids = set(events.values_list('type_id', flat=True).distinct())
-        
-        # If all events are appointments, delete their services
-        if event_type_ids == {appointment_type_id}:
-            EventService.objects.filter(event__in=event_ids).delete()
-        # If mixed event types, only delete services for appointment events
-        elif appointment_type_id in event_type_ids:
-            appointment_ids = events.filter(type_id=appointment_type_id).values_list('id', flat=True)
-            EventService.objects.filter(event__in=appointment_ids).delete()
-        
-        events.delete()
+
+        for model, field in cls.EVENT_DEPENDENTS:
+            model.objects.filter(**{f'{field}__in': targets.values('id')}).delete()
+        cls._record_tombstones(event_clinicians)
+        # Occurrences and their parent go in the same statement, so the self reference never dangles
+        targets._raw_delete(targets.db)
+
+    @classmethod
+    def _record_tombstones(cls, event_clinicians: List[Tuple[int, int]]) -> None:
+        """
+        Record events gone from a clinician's calendar for delta syncs, and prune tombstones no
+        sync token can reach
+
+        Args:
+            event_clinicians: (event ID, clinician ID) of each event deleted or moved away from the clinician
+        """
+        if not event_clinicians:
+            return
+        EventTombstone.objects.filter(deleted_at__lt=timezone.now() - cls.SYNC_TOMBSTONE_RETENTION).delete()
+        EventTombstone.objects.bulk_create([
+            EventTombstone(event_id=event_id, clinician_id=clinician_id) for event_id, clinician_id in event_clinicians
+        ])
     @classmethod
     def _delete_single_event(cls, event: Event) -> None:
         """Delete a single event and its services, handling parent events appropriately"""
@@ -1060,15 +1676,20 @@ class SchedulerDataService:
             ).order_by('start_datetime').first()
 
             if next_event:
-                # Make the next event the new parent
+                # Make the next event the new parent, ending where the series did
+                cls._detach_services(next_event)
                 next_event.parent_event = None
+                next_event.recurrence_rule = RecurrenceService.continue_rule(
+                    event.recurrence_rule, event.start_datetime.astimezone(cls.TIMEZONE)
+                )
+                next_event.materialized_until = event.materialized_until
                 next_event.save()
 
                 # Update remaining events to point to the new parent
                 Event.objects.filter(
                     parent_event=event,
                     start_datetime__gt=next_event.start_datetime
-                ).update(parent_event=next_event)
+                ).update(parent_event=next_event, recurrence_rule=next_event.recurrence_rule, updated_at=timezone.now())
 
             # Delete the current parent event's services and the parent itself
             cls._delete_event_and_services(event)
@@ -1081,149 +1702,332 @@ class SchedulerDataService:
         """Delete current event and all future events in the series"""
         parent_event = event.parent_event or event
         
-        # Delete future events
-        future_events = Event.objects.filter(
-            parent_event=parent_event,
-            start_datetime__gt=event.start_datetime
-        )
-        cls._delete_events_and_services(future_events)
-        
-        # Delete the current event
-        cls._delete_event_and_services(event)
+        # Delete the current event and the future ones
+        cls._delete_events_and_services(Event.objects.filter(
+            Q(id=event.id) |
+            Q(parent_event=parent_event, start_datetime__gt=event.start_datetime)
+        ))
+
+        # The series now ends here and must not be extended again
+        if parent_event is not event:
+            parent_event.materialized_until = None
+            parent_event.save(update_fields=['materialized_until'])
 
     @classmethod
     def _delete_all(cls, event: Event) -> None:
         """Delete all events in the series including the parent"""
-        if event.parent_event:
-            parent_event = event.parent_event
-            # Delete all child events
-            child_events = Event.objects.filter(parent_event=parent_event)
-            cls._delete_events_and_services(child_events)
-            # Delete the parent
-            cls._delete_event_and_services(parent_event)
-        else:
-            # Delete all child events
-            child_events = Event.objects.filter(parent_event=event)
-            cls._delete_events_and_services(child_events)
-            # Delete the parent event
-            cls._delete_event_and_services(event)
+        # Deleting the parent takes its child events with it
+        cls._delete_event_and_services(event.parent_event or event)
 
     #endregion delete events
     
+    #region virtual recurrence
+
+    # Fields every occurrence of a series copies from its parent
+    SERIES_FIELDS = [
+        'type_id', 'clinician_id', 'is_all_day', 'title',
+        'notes', 'location_id', 'patient_id', 'status_id',
+        'cancel_appointments', 'notify_clients',
+        'appointment_total'
+    ]
+
+    OCCURRENCE_ID_SEPARATOR = '_'
+
     @classmethod
-    def _handle_recurring_events(cls, event: Event, recurrence_rule: str, event_data: Dict[str, Any]):
-        """Handle the creation of recurring events in a background thread"""
+    def _use_virtual_recurrence(cls) -> bool:
+        """Whether new series are expanded on read instead of materialized as child rows"""
+        return getattr(settings, 'SCHEDULER_VIRTUAL_RECURRENCE', False)
+
+    @classmethod
+    def _make_occurrence_id(cls, parent_id: int, occurrence_date: date) -> str:
+        """Build the client-facing ID of a virtual occurrence"""
+        return f"{parent_id}{cls.OCCURRENCE_ID_SEPARATOR}{occurrence_date.strftime('%Y%m%d')}"
+
+    @classmethod
+    def _parse_occurrence_id(cls, event_id: Union[int, str]) -> Tuple[int, Optional[date]]:
+        """
+        Split an event ID into the stored event ID and, for virtual occurrences, the occurrence date
+        
+        Raises:
+            ValidationError: If the ID is malformed
+        """
         try:
-            # Parse the recurrence rule components
-            rule_parts = recurrence_rule.split(';')
-            rule_dict = {}
-            for part in rule_parts:
-                if '=' in part:
-                    key, value = part.split('=')
-                    rule_dict[key.strip()] = value.strip()
-
-            # Convert start_datetime to datetime object
-            dtstart = event.start_datetime
-
-            # Map frequency string to rrule constant
-            freq_map = {
-                'DAILY': rrule.DAILY,
-                'WEEKLY': rrule.WEEKLY,
-                'MONTHLY': rrule.MONTHLY,
-                'YEARLY': rrule.YEARLY
-            }
+            if isinstance(event_id, str) and cls.OCCURRENCE_ID_SEPARATOR in event_id:
+                parent_id, occurrence = event_id.split(cls.OCCURRENCE_ID_SEPARATOR, 1)
+                return int(parent_id), datetime.strptime(occurrence, '%Y%m%d').date()
+            return int(event_id), None
+        except (TypeError, ValueError):
+            raise ValidationError(f"Invalid event id: {event_id}")
 
-            # Build rule parameters
-            rule_params = {
-                'dtstart': dtstart,
-                'freq': freq_map[rule_dict['FREQ']],
-                'interval': int(rule_dict.get('INTERVAL', 1))
-            }
+    @classmethod
+    def _is_virtual_exception(cls, event: Event) -> bool:
+        """Check if the event is a stored exception of a virtual series"""
+        return event.parent_event_id is not None and event.parent_event.is_virtual_series
+
+    @classmethod
+    def _get_series_start_date(cls, parent: Event) -> date:
+        """Local date of the first occurrence of a series"""
+        return parent.start_datetime.astimezone(cls.TIMEZONE).date()
+
+    @classmethod
+    def _get_occurrence_starts(cls, parent: Event, window_start: datetime, window_end: datetime) -> List[datetime]:
+        """
+        Expand a series only inside [window_start, window_end)
+        
+        The rule is evaluated in local time so occurrences keep their wall-clock time across DST changes.
+        """
+        return RecurrenceService.expand(
+            parent.recurrence_rule, parent.start_datetime.astimezone(cls.TIMEZONE), window_start, window_end
+        )
+
+    @classmethod
+    def _get_occurrence_fields(cls, parent_id: int, start: datetime, end: datetime) -> Dict[str, Any]:
+        """Fields that differ between a virtual occurrence and its series parent"""
+        utc = ZoneInfo("UTC")
+        occurrence_date = start.astimezone(cls.TIMEZONE).date()
+        return {
+            'Id': cls._make_occurrence_id(parent_id, occurrence_date),
+            'StartTime': start.astimezone(utc).strftime('%Y-%m-%dT%H:%M:%S.000Z'),
+            'EndTime': end.astimezone(utc).strftime('%Y-%m-%dT%H:%M:%S.000Z'),
+            'SeriesId': parent_id,
+            'OccurrenceDate': occurrence_date.isoformat(),
+        }
+
+    @classmethod
+    def _expand_virtual_series(cls, series_parents: QuerySet, window_start: datetime, 
+                               window_end: datetime) -> Iterator[Dict[str, Any]]:
+        """
+        Expand virtual series parents into occurrences inside the window
+        
+        Args:
+            series_parents: EVENT_COLUMNS rows of the series parents
+
+        Deleted occurrences (EventExclusion) and edited occurrences (stored child rows, which
+        the regular event query already returns) are skipped.
+        """
+        parents = list(series_parents)
+        if not parents:
+            return
 
-            # Add optional parameters
-            if 'COUNT' in rule_dict:
-                rule_params['count'] = int(rule_dict['COUNT'])
-            if 'UNTIL' in rule_dict:
-                # Parse UNTIL date from YYYYMMDD'T'HHMMSS'Z' format
-                until_str = rule_dict['UNTIL']
-                if 'T' in until_str:
-                    until_str = until_str.replace('T', '').replace('Z', '')
-                year = int(until_str[:4])
-                month = int(until_str[4:6])
-                day = int(until_str[6:8])
-                hour = int(until_str[8:10]) if len(until_str) > 8 else 23
-                minute = int(until_str[10:12]) if len(until_str) > 10 else 59
-                second = int(until_str[12:14]) if len(until_str) > 12 else 59
-                rule_params['until'] = datetime(year, month, day, hour, minute, second, tzinfo=dtstart.tzinfo)
-
-            # Handle weekly recurrence
-            if rule_dict['FREQ'] == 'WEEKLY' and 'BYDAY' in rule_dict:
-                weekday_map = {
-                    'MO': rrule.MO, 'TU': rrule.TU, 'WE': rrule.WE,
-                    'TH': rrule.TH, 'FR': rrule.FR, 'SA': rrule.SA, 'SU': rrule.SU
+        parent_ids = [parent.id for parent in parents]
+        date_range = (
+            (window_start - cls._get_max_event_duration()).astimezone(cls.TIMEZONE).date() - timedelta(days=1),
+            window_end.astimezone(cls.TIMEZONE).date() + timedelta(days=1)
+        )
+        skipped = set(EventExclusion.objects.filter(
+            parent_event_id__in=parent_ids,
+            occurrence_date__range=date_range
+        ).values_list('parent_event_id', 'occurrence_date'))
+        skipped.update(Event.objects.filter(
+            parent_event_id__in=parent_ids,
+            occurrence_date__range=date_range
+        ).values_list('parent_event_id', 'occurrence_date'))
+
+        for parent in parents:
+            parent_dict = cls._convert_row_to_dict(parent)
+            duration = parent.end_datetime - parent.start_datetime
+            # Occurrences that start before the window but run into it are included too
+            for start in cls._get_occurrence_starts(parent, window_start - duration, window_end):
+                if start + duration <= window_start or (parent.id, start.date()) in skipped:
+                    continue
+                yield {
+                    **parent_dict,
+                    **cls._get_occurrence_fields(parent.id, start, start + duration)
                 }
-                byweekday = [weekday_map[day] for day in rule_dict['BYDAY'].split(',')]
-                rule_params['byweekday'] = byweekday
-
-            # Handle monthly recurrence
-            if rule_dict['FREQ'] == 'MONTHLY':
-                # Case 1: Specific day of month (BYMONTHDAY)
-                if 'BYMONTHDAY' in rule_dict:
-                    rule_params['bymonthday'] = int(rule_dict['BYMONTHDAY'])
-                
-                # Case 2: Nth weekday of month (BYDAY + BYSETPOS)
-                elif 'BYDAY' in rule_dict and 'BYSETPOS' in rule_dict:
-                    weekday_map = {
-                        'MO': rrule.MO, 'TU': rrule.TU, 'WE': rrule.WE,
-                        'TH': rrule.TH, 'FR': rrule.FR, 'SA': rrule.SA, 'SU': rrule.SU
-                    }
-                    bysetpos = int(rule_dict['BYSETPOS'])
-                    weekday = weekday_map[rule_dict['BYDAY']]
-                    
-                    # Handle last weekday of month (BYSETPOS = -1)
-                    if bysetpos == -1:
-                        rule_params['byweekday'] = weekday(-1)
-                    else:
-                        rule_params['byweekday'] = weekday(bysetpos)
-
-            # Create the rule
-            rule = rrule.rrule(**rule_params)
-
-            # Calculate event duration
-            event_duration = event.end_datetime - event.start_datetime
-
-            # Create occurrences
-            for occurrence_start in rule:
-                if occurrence_start != dtstart:
-                    occurrence_end = occurrence_start + event_duration
-                    new_event = Event.objects.create(
-                        type_id=event.type_id,
-                        clinician_id=event.clinician_id,
-                        start_datetime=occurrence_start,
-                        end_datetime=occurrence_end,
-                        is_all_day=event.is_all_day,
-                        title=event.title,
-                        notes=event.notes,
-                        location_id=event.location_id,
-                        patient_id=event.patient_id,
-                        status_id=event.status_id,
-                        cancel_appointments=event.cancel_appointments,
-                        notify_clients=event.notify_clients,
-                        is_recurring=True,
-                        recurrence_rule=event.recurrence_rule,  
-                        parent_event=event,
-                        occurrence_date=occurrence_start.date(),
-                        appointment_total=event.appointment_total
-                    )
-                    # Set the services for the newly created event
-                    if(event_data.get('eventType') == 'APPOINTMENT'):
-                        for service in event_data.get('Services'):
-                            EventService.objects.create(
-                            event=new_event,
-                            service_id=service.get('serviceId'),
-                            fee=service.get('fee'),
-                            modifiers=', '.join(service.get('modifiers')))
-                    
+
+    @classmethod
+    def _build_occurrence(cls, parent: Event, start: datetime) -> Event:
+        """Build an unsaved occurrence row of a series from its parent"""
+        return Event(
+            parent_event=parent,
+            start_datetime=start,
+            end_datetime=start + (parent.end_datetime - parent.start_datetime),
+            occurrence_date=start.astimezone(cls.TIMEZONE).date(),
+            is_recurring=True,
+            recurrence_rule=parent.recurrence_rule,
+            **{k: getattr(parent, k) for k in cls.SERIES_FIELDS}
+        )
+
+    @classmethod
+    def _get_virtual_occurrence(cls, parent: Event, occurrence_date: date) -> Event:
+        """
+        Get the unsaved occurrence of a virtual series on a given local date
+        
+        Raises:
+            ValidationError: If the series has no occurrence on that date
+        """
+        day_start = datetime.combine(occurrence_date, time.min, tzinfo=cls.TIMEZONE)
+        starts = cls._get_occurrence_starts(parent, day_start, day_start + timedelta(days=1))
+        if not parent.is_virtual_series or not starts:
+            raise ValidationError(f"Event {parent.id} has no occurrence on {occurrence_date}")
+        return cls._build_occurrence(parent, starts[0])
+
+    @classmethod
+    def _copy_services(cls, source: Event, target: Event) -> None:
+        """Copy the services of one event to another"""
+        EventService.objects.bulk_create([
+            EventService(event=target, service_id=service.service_id, fee=service.fee, modifiers=service.modifiers)
+            for service in EventService.objects.filter(event=source)
+        ])
+
+    @classmethod
+    def _materialize_occurrence(cls, parent: Event, occurrence_date: date) -> Event:
+        """Store a virtual occurrence as an exception row so it can be changed on its own"""
+        existing = Event.objects.filter(parent_event=parent, occurrence_date=occurrence_date).first()
+        if existing:
+            return existing
+        occurrence = cls._get_virtual_occurrence(parent, occurrence_date)
+        occurrence.inherits_services = True
+        occurrence.save()
+        return occurrence
+
+    @classmethod
+    def _end_series_before(cls, parent: Event, occurrence_date: date) -> None:
+        """Cap a series so its last occurrence falls before the given local date"""
+        last_day = occurrence_date - timedelta(days=1)
+        rule_parts = [
+            part for part in parent.recurrence_rule.split(';')
+            if part.split('=')[0].strip() not in ('COUNT', 'UNTIL')
+        ]
+        # UNTIL is read in the series' local time, matching the rules built by the editor
+        rule_parts.append(f"UNTIL={last_day.strftime('%Y%m%d')}T235959Z")
+        parent.recurrence_rule = ';'.join(rule_parts)
+        parent.save(update_fields=['recurrence_rule', 'updated_at'])
+
+    @classmethod
+    def _update_virtual_series_event(cls, event: Event, occurrence_date: Optional[date], 
+                                     common_fields: Dict[str, Any], event_data: Dict[str, Any],
+                                     recurrence_rule: str, edit_type: str) -> Event:
+        """
+        Update an occurrence of a virtual series
+        
+        Args:
+            event: The series parent when occurrence_date is given, otherwise a stored exception row
+            occurrence_date: Local date of the virtual occurrence being edited
+            
+        Returns:
+            The event that was changed
+        """
+        is_virtual_occurrence = occurrence_date is not None
+        parent = event if is_virtual_occurrence else event.parent_event
+        occurrence_date = occurrence_date or event.occurrence_date
+
+        if edit_type != cls.UpdateType.SERIES:
+            # Only this occurrence: keep it as an exception row of the series
+            if is_virtual_occurrence:
+                event = cls._materialize_occurrence(parent, occurrence_date)
+            cls._update_base_event_fields(event, common_fields, event_data)
+            event.save()
+            return event
+
+        if occurrence_date == cls._get_series_start_date(parent):
+            # Editing from the first occurrence changes the whole series
+            cls._update_base_event_fields(parent, common_fields, event_data)
+            parent.is_recurring = True
+            parent.recurrence_rule = recurrence_rule
+            parent.save()
+            if not is_virtual_occurrence:
+                cls._update_base_event_fields(event, common_fields, event_data)
+                event.save()
+            return parent
+
+        # This and future occurrences: end the current series and start a new one here
+        if is_virtual_occurrence:
+            new_parent = cls._get_virtual_occurrence(parent, occurrence_date)
+            new_parent.parent_event = None
+            new_parent.save()
+            cls._copy_services(parent, new_parent)
+        else:
+            new_parent = event
+            cls._detach_services(new_parent)
+            new_parent.parent_event = None
+        cls._end_series_before(parent, occurrence_date)
+        new_parent.occurrence_date = None
+        new_parent.is_recurring = True
+        new_parent.is_virtual_series = True
+        new_parent.recurrence_rule = recurrence_rule
+        cls._update_base_event_fields(new_parent, common_fields, event_data)
+        new_parent.save()
+
+        # Later exceptions now belong to the new series
+        EventExclusion.objects.filter(
+            parent_event=parent,
+            occurrence_date__gt=occurrence_date
+        ).update(parent_event=new_parent)
+        Event.objects.filter(
+            parent_event=parent,
+            occurrence_date__gt=occurrence_date
+        ).update(parent_event=new_parent, recurrence_rule=recurrence_rule, updated_at=timezone.now())
+        return new_parent
+
+    @classmethod
+    def _delete_virtual_series_event(cls, event: Event, occurrence_date: Optional[date], delete_type: str) -> None:
+        """
+        Delete occurrences of a virtual series
+        
+        Args:
+            event: The series parent when occurrence_date is given, otherwise a stored exception row
+            occurrence_date: Local date of the virtual occurrence being deleted
+            delete_type: Type of deletion ('series', 'all', 'occurrence', 'single')
+        """
+        is_virtual_occurrence = occurrence_date is not None
+        parent = event if is_virtual_occurrence else event.parent_event
+        occurrence_date = occurrence_date or event.occurrence_date
+
+        if delete_type == 'all' or (delete_type == 'series' and occurrence_date == cls._get_series_start_date(parent)):
+            cls._delete_all(parent)
+        elif delete_type == 'series':
+            cls._end_series_before(parent, occurrence_date)
+            cls._delete_events_and_services(
+                Event.objects.filter(parent_event=parent, occurrence_date__gte=occurrence_date)
+            )
+            EventExclusion.objects.filter(parent_event=parent, occurrence_date__gte=occurrence_date).delete()
+        else:
+            # Drop any exception row and hide the date from expansion
+            if not is_virtual_occurrence:
+                cls._delete_event_and_services(event)
+            EventExclusion.objects.get_or_create(parent_event=parent, occurrence_date=occurrence_date)
+            parent.save(update_fields=['updated_at'])
+
+    #endregion virtual recurrence
+    
+    @classmethod
+    def materialize_series(cls, event_id: int, event_data: Optional[Dict[str, Any]] = None) -> None:
+        """
+        Create the occurrence rows of a new series, run by the scheduler worker
+
+        Does nothing if the series was deleted, made non-recurring or already materialized
+        in the meantime, so a retried job never duplicates occurrences. event_data is only
+        accepted for jobs queued before occurrences inherited their services. The parent row
+        stays locked until the occurrences are stored, so a job retried while the first attempt
+        is still running waits for it and then finds the occurrences.
+        """
+        with transaction.atomic():
+            event = Event.objects.select_for_update().filter(id=event_id, parent_event__isnull=True).first()
+            if event is None or not event.recurrence_rule or event.is_virtual_series:
+                return
+            if Event.objects.filter(parent_event=event).exists():
+                return
+            cls._handle_recurring_events(event, event.recurrence_rule)
+
+    @classmethod
+    def _handle_recurring_events(cls, event: Event, recurrence_rule: str):
+        """Create the occurrence rows of a recurring event"""
+        try:
+            # Expanded in local time, as conflict checks are, so occurrences keep their wall time across DST
+            dtstart = event.start_datetime.astimezone(cls.TIMEZONE)
+            window_end = cls._get_materialization_end(dtstart)
+            occurrence_starts = RecurrenceService.expand(recurrence_rule, dtstart, window_end=window_end)
+
+            with transaction.atomic():
+                cls._create_occurrences(
+                    cls._build_series_occurrences(event, [start for start in occurrence_starts if start != dtstart])
+                )
+                cls._mark_materialized(event, window_end)
+
         except Exception as e:
             print(f"Error details: {str(e)}")
-            raise ValueError(f"Invalid recurrence rule format: {str(e)}")
\ No newline at end of file
+            raise ValueError(f"Invalid recurrence rule format: {str(e)}")
+        finally:
+            # Windows read while occurrences were being created are missing them
+            CalendarCacheService.invalidate_clinicians([event.clinician_id])
\ No newline at end of file
@@ -0,0 +1,227 @@
+from typing import Any, Dict, Iterable, List, Tuple
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+
+from apps.clinician_dashboard.models import CareTeam, ClinicianService, PatientDefaultService, PracticeService
+
+
+class ServicePriceService:
+    """
+    Services and effective prices a clinician can bill a patient
+
+    The answer for a (clinician, patient) pair is assembled from three cached parts: the practice
+    service list, the active services and custom rates of the clinician, and the active care team
+    and default services of the patient. All the parts of any number of pairs come back in one
+    cache read; missing parts are loaded with one query per kind and cached. Saves and deletes of
+    PracticeService, ClinicianService, PatientDefaultService and CareTeam rows drop the part they
+    belong to through signals once their transaction commits. Bulk writes send no signals; parts
+    also expire after SCHEDULER_REFERENCE_CACHE_TIMEOUT seconds.
+    """
+
+    KEY_PREFIX = 'service_prices'
+
+    # IDs per IN clause, under the parameter limit of SQL Server
+    BATCH_SIZE = 1000
+
+    #region parts
+
+    @classmethod
+    def _practice_key(cls) -> str:
+        return f"{cls.KEY_PREFIX}:practice"
+
+    @classmethod
+    def _clinician_key(cls, clinician_id: int) -> str:
+        return f"{cls.KEY_PREFIX}:clinician:{clinician_id}"
+
+    @classmethod
+    def _patient_key(cls, patient_id: int) -> str:
+        return f"{cls.KEY_PREFIX}:patient:{patient_id}"
+
+    @classmethod
+    def _get_timeout(cls) -> int:
+        return getattr(settings, 'SCHEDULER_REFERENCE_CACHE_TIMEOUT', 60 * 60)
+
+    @classmethod
+    def _batches(cls, ids: List[int]) -> Iterable[List[int]]:
+        for offset in range(0, len(ids), cls.BATCH_SIZE):
+            yield ids[offset:offset + cls.BATCH_SIZE]
+
+    @classmethod
+    def _load_practice(cls) -> List[Dict[str, Any]]:
+        services = [
+            {**service, 'rate': float(service['rate'])}
+            for service in PracticeService.objects.order_by('id').values(
+                'id', 'type', 'rate', 'code', 'description', 'duration'
+            )
+        ]
+        cache.set(cls._practice_key(), services, cls._get_timeout())
+        return services
+
+    @classmethod
+    def _load_clinicians(cls, clinician_ids: List[int]) -> Dict[str, Any]:
+        """Active services of clinicians as (service ID, custom rate), by cache key"""
+        parts = {cls._clinician_key(clinician_id): [] for clinician_id in clinician_ids}
+        for batch in cls._batches(clinician_ids):
+            for clinician_id, service_id, custom_rate in ClinicianService.objects.filter(
+                clinician_id__in=batch, is_active=True
+            ).order_by('id').values_list('clinician_id', 'service_id', 'custom_rate'):
+                parts[cls._clinician_key(clinician_id)].append((service_id, custom_rate))
+        cache.set_many(parts, cls._get_timeout())
+        return parts
+
+    @classmethod
+    def _load_patients(cls, patient_ids: List[int]) -> Dict[str, Any]:
+        """
+        Active care team clinician IDs and default services as (service ID, custom rate, is primary)
+        of patients, by cache key
+        """
+        parts = {cls._patient_key(patient_id): {'care_team': [], 'defaults': []} for patient_id in patient_ids}
+        for batch in cls._batches(patient_ids):
+            for patient_id, clinician_id in CareTeam.objects.filter(
+                patient_id__in=batch, status='ACTIVE'
+            ).values_list('patient_id', 'clinician_id'):
+                parts[cls._patient_key(patient_id)]['care_team'].append(clinician_id)
+            for patient_id, service_id, custom_rate, is_primary in PatientDefaultService.objects.filter(
+                patient_id__in=batch
+            ).order_by('id').values_list('patient_id', 'service_id', 'custom_rate', 'is_primary'):
+                parts[cls._patient_key(patient_id)]['defaults'].append((service_id, custom_rate, is_primary))
+        cache.set_many(parts, cls._get_timeout())
+        return parts
+
+    #endregion parts
+
+    #region invalidation
+
+    @classmethod
+    def _delete_on_commit(cls, key: str) -> None:
+        transaction.on_commit(lambda: cache.delete(key))
+
+    @classmethod
+    def invalidate_practice(cls) -> None:
+        cls._delete_on_commit(cls._practice_key())
+
+    @classmethod
+    def invalidate_clinician(cls, clinician_id: int) -> None:
+        cls._delete_on_commit(cls._clinician_key(clinician_id))
+
+    @classmethod
+    def invalidate_patient(cls, patient_id: int) -> None:
+        cls._delete_on_commit(cls._patient_key(patient_id))
+
+    #endregion invalidation
+
+    #region lookups
+
+    @classmethod
+    def _get_parts(cls, pairs: List[Tuple[int, int]]) -> Dict[str, Any]:
+        clinician_ids = list(dict.fromkeys(clinician_id for clinician_id, _ in pairs))
+        patient_ids = list(dict.fromkeys(patient_id for _, patient_id in pairs))
+        keys = [cls._practice_key()]
+        keys += [cls._clinician_key(clinician_id) for clinician_id in clinician_ids]
+        keys += [cls._patient_key(patient_id) for patient_id in patient_ids]
+        parts = cache.get_many(keys)
+
+        if cls._practice_key() not in parts:
+            parts[cls._practice_key()] = cls._load_practice()
+        missing = [clinician_id for clinician_id in clinician_ids if cls._clinician_key(clinician_id) not in parts]
+        if missing:
+            parts.update(cls._load_clinicians(missing))
+        missing = [patient_id for patient_id in patient_ids if cls._patient_key(patient_id) not in parts]
+        if missing:
+            parts.update(cls._load_patients(missing))
+        return parts
+
+    @classmethod
+    def _build(cls, services: Dict[int, Dict[str, Any]], clinician_part: List[Tuple],
+               patient_part: Dict[str, Any], clinician_id: int) -> Dict[str, Any]:
+        defaults = [
+            {
+                **services[service_id],
+                'rate': float(custom_rate if custom_rate is not None else services[service_id]['rate']),
+                'is_primary': is_primary
+            }
+            for service_id, custom_rate, is_primary in patient_part['defaults'] if service_id in services
+        ]
+        if clinician_id in patient_part['care_team']:
+            return {
+                'clinician_services': [
+                    {
+                        **services[service_id],
+                        'rate': float(custom_rate if custom_rate is not None else services[service_id]['rate'])
+                    }
+                    for service_id, custom_rate in clinician_part if service_id in services
+                ],
+                'patient_default_services': defaults
+            }
+        return {
+            'practice_services': [dict(service) for service in services.values()],
+            'patient_default_services': defaults
+        }
+
+    @classmethod
+    def get_services_batch(cls, pairs: Iterable[Tuple[int, int]]) -> Dict[Tuple[int, int], Dict[str, Any]]:
+        """
+        Services offered for many (clinician ID, patient ID) pairs, see get_services
+
+        Returns:
+            The services of each pair, by pair
+        """
+        pairs = list(dict.fromkeys(pairs))
+        if not pairs:
+            return {}
+        parts = cls._get_parts(pairs)
+
+        services = {service['id']: service for service in parts[cls._practice_key()]}
+        referenced = set()
+        for clinician_id, patient_id in pairs:
+            referenced.update(service_id for service_id, _ in parts[cls._clinician_key(clinician_id)])
+            referenced.update(default[0] for default in parts[cls._patient_key(patient_id)]['defaults'])
+        if not referenced <= services.keys():
+            # Service added by another process since the practice list was cached
+            services = {service['id']: service for service in cls._load_practice()}
+
+        return {
+            (clinician_id, patient_id): cls._build(
+                services,
+                parts[cls._clinician_key(clinician_id)],
+                parts[cls._patient_key(patient_id)],
+                clinician_id
+            )
+            for clinician_id, patient_id in pairs
+        }
+
+    @classmethod
+    def get_services(cls, clinician_id: int, patient_id: int) -> Dict[str, Any]:
+        """
+        Services a clinician can bill a patient, with their rates
+
+        Clinicians on the patient's active care team offer their active services at their custom
+        rates; others offer every practice service at the practice rate. The patient's default
+        services come along at the patient's custom rates.
+
+        Returns:
+            Dict containing either clinician_services or practice_services,
+            along with patient_default_services
+        """
+        return cls.get_services_batch([(clinician_id, patient_id)])[(clinician_id, patient_id)]
+
+    @classmethod
+    def get_rates(cls, pairs: Iterable[Tuple[int, int]]) -> Dict[Tuple[int, int], Dict[int, float]]:
+        """
+        Effective rate of every service offered for many (clinician ID, patient ID) pairs
+
+        A patient default rate wins over the rate the clinician or practice offers the service at.
+
+        Returns:
+            Rates by service ID, by pair
+        """
+        rates = {}
+        for pair, services in cls.get_services_batch(pairs).items():
+            offered = services.get('clinician_services', services.get('practice_services', []))
+            rates[pair] = {service['id']: service['rate'] for service in offered}
+            rates[pair].update({service['id']: service['rate'] for service in services['patient_default_services']})
+        return rates
+
+    #endregion lookups
@@ -35,6 +35,7 @@ INSTALLED_APPS = [
 ]
 
 MIDDLEWARE = [
+    'apps.core.middleware.RequestTimingMiddleware',
    'django.middleware.security.SecurityMiddleware',
    'whitenoise.middleware.WhiteNoiseMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
@@ -113,4 +114,56 @@ LOGIN_URL = 'login'
 
 
 TIME_ZONE = 'America/New_York' 
-USE_TZ = True
\ No newline at end of file
+USE_TZ = True
+
+# Scheduler
+# Expand recurring series when events are read instead of storing a row per occurrence
+SCHEDULER_VIRTUAL_RECURRENCE = os.getenv('SCHEDULER_VIRTUAL_RECURRENCE', 'False') == 'True'
+# Longest allowed event; calendar window queries only look this far back for overlapping events
+SCHEDULER_MAX_EVENT_DURATION_DAYS = 31
+# Cached calendar windows, see CalendarCacheService. The local-memory cache is per process,
+# so deployments with several workers must use a shared backend (production uses the database)
+SCHEDULER_CALENDAR_CACHE_TIMEOUT = 60 * 60 * 24
+SCHEDULER_CALENDAR_CACHE_MAX_BYTES = 2 * 1024 * 1024
+# Rows per INSERT when materializing series occurrences. SQL Server allows 2100 parameters
+# per statement and an Event row takes 21, so keep this below 100
+SCHEDULER_BULK_CREATE_BATCH_SIZE = 90
+# Furthest past its start a recurring series is expanded when no window is given
+SCHEDULER_RECURRENCE_HORIZON_DAYS = 5 * 365
+# Materialized series store occurrences this many months ahead; extend_recurring_series,
+# run nightly, stores more as time passes
+SCHEDULER_MATERIALIZE_MONTHS = 6
+# Local hours and weekdays (Monday is 0) the open slot search offers, see AvailabilityService
+SCHEDULER_WORKING_HOURS = (8, 18)
+SCHEDULER_WORKING_DAYS = (0, 1, 2, 3, 4)
+# Event fields that cannot be double booked; drop 'location' where rooms are shared
+SCHEDULER_CONFLICT_RESOURCES = ('clinician', 'patient', 'location')
+# Seconds browsers may reuse a client directory page before asking again
+SCHEDULER_CLIENT_DIRECTORY_MAX_AGE = 60
+# Safety net expiry of cached locations, services and clinicians, see ReferenceCacheService;
+# saves and deletes invalidate them right away
+SCHEDULER_REFERENCE_CACHE_TIMEOUT = 60 * 60
+
+# Per-request query count, database time and cache hits as Server-Timing headers and log lines,
+# see RequestTimingMiddleware. When off the middleware is removed at startup
+REQUEST_TIMING = os.getenv('REQUEST_TIMING', 'False') == 'True'
+REQUEST_TIMING_HEADER = os.getenv('REQUEST_TIMING_HEADER', 'True') == 'True'
+
+LOGGING = {
+    'version': 1,
+    'disable_existing_loggers': False,
+    'handlers': {
+        'console': {'class': 'logging.StreamHandler'},
+    },
+    'loggers': {
+        'apps.core.middleware': {'handlers': ['console'], 'level': 'INFO', 'propagate': False},
+    },
+}
+
+# Care teams and service prices are cached per patient, well past the default 300 entries
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        'OPTIONS': {'MAX_ENTRIES': 20000},
+    }
+}
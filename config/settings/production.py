@@ -44,3 +44,13 @@ DATABASES['default'].update({
         **DATABASES['default']['OPTIONS']
     }
 })
+
+
+# Shared between gunicorn workers so calendar cache invalidation reaches all of them
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.db.DatabaseCache',
+        'LOCATION': 'django_cache',
+        'OPTIONS': {'MAX_ENTRIES': 20000},
+    }
+}
@@ -1,4 +1,13 @@
 #!/bin/bash
 python manage.py migrate --noinput
+python manage.py createcachetable
 python manage.py collectstatic --noinput
+# Restart the scheduler worker whenever it exits, so queued jobs keep running
+(
+    while true; do
+        DJANGO_SETTINGS_MODULE=config.settings.production python manage.py run_scheduler_worker
+        echo "Scheduler worker exited with status $?, restarting in 5 seconds"
+        sleep 5
+    done
+) &
 gunicorn --bind 0.0.0.0 --timeout 600 --workers 4 --env DJANGO_SETTINGS_MODULE=config.settings.production config.wsgi:application
\ No newline at end of file
@@ -290,7 +290,22 @@ function validateAppointment(selectedLocation, isUpdateAppointment = false) {
     return { isValid, isAllDay, startDate, startTime, endTime, allDayStartDate, allDayEndDate, appointmentTotal };
 
 }
-async function initializeClientSearch(clients) {
+// Page of the client directory, narrowed by a query when one is given
+function fetchClientPage(query, cursor) {
+    const params = new URLSearchParams();
+    if (query) params.set('q', query);
+    if (cursor) params.set('after', cursor);
+    return fetch(`api/clients/?${params}`)
+        .then(response => {
+            if (!response.ok) {
+                throw new Error('Network response was not ok');
+            }
+            return response.json();
+        })
+        .then(page => ({ items: page.clients, next: page.next }));
+}
+
+async function initializeClientSearch(clients, next = null) {
     // Cache DOM elements and values
     const elements = {
         sections: {
@@ -386,6 +401,8 @@ async function initializeClientSearch(clients) {
         clientSearch = new DynamicSearch({
             containerId: 'clientSearchContainer',
             items: clients,
+            next: next,
+            fetchPage: fetchClientPage,
             onSelect: async (selectedClient) => {
                 await withSpinner(() => handleClientSelection(selectedClient));
             },
@@ -706,21 +723,7 @@ function fetchClinicianServices(clinicianId, clientId) {
 
 // function to fetch clinician locations
 function fetchClinicianLocations(clinicianId) {
-    return new Promise((resolve, reject) => {
-        fetch(`api/get_clinician_locations/${clinicianId}/`)
-            .then(response => {
-                if (!response.ok) {
-                    throw new Error('Network response was not ok');
-                }
-                return response.json();
-            })
-            .then(result => {
-                resolve(result); // Resolve with the result
-            })
-            .catch(error => {
-                reject(error); // Reject on fetch error
-            });
-    });
+    return getClinicianLocations(clinicianId);
 }
 
 // Helper function to clear error messages
@@ -737,7 +740,7 @@ async function reInitializeAppointment(dateData) {
     // Reset and reinitialize client search
     if (clientSearch) {
         clientSearch.reset();
-        await initializeClientSearch(clientSearch.items);
+        await initializeClientSearch(clientSearch.items, clientSearch.directoryNext);
     }
 
     // Reset and reinitialize location search
@@ -949,21 +952,80 @@ function getClientClinicians(clientId) {
         });
 }
 
-function getAppointmentStates() {
-    return new Promise((resolve, reject) => {
-        fetch('api/get_appointment_states/')
-            .then(response => response.json())
-            .then(states => {
-                resolve(states);
+// Reference data of the scheduler, fetched once per page; the browser revalidates it by ETag
+let bootstrapData = null;
+
+function getBootstrapData() {
+    if (!bootstrapData) {
+        bootstrapData = fetch('api/bootstrap/')
+            .then(response => {
+                if (!response.ok) {
+                    throw new Error('Network response was not ok');
+                }
+                return response.json();
             })
             .catch(error => {
-                console.error('Error fetching appointment states:', error);
-                reject(error);
+                console.error('Error fetching scheduler data:', error);
+                bootstrapData = null;
+                throw error;
+            });
+    }
+    return bootstrapData;
+}
+
+function getAppointmentStates() {
+    return getBootstrapData().then(data => data.appointment_states);
+}
+
+// Locations of a clinician, from the bootstrap data when it is the signed in clinician
+function getClinicianLocations(clinicianId) {
+    return getBootstrapData()
+        .catch(() => null)
+        .then(data => {
+            if (data && data.is_clinician && data.resources.some(resource => String(resource.id) === String(clinicianId))) {
+                return data.locations;
+            }
+            return fetch(`api/get_clinician_locations/${clinicianId}/`).then(response => {
+                if (!response.ok) {
+                    throw new Error('Network response was not ok');
+                }
+                return response.json();
             });
+        });
+}
+
+// Event details fetched ahead by prefetchEventData, by event id; each entry is used once
+const eventDataCache = new Map();
+
+function prefetchEventData(eventIds) {
+    const ids = eventIds.map(String).filter(id => !eventDataCache.has(id));
+    if (ids.length === 0) return;
+
+    const batch = fetch('api/get_events_data/', {
+        method: 'POST',
+        headers: {
+            'Content-Type': 'application/json',
+            'X-Requested-With': 'XMLHttpRequest',
+            'X-CSRFToken': getCsrfToken()
+        },
+        body: JSON.stringify({ event_ids: ids })
+    }).then(response => response.json());
+
+    ids.forEach(id => {
+        eventDataCache.set(id, batch.then(data => data[id] || { error: 'Event not found' }));
     });
 }
 
+function clearEventDataCache() {
+    eventDataCache.clear();
+}
+
 function getEventData(eventId) {
+    const cached = eventDataCache.get(String(eventId));
+    if (cached) {
+        eventDataCache.delete(String(eventId));
+        return cached;
+    }
     return new Promise((resolve, reject) => {
         fetch(`api/get_event_data/${eventId}/`, {
             headers: {
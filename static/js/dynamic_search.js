@@ -3,6 +3,14 @@ class DynamicSearch {
         this.containerId = options.containerId;
         this.items = options.items || [];
         this.onSelect = options.onSelect || function() {};
+        // Optional server paging: fetchPage(query, cursor) resolves to { items, next }. items then
+        // holds the directory pages loaded so far and directoryNext the cursor after them
+        this.fetchPage = options.fetchPage || null;
+        this.directoryNext = options.next || null;
+        this.query = '';
+        this.next = null;
+        this.loading = false;
+        this.requestId = 0;
         
         this.container = document.getElementById(this.containerId);
         this.init();
@@ -58,6 +66,13 @@ class DynamicSearch {
             }
         });
 
+        // Load the next page when the list is scrolled to its end
+        this.dropdown.addEventListener('scroll', () => {
+            if (this.dropdown.scrollTop + this.dropdown.clientHeight >= this.dropdown.scrollHeight - 40) {
+                this.loadMore();
+            }
+        });
+
         // Keyboard navigation
         this.searchInput.addEventListener('keydown', (e) => {
             this.handleKeyboard(e);
@@ -72,6 +87,17 @@ class DynamicSearch {
     }
 
     filterItems(searchTerm) {
+        if (this.fetchPage) {
+            const query = searchTerm.trim();
+            clearTimeout(this.searchTimer);
+            if (!query) {
+                this.showAllItems();
+            } else {
+                this.searchTimer = setTimeout(() => this.loadPage(query, null), 250);
+            }
+            return;
+        }
+
         const filtered = this.items.filter(item =>
             item.name.toLowerCase().includes(searchTerm.toLowerCase())
         );
@@ -81,13 +107,57 @@ class DynamicSearch {
     }
 
     showAllItems() {
+        this.requestId++;
+        this.query = '';
+        this.next = this.directoryNext;
+        this.loading = false;
         this.renderDropdown(this.items);
     }
 
+    async loadPage(query, cursor) {
+        const requestId = ++this.requestId;
+        this.loading = true;
+        try {
+            const page = await this.fetchPage(query, cursor);
+            if (requestId !== this.requestId) {
+                return; // Superseded by a newer query
+            }
+            if (!query) {
+                this.items = this.items.concat(page.items);
+                this.directoryNext = page.next;
+            }
+            this.query = query;
+            this.next = page.next;
+            if (cursor) {
+                this.appendItems(page.items);
+            } else {
+                this.renderDropdown(page.items);
+            }
+        } catch (error) {
+            console.error('Failed to load items:', error);
+        } finally {
+            if (requestId === this.requestId) {
+                this.loading = false;
+            }
+        }
+    }
+
+    loadMore() {
+        if (this.fetchPage && this.next && !this.loading) {
+            this.loadPage(this.query, this.next);
+        }
+    }
+
     renderDropdown(items) {
         this.dropdown.innerHTML = '';
-        
-        items.forEach((item, index) => {
+        this.appendItems(items);
+    }
+
+    appendItems(items) {
+        const offset = this.dropdown.children.length;
+
+        items.forEach((item, i) => {
+            const index = offset + i;
             const div = document.createElement('div');
             div.className = 'dropdown-item';
             
@@ -109,7 +179,7 @@ class DynamicSearch {
             this.dropdown.appendChild(div);
         });
 
-        this.dropdown.style.display = items.length ? 'block' : 'none';
+        this.dropdown.style.display = this.dropdown.children.length ? 'block' : 'none';
     }
 
     selectItem(item) {
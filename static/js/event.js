@@ -413,11 +413,7 @@ function initializeEventTeamMemberDropdown(teamMembers) {
 
 // function to fetch clinician locations
 function fetchClinicianLocations(clinicianId) {
-    return fetch(`api/get_clinician_locations/${clinicianId}/`)
-        .then(response => response.json())
-        .then(result => {
-            return result;
-        });
+    return getClinicianLocations(clinicianId);
 }
 
 function reInitializeEventComponents(dateData) {